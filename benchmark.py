@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Parser Benchmarks
+Runs every scraper backend's parse path against recorded fixtures (no network) and checks the results against stored baselines
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+FIXTURE_DIR = 'benchmarks/fixtures'
+BASELINE_FILE = 'benchmarks/baseline.json'
+SCALE = 20                 # fixture rows are repeated this many times so each run is measurable
+REPEAT = 7
+TIME_THRESHOLD = 0.25      # per-row latency this much above baseline is a regression
+MEMORY_THRESHOLD = 0.25
+
+GRID_BLOB = re.compile(r'(initDataGrid\([^"]*")(\[\[.*?\]\])(")', re.DOTALL)
+TABLE_ROW = re.compile(r'<tr>.*?</tr>\n?', re.DOTALL)
+
+
+def fixture(name: str) -> str:
+    with open(os.path.join(FIXTURE_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def scale_rows(body: str, scale: int) -> List:
+    return json.loads(body) * scale
+
+
+def scale_grid(page: str, scale: int) -> str:
+    """The page with its initDataGrid rows repeated"""
+    match = GRID_BLOB.search(page)
+    rows = json.loads(match.group(2)) * scale
+    return page[:match.start(2)] + json.dumps(rows) + page[match.end(2):]
+
+
+def scale_table(page: str, scale: int) -> str:
+    """The page with each table's body rows repeated (the header row kept once)"""
+    def repeat(table):
+        rows = TABLE_ROW.findall(table.group(0))
+        header, body = rows[0], ''.join(rows[1:])
+        return table.group(0).replace(header + body, header + body * scale, 1)
+    return re.sub(r'<table.*?</table>', repeat, page, flags=re.DOTALL)
+
+
+def scale_cells(page: str, scale: int) -> str:
+    """The page with its bout rows repeated, each copy's wrestlers renamed so the bouts stay distinct"""
+    rows = ''.join(TABLE_ROW.findall(page))
+    copies = [rows] + [re.sub(r' \((?=[^()\d]+\))', f" {copy} (", rows) for copy in range(1, scale)]
+    return page.replace(rows, ''.join(copies), 1)
+
+
+class Case:
+    """One backend's parse path: setup builds the input once, run parses it and returns the records"""
+
+    def __init__(self, name: str, setup: Callable[[int], object], run: Callable[[object], List]):
+        self.name = name
+        self.setup = setup
+        self.run = run
+
+
+def ajax_cases() -> List[Case]:
+    from scraper_ajax_method import parse_roster_entry, parse_schedule_entry
+
+    return [
+        Case('ajax.schedule_response',
+             lambda scale: json.dumps(scale_rows(fixture('schedule.json'), scale)),
+             lambda body: [parse_schedule_entry(row) for row in json.loads(body)]),
+        Case('ajax.roster_response',
+             lambda scale: json.dumps(scale_rows(fixture('roster.json'), scale)),
+             lambda body: [w for w in (parse_roster_entry(row) for row in json.loads(body)) if w]),
+        Case('ajax.parse_schedule_entry',
+             lambda scale: scale_rows(fixture('schedule.json'), scale),
+             lambda rows: [parse_schedule_entry(row) for row in rows]),
+        Case('ajax.parse_roster_entry',
+             lambda scale: scale_rows(fixture('roster.json'), scale),
+             lambda rows: [w for w in (parse_roster_entry(row) for row in rows) if w]),
+    ]
+
+
+def blob_cases() -> List[Case]:
+    from scraper_datablob import TrackWrestlingDataBlobScraper
+    from scraper_frame import TrackWrestlingFrameScraper
+    from scraper_selenium_final import extract_schedule_from_html
+
+    frame = TrackWrestlingFrameScraper('', '')
+    datablob = TrackWrestlingDataBlobScraper('', '')
+    return [
+        Case('frame.parse_schedule_blob',
+             lambda scale: frame.extract_data_blob(scale_grid(fixture('schedule_grid.html'), scale)),
+             frame.parse_schedule_blob),
+        Case('frame.extract_and_parse',
+             lambda scale: scale_grid(fixture('schedule_grid.html'), scale),
+             lambda page: frame.parse_schedule_blob(frame.extract_data_blob(page))),
+        Case('datablob.parse_schedule_blob',
+             lambda scale: datablob.extract_data_blob(scale_grid(fixture('schedule_grid.html'), scale)),
+             datablob.parse_schedule_blob),
+        Case('selenium_final.extract_schedule_from_html',
+             lambda scale: scale_grid(fixture('schedule_grid.html'), scale),
+             lambda page: extract_schedule_from_html(page, 'fixture')),
+    ]
+
+
+def html_cases() -> List[Case]:
+    from bs4 import BeautifulSoup
+
+    from scraper_beautifulsoup import TrackWrestlingScraper
+    from scraper_playwright import parse_roster_html, parse_schedule_html
+
+    class FixtureScraper(TrackWrestlingScraper):
+        """BeautifulSoup backend reading its pages from fixtures instead of the network"""
+        pages: Dict[str, str] = {}
+
+        def fetch_page(self, page_name: str) -> BeautifulSoup:
+            return BeautifulSoup(self.pages[page_name], 'html.parser')
+
+    def soup_scraper(page_name: str, page: str) -> FixtureScraper:
+        scraper = FixtureScraper('', '')
+        scraper.pages = {page_name: page}
+        return scraper
+
+    return [
+        Case('playwright.parse_schedule_html',
+             lambda scale: scale_table(fixture('schedule_table.html'), scale), parse_schedule_html),
+        Case('playwright.parse_roster_html',
+             lambda scale: scale_table(fixture('roster_table.html'), scale), parse_roster_html),
+        Case('beautifulsoup.scrape_schedule',
+             lambda scale: soup_scraper('TeamSchedule.jsp', scale_table(fixture('schedule_table.html'), scale)),
+             lambda scraper: scraper.scrape_schedule()),
+        Case('beautifulsoup.scrape_roster',
+             lambda scale: soup_scraper('TeamRoster.jsp', scale_table(fixture('roster_table.html'), scale)),
+             lambda scraper: scraper.scrape_roster()),
+    ]
+
+
+def results_cases() -> List[Case]:
+    from results_engine import parse_bouts
+
+    event = {'event_id': 'fixture', 'date': 'December 17, 2025', 'opponent': 'Cherry Hill West'}
+    return [
+        Case('results_engine.parse_bouts',
+             lambda scale: scale_cells(fixture('event_matches.html'), scale),
+             lambda page: parse_bouts(page, event)),
+    ]
+
+
+def all_cases() -> List[Case]:
+    return ajax_cases() + blob_cases() + html_cases() + results_cases()
+
+
+def measure(case: Case, scale: int = SCALE, repeat: int = REPEAT) -> Dict:
+    """Median timing over `repeat` runs, then one run under tracemalloc for the peak"""
+    data = case.setup(scale)
+    rows = len(case.run(data))  # warm-up, and the row count throughput is based on
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.run(data)
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+
+    # Timed separately: tracing slows allocation-heavy code
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    case.run(data)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {
+        'rows': rows,
+        'median_seconds': round(median, 6),
+        'rows_per_second': round(rows / median, 1) if median and rows else 0.0,
+        'per_row_us': round(median / rows * 1e6, 3) if rows else None,
+        'peak_bytes': peak,
+    }
+
+
+def machine() -> Dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def load_baseline(path: str = BASELINE_FILE) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(results: Dict[str, Dict], baseline: Dict, time_threshold: float = TIME_THRESHOLD,
+            memory_threshold: float = MEMORY_THRESHOLD) -> Dict[str, str]:
+    """'ok', 'new' or a description of the regression, per case"""
+    verdicts = {}
+    for name, result in results.items():
+        base = baseline.get('cases', {}).get(name)
+        if base is None or result['per_row_us'] is None or not base.get('per_row_us'):
+            verdicts[name] = 'new'
+            continue
+        problems = []
+        slowdown = result['per_row_us'] / base['per_row_us'] - 1
+        if slowdown > time_threshold:
+            problems.append(f"{slowdown * 100:+.0f}% per row")
+        if base.get('peak_bytes') and result['peak_bytes'] > base['peak_bytes'] * (1 + memory_threshold):
+            problems.append(f"{(result['peak_bytes'] / base['peak_bytes'] - 1) * 100:+.0f}% memory")
+        verdicts[name] = 'REGRESSED ' + ', '.join(problems) if problems else 'ok'
+    return verdicts
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Offline benchmarks for every scraper backend's parser")
+    parser.add_argument('--filter', help="Only cases whose name contains this")
+    parser.add_argument('--scale', type=int, default=SCALE, help="Times each fixture's rows are repeated")
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--threshold', type=float, default=TIME_THRESHOLD,
+                        help="Allowed per-row slowdown before failing (0.25 = 25%%)")
+    parser.add_argument('--memory-threshold', type=float, default=MEMORY_THRESHOLD)
+    parser.add_argument('--save-baseline', action='store_true', help=f"Write these results to {BASELINE_FILE}")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args()
+
+    # Parsers log every row; that's I/O, not parsing
+    logging.disable(logging.INFO)
+    cases = [c for c in all_cases() if not args.filter or args.filter in c.name]
+    results = {case.name: measure(case, args.scale, args.repeat) for case in cases}
+    logging.disable(logging.NOTSET)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(BASELINE_FILE), exist_ok=True)
+        baseline = load_baseline()
+        baseline['machine'] = machine()
+        baseline['scale'] = args.scale
+        baseline.setdefault('cases', {}).update(results)
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        logger.info(f"Saved {len(results)} baselines to {BASELINE_FILE}")
+        return
+
+    baseline = load_baseline()
+    if baseline.get('machine') and baseline['machine'] != machine():
+        logger.warning(f"Baseline was recorded on a different machine ({baseline['machine']['platform']}); "
+                       "compare with care or re-run with --save-baseline")
+    if baseline.get('scale') not in (None, args.scale):
+        logger.warning(f"Baseline used --scale {baseline['scale']}; per-row numbers may not be comparable")
+    verdicts = compare(results, baseline, args.threshold, args.memory_threshold)
+
+    if args.json:
+        print(json.dumps({name: {**result, 'verdict': verdicts[name]} for name, result in results.items()}, indent=2))
+    else:
+        print(f"{'case':<44} {'rows':>6} {'rows/s':>12} {'us/row':>9} {'peak KB':>9}  vs baseline")
+        for name, result in results.items():
+            per_row = f"{result['per_row_us']:.2f}" if result['per_row_us'] is not None else '-'
+            print(f"{name:<44} {result['rows']:>6} {result['rows_per_second']:>12,.0f} {per_row:>9} "
+                  f"{result['peak_bytes'] / 1024:>9.1f}  {verdicts[name]}")
+
+    regressions = [name for name, verdict in verdicts.items() if verdict.startswith('REGRESSED')]
+    if regressions:
+        logger.error(f"{len(regressions)} regressions: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
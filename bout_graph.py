@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Bout Graph
+Who-beat-whom graph at wrestler and team level for head-to-head, common-opponent and transitive comparisons
+"""
+
+import argparse
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from history_store import normalize_key
+from records import wrestler_key
+from results_engine import TEAM_POINTS
+from scouting import team_search_name
+from scraper_ajax_method import OUTPUT_FILE, load_data
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+MAX_DEPTH = 4              # longest "A beat B beat C ..." chain to search for
+
+
+def team_key(team: str) -> str:
+    return normalize_key(team_search_name(team or ''))
+
+
+class Level:
+    """Directed win counts plus the undirected opponent sets, for one kind of node"""
+
+    def __init__(self):
+        self.beat: Dict[str, Dict[str, int]] = {}      # winner -> loser -> wins
+        self.opponents: Dict[str, Set[str]] = {}
+
+    def meet(self, a: str, b: str) -> bool:
+        """Record that a and b met; returns True if they had never met before"""
+        new_pair = b not in self.opponents.get(a, ())
+        self.opponents.setdefault(a, set()).add(b)
+        self.opponents.setdefault(b, set()).add(a)
+        return new_pair
+
+    def add(self, winner: str, loser: str) -> bool:
+        """Record a win; returns True if the two had never met before"""
+        losers = self.beat.setdefault(winner, {})
+        losers[loser] = losers.get(loser, 0) + 1
+        return self.meet(winner, loser)
+
+    def remove(self, winner: str, loser: str):
+        """Take back one recorded win (the two still met)"""
+        losers = self.beat[winner]
+        losers[loser] -= 1
+        if not losers[loser]:
+            del losers[loser]
+
+    def head_to_head(self, a: str, b: str) -> Tuple[int, int]:
+        return self.beat.get(a, {}).get(b, 0), self.beat.get(b, {}).get(a, 0)
+
+    def chain(self, start: str, goal: str, max_depth: int = MAX_DEPTH) -> Optional[List[str]]:
+        """Shortest start-beat-x-beat-...-goal chain, breadth first and bounded by max_depth"""
+        if start == goal:
+            return [start]
+        parents = {start: None}
+        frontier = deque([(start, 0)])
+        while frontier:
+            node, depth = frontier.popleft()
+            if depth >= max_depth:
+                continue
+            for loser in self.beat.get(node, {}):
+                if loser in parents:
+                    continue
+                parents[loser] = node
+                if loser == goal:
+                    path = [goal]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                frontier.append((loser, depth + 1))
+        return None
+
+
+class BoutGraph:
+    """Bout graph built from results and extended bout by bout"""
+
+    def __init__(self, bouts: Iterable[Dict] = ()):
+        self.wrestlers = Level()
+        self.teams = Level()
+        self.names: Dict[str, Dict] = {}                # wrestler key -> {name, team}
+        self.by_name: Dict[str, List[str]] = {}         # name key -> wrestler keys
+        self.applied: Set[str] = set()
+        # Team level is one edge per dual meet: team points per event, and the edge each event holds
+        self.event_points: Dict[str, Dict[str, int]] = {}
+        self.dual_results: Dict[str, Tuple[str, str]] = {}
+        # Team-level common opponents, kept current as pairs first meet: (a, b) sorted -> set
+        self.common_teams: Dict[Tuple[str, str], Set[str]] = {}
+        self.add_bouts(bouts)
+
+    def _wrestler(self, name: str, team: str) -> str:
+        key = wrestler_key(name, team)
+        if key not in self.names:
+            self.names[key] = {'name': name, 'team': team}
+            self.by_name.setdefault(normalize_key(name), []).append(key)
+        return key
+
+    def _pair_met(self, x: str, y: str):
+        """x and y just met for the first time: each becomes a common opponent of the other's opponents"""
+        for a, b in ((x, y), (y, x)):
+            for other in self.teams.opponents.get(b, ()):
+                if other != a:
+                    self.common_teams.setdefault(tuple(sorted((a, other))), set()).add(b)
+
+    def _score_dual(self, event: str):
+        """Point the event's team edge from the dual winner to the loser, replacing the edge it had"""
+        previous = self.dual_results.pop(event, None)
+        if previous:
+            self.teams.remove(*previous)
+        points = self.event_points[event]
+        if len(points) != 2:
+            return                  # a tournament, not a dual: no team-level result
+        (a, a_points), (b, b_points) = points.items()
+        if self.teams.meet(a, b):
+            self._pair_met(a, b)
+        if a_points != b_points:
+            self.dual_results[event] = (a, b) if a_points > b_points else (b, a)
+            self.teams.add(*self.dual_results[event])
+
+    def add_bouts(self, bouts: Iterable[Dict]) -> int:
+        """Add bouts not seen before; returns how many were added"""
+        added = 0
+        touched: Set[str] = set()
+        for bout in bouts:
+            bout_id = bout.get('bout_id')
+            if bout.get('win_type') == 'NC' or (bout_id and bout_id in self.applied):
+                continue
+            if bout_id:
+                self.applied.add(bout_id)
+
+            winner = self._wrestler(bout.get('winner', ''), bout.get('winner_team', ''))
+            loser = self._wrestler(bout.get('loser', ''), bout.get('loser_team', ''))
+            self.wrestlers.add(winner, loser)
+
+            winner_team, loser_team = team_key(bout.get('winner_team')), team_key(bout.get('loser_team'))
+            if winner_team != loser_team:
+                event = bout.get('event_id') or bout.get('date', '')
+                points = self.event_points.setdefault(event, {})
+                points[winner_team] = points.get(winner_team, 0) + TEAM_POINTS.get(bout.get('win_type'), 0)
+                points.setdefault(loser_team, 0)
+                touched.add(event)
+            added += 1
+
+        for event in touched:
+            self._score_dual(event)
+        return added
+
+    def find_wrestler(self, query: str) -> Optional[str]:
+        """Wrestler key for "Name" or "Name|Team" (the one with the most opponents if ambiguous)"""
+        name, _, team = query.partition('|')
+        keys = self.by_name.get(normalize_key(name), [])
+        if team:
+            keys = [k for k in keys if team_key(team) in team_key(self.names[k]['team'])]
+        if not keys:
+            return None
+        return max(keys, key=lambda k: len(self.wrestlers.opponents.get(k, ())))
+
+    def common_opponents(self, level: str, a: str, b: str) -> Dict[str, Dict[str, Tuple[int, int]]]:
+        """Each common opponent with both sides' (wins, losses) against it"""
+        graph = self.teams if level == 'team' else self.wrestlers
+        if level == 'team':
+            shared = self.common_teams.get(tuple(sorted((a, b))), set())
+        else:
+            shared = self.wrestlers.opponents.get(a, set()) & self.wrestlers.opponents.get(b, set())
+        return {c: {'a': graph.head_to_head(a, c), 'b': graph.head_to_head(b, c)} for c in shared}
+
+    def compare(self, level: str, a: str, b: str, max_depth: int = MAX_DEPTH) -> Dict:
+        """Head to head, common opponents and the shortest transitive chain in each direction"""
+        graph = self.teams if level == 'team' else self.wrestlers
+        return {
+            'head_to_head': graph.head_to_head(a, b),
+            'common_opponents': self.common_opponents(level, a, b),
+            'a_over_b': graph.chain(a, b, max_depth),
+            'b_over_a': graph.chain(b, a, max_depth),
+        }
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Compare wrestlers or teams through the bout graph")
+    parser.add_argument('level', choices=['wrestler', 'team'])
+    parser.add_argument('a', help='Wrestler ("Name" or "Name|Team") or team')
+    parser.add_argument('b')
+    parser.add_argument('--input', nargs='+', default=[OUTPUT_FILE],
+                        help="Data files whose results to combine (e.g. every team in the league)")
+    parser.add_argument('--max-depth', type=int, default=MAX_DEPTH)
+    args = parser.parse_args()
+
+    graph = BoutGraph()
+    for path in args.input:
+        graph.add_bouts((load_data(path) or {}).get('results', []))
+    logger.info(f"Graph: {len(graph.names)} wrestlers, {len(graph.teams.opponents)} teams, {len(graph.applied)} bouts")
+
+    if args.level == 'team':
+        a, b = team_key(args.a), team_key(args.b)
+        label = {k: k for k in graph.teams.opponents}
+    else:
+        a, b = graph.find_wrestler(args.a), graph.find_wrestler(args.b)
+        if a is None or b is None:
+            logger.error(f"Not found: {args.a if a is None else args.b}")
+            return
+        label = {k: f"{v['name']} ({v['team']})" for k, v in graph.names.items()}
+
+    result = graph.compare(args.level, a, b, args.max_depth)
+    wins, losses = result['head_to_head']
+    print(f"{label.get(a, a)} vs {label.get(b, b)}: head to head {wins}-{losses}")
+
+    print(f"Common opponents ({len(result['common_opponents'])}):")
+    for opponent, sides in sorted(result['common_opponents'].items()):
+        print(f"  {label.get(opponent, opponent):<40} {sides['a'][0]}-{sides['a'][1]}  vs  {sides['b'][0]}-{sides['b'][1]}")
+
+    for key, first, second in (('a_over_b', a, b), ('b_over_a', b, a)):
+        chain = result[key]
+        if chain:
+            print(f"{label.get(first, first)} over {label.get(second, second)}: "
+                  + ' > '.join(label.get(node, node) for node in chain))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Tournament Brackets
+Fetches every weight class bracket for the tournaments on the schedule and parses them into bout records
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from results_engine import SETTLE_DAYS, WEIGHT_LABEL, parse_bouts
+from instrumentation import record_retry
+from scraper_ajax_method import (
+    EST, INITIAL_PAUSE, MAX_RETRIES, OUTPUT_FILE, archive_response, load_data, parse_event_date, save_data,
+    timed_get, weight_sort_key
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+BRACKET_CACHE_DIR = 'data/brackets'
+MAX_WORKERS = 8
+# Bracket viewer pages. You'll need to adjust these if TrackWrestling moves them.
+WEIGHTS_URL = ("https://www.trackwrestling.com/tw/predefinedtournaments/BracketViewer.jsp"
+               "?tournamentId={tournament_id}")
+BRACKET_URL = ("https://www.trackwrestling.com/tw/predefinedtournaments/BracketViewer.jsp"
+               "?tournamentId={tournament_id}&weightClassId={weight_id}")
+
+WEIGHT_OPTION = re.compile(rf'<option[^>]*value="?(\d+)"?[^>]*>\s*({WEIGHT_LABEL})', re.I)
+# enrichment's event_type: individual-bracket tournaments, as opposed to dual-format events
+# (dual meets, tri/quad meets, team duals) that have no brackets even when called a tournament
+TOURNAMENT_TYPE = re.compile(r'tournament|bracket', re.I)
+DUAL_TYPE = re.compile(r'\b(duals?|tri|quad|team)\b', re.I)
+# "Champ. Round 1 - John Doe (Shawnee) won by fall over Jim Roe (Moorestown) (Fall 1:23)"
+WON_BY = re.compile(r'\s+won\s+(?:(?:by|in)\s+[^()]+?\s+)?over\s+', re.I)
+ROUND_PREFIX = re.compile(r'^[^()]*?\s-\s(?=[^()]+\()')
+
+
+def is_tournament(match: Dict) -> Optional[bool]:
+    """Whether an event has brackets, from its event type; None when enrichment hasn't typed it yet
+
+    Names don't tell ("2025 TCNJ Pride" is a tournament, "LRHSD Quad" is not), so untyped events
+    are probed through the bracket viewer instead (see BracketIngestor).
+    """
+    if not match.get('event_id'):
+        return False
+    event_type = match.get('event_type', '')
+    if not event_type:
+        return None
+    return bool(TOURNAMENT_TYPE.search(event_type)) and not DUAL_TYPE.search(event_type)
+
+
+def fetch_page(url: str, kind: str, **meta) -> Optional[str]:
+    """GET a page with the usual retry/backoff (archiving it as `kind`); None if every attempt failed"""
+    retries = 0
+    pause = INITIAL_PAUSE
+
+    while retries < MAX_RETRIES:
+        try:
+            response = timed_get(kind, url)
+            if response.status_code == 200:
+                archive_response(kind, url, response.text, **meta)
+                return response.text
+            raise Exception(f"Status code {response.status_code}")
+        except Exception as e:
+            retries += 1
+            if retries < MAX_RETRIES:
+                record_retry(kind)
+                logger.warning(f"Error fetching {url}: {e}. Retrying in {pause} seconds...")
+                time.sleep(pause)
+                pause *= 2
+            else:
+                logger.error(f"Failed to fetch {url} after {MAX_RETRIES} attempts: {e}")
+    return None
+
+
+def parse_weights(page: str) -> List[Tuple[str, str]]:
+    """(weight_id, weight_class) pairs from the bracket viewer's weight picker"""
+    seen = {}
+    for weight_id, weight in WEIGHT_OPTION.findall(page):
+        seen.setdefault(weight_id, weight.upper())
+    return list(seen.items())
+
+
+def parse_bracket(page: str, weight: str, event: Dict) -> List[Dict]:
+    """Bouts on one weight's bracket page, in the same record format as dual meet results"""
+    text = re.sub(r'<br\s*/?>|</(tr|li|p|div|td)>', '\n', page, flags=re.I)
+    text = re.sub(r'<[^>]+>', ' ', text)
+
+    # Rewrite bracket lines into the "weight - winner (team) over loser (team) (decision)" form
+    lines = []
+    for line in text.splitlines():
+        line = re.sub(r'\s+', ' ', line).strip()
+        if ' over ' not in line and ' won ' not in line:
+            continue
+        line = ROUND_PREFIX.sub('', WON_BY.sub(' over ', line))
+        lines.append(f"{weight} - {line}")
+    bouts = parse_bouts('\n'.join(lines), event)
+    for bout in bouts:
+        bout['source'] = 'bracket'
+    return bouts
+
+
+class BracketCache:
+    """One JSON file per tournament; complete tournaments are never fetched again"""
+
+    def __init__(self, directory: str = BRACKET_CACHE_DIR):
+        self.directory = directory
+
+    def path(self, tournament_id: str) -> str:
+        return os.path.join(self.directory, f"{tournament_id}.json")
+
+    def get(self, tournament_id: str) -> Optional[Dict]:
+        path = self.path(tournament_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read cached bracket {tournament_id}: {e}")
+            return None
+
+    def put(self, tournament_id: str, entry: Dict):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.path(tournament_id)}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, self.path(tournament_id))
+
+
+class BracketIngestor:
+    """Fetches all weights of all tournaments at once over a shared thread pool"""
+
+    def __init__(self, cache: Optional[BracketCache] = None, max_workers: int = MAX_WORKERS):
+        self.cache = cache or BracketCache()
+        self.max_workers = max_workers
+        self.fetched: List[str] = []
+
+    def needs_fetch(self, match: Dict, today: date) -> bool:
+        event_date = parse_event_date(match.get('date', ''))
+        if event_date is None or event_date > today:
+            return False
+        cached = self.cache.get(match['event_id'])
+        return cached is None or not cached.get('complete')
+
+    def candidates(self, schedule: List[Dict]) -> List[Dict]:
+        """Typed tournaments, plus untyped events not already found to have no brackets"""
+        found = []
+        for match in schedule:
+            tournament = is_tournament(match)
+            if tournament is None:
+                cached = self.cache.get(match['event_id'])
+                tournament = cached is None or cached.get('has_brackets', True)
+            if tournament:
+                found.append(match)
+        return found
+
+    def ingest(self, schedule: List[Dict], today: Optional[date] = None) -> Dict[str, List[Dict]]:
+        """{event_id: bouts} for every past tournament on the schedule (fetching only incomplete ones)"""
+        today = today or datetime.now(EST).date()
+        tournaments = self.candidates(schedule)
+        to_fetch = [m for m in tournaments if self.needs_fetch(m, today)]
+
+        logger.info("="*60)
+        logger.info(f"Brackets: {len(to_fetch)} of {len(tournaments)} tournaments need fetching "
+                    f"({sum(is_tournament(m) is None for m in to_fetch)} untyped, probed for brackets)")
+        logger.info("="*60)
+
+        if to_fetch:
+            self.fetch(to_fetch, today)
+        self.fetched = [m['event_id'] for m in to_fetch]
+
+        bouts = {}
+        for match in tournaments:
+            cached = self.cache.get(match['event_id'])
+            if cached:
+                bouts[match['event_id']] = [b for weight in cached['weights'].values() for b in weight]
+        return bouts
+
+    def fetch(self, tournaments: List[Dict], today: date):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pages = list(pool.map(lambda m: fetch_page(WEIGHTS_URL.format(tournament_id=m['event_id']),
+                                                       'bracket_weights', event_id=m['event_id']),
+                                  tournaments))
+
+            jobs = []
+            for match, page in zip(tournaments, pages):
+                weights = parse_weights(page) if page else []
+                if not weights and is_tournament(match):
+                    logger.warning(f"No weight classes found for {match.get('opponent', match['event_id'])}")
+                jobs.extend((match, weight_id, weight) for weight_id, weight in weights)
+
+            # Every weight of every tournament goes through the same pool
+            bracket_pages = list(pool.map(
+                lambda job: fetch_page(BRACKET_URL.format(tournament_id=job[0]['event_id'], weight_id=job[1]),
+                                       'bracket', event=job[0], weight=job[2]),
+                jobs))
+
+        by_event: Dict[str, Dict[str, Optional[List[Dict]]]] = {m['event_id']: {} for m in tournaments}
+        for (match, _, weight), page in zip(jobs, bracket_pages):
+            by_event[match['event_id']][weight] = parse_bracket(page, weight, match) if page is not None else None
+
+        for match, page in zip(tournaments, pages):
+            weights = by_event[match['event_id']]
+            event_date = parse_event_date(match.get('date', ''))
+            settled = event_date is not None and today > event_date + timedelta(days=SETTLE_DAYS)
+            fetched_all = bool(weights) and all(bouts is not None for bouts in weights.values())
+            previous = self.cache.get(match['event_id']) or {'weights': {}}
+            # An untyped event whose bracket viewer loads but lists no weights is a dual-format event;
+            # once it's settled it is never probed again
+            no_brackets = page is not None and not weights and not previous['weights'] and not is_tournament(match)
+            if no_brackets:
+                self.cache.put(match['event_id'], {
+                    'event_id': match['event_id'],
+                    'name': match.get('opponent', ''),
+                    'date': match.get('date', ''),
+                    'fetched_at': datetime.now(EST).isoformat(),
+                    'complete': settled,
+                    'has_brackets': False,
+                    'weights': {},
+                })
+                continue
+
+            merged = dict(previous['weights'])
+            merged.update({w: b for w, b in weights.items() if b is not None})
+            self.cache.put(match['event_id'], {
+                'event_id': match['event_id'],
+                'name': match.get('opponent', ''),
+                'date': match.get('date', ''),
+                'fetched_at': datetime.now(EST).isoformat(),
+                'complete': settled and fetched_all,
+                'weights': merged,
+            })
+            logger.info(f"  ✓ {match.get('opponent', '')}: {sum(len(b) for b in merged.values())} bouts "
+                        f"across {len(merged)} weights{' (complete)' if settled and fetched_all else ''}")
+
+
+def merge_results(results: List[Dict], bracket_bouts: Dict[str, List[Dict]]) -> List[Dict]:
+    """Swap in each tournament's current bracket bouts, skipping bouts the results engine already has"""
+    merged = [r for r in results if not (r.get('source') == 'bracket' and r.get('event_id') in bracket_bouts)]
+    seen = {r.get('bout_id') for r in merged}
+    for bouts in bracket_bouts.values():
+        for bout in bouts:
+            if bout['bout_id'] not in seen:
+                seen.add(bout['bout_id'])
+                merged.append(bout)
+
+    merged.sort(key=lambda r: (parse_event_date(r.get('date', '')) or date.max,
+                               r.get('event_id', ''), weight_sort_key(r.get('weight_class'))))
+    return merged
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Ingest tournament brackets from the schedule")
+    parser.add_argument('--parse', nargs=2, metavar=('FILE', 'WEIGHT'), help="Parse a saved bracket page")
+    args = parser.parse_args()
+
+    if args.parse:
+        with open(args.parse[0], 'r', encoding='utf-8') as f:
+            print(json.dumps(parse_bracket(f.read(), args.parse[1], {'event_id': 'local'}), indent=2))
+        return
+
+    data = load_data(OUTPUT_FILE) or {}
+    bracket_bouts = BracketIngestor().ingest(data.get('schedule', []))
+    results = merge_results(data.get('results', []), bracket_bouts)
+    if results != data.get('results', []):
+        data['results'] = results
+        save_data(data, OUTPUT_FILE)
+    logger.info(f"Tournament bouts: {sum(len(b) for b in bracket_bouts.values())}, total bouts: {len(results)}")
+
+
+if __name__ == "__main__":
+    main()
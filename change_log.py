@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Change Log
+Appends a structured diff of roster/schedule/results to a JSONL log after every scrape,
+with a full snapshot every N entries so any point in time can be rebuilt quickly
+"""
+
+import argparse
+import json
+import logging
+import os
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from scraper_ajax_method import CHANGE_LOG, EST, OUTPUT_FILE
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_EVERY = 50
+SECTIONS = ('roster', 'schedule', 'results')
+
+# Fields that identify a record when it has no ID; everything else is tracked as a change
+SECTION_KEYS = {
+    'roster': ('name',),
+    'schedule': ('date', 'opponent', 'location'),
+    'results': ('date', 'opponent', 'weight_class', 'wrestler'),
+}
+ID_FIELDS = {'schedule': 'event_id', 'results': 'bout_id'}
+
+
+def record_key(section: str, record: Dict) -> Tuple:
+    """Identity of a record within its section"""
+    id_field = ID_FIELDS.get(section)
+    if id_field and record.get(id_field):
+        return (record[id_field],)
+    return tuple(record.get(field, '') for field in SECTION_KEYS[section])
+
+
+def keyed(section: str, records: Iterable[Dict]) -> Iterable[Tuple[Tuple, Dict]]:
+    """(key, record) pairs; a repeated key gets its occurrence number appended so no record is lost"""
+    seen: Counter = Counter()
+    for record in records:
+        key = record_key(section, record)
+        seen[key] += 1
+        yield (key + (seen[key],) if seen[key] > 1 else key), record
+
+
+def diff_section(section: str, old: List[Dict], new: List[Dict]) -> Dict:
+    """Added/removed/changed records between two versions of one section, plus the new order if kept records moved"""
+    old_by_key = dict(keyed(section, old))
+    new_keys = {}
+    added, changed = [], []
+
+    for position, (key, record) in enumerate(keyed(section, new)):
+        new_keys[key] = None
+        previous = old_by_key.get(key)
+        if previous is None:
+            added.append({'at': position, 'record': record})
+        elif previous != record:
+            fields = {
+                field: [previous.get(field), record.get(field)]
+                for field in sorted(set(previous) | set(record))
+                if previous.get(field) != record.get(field)
+            }
+            changed.append({'key': list(key), 'fields': fields})
+
+    removed = [list(key) for key in old_by_key if key not in new_keys]
+
+    diff = {}
+    if added:
+        diff['added'] = added
+    if removed:
+        diff['removed'] = removed
+    if changed:
+        diff['changed'] = changed
+    # Insert positions can't express a reordering, so a reorder carries the full key order
+    if [k for k in old_by_key if k in new_keys] != [k for k in new_keys if k in old_by_key]:
+        diff['order'] = [list(key) for key in new_keys]
+    return diff
+
+
+def diff_data(old: Optional[Dict], new: Dict) -> Dict:
+    """Structured diff of {roster, schedule, results}; empty when nothing changed"""
+    old = old or {}
+    diff = {}
+    for section in SECTIONS:
+        section_diff = diff_section(section, old.get(section, []), new.get(section, []))
+        if section_diff:
+            diff[section] = section_diff
+    return diff
+
+
+def apply_diff(data: Dict, diff: Dict) -> Dict:
+    """Replay one diff on top of a data dict and return the new version"""
+    result = dict(data)
+    for section in SECTIONS:
+        section_diff = diff.get(section)
+        if not section_diff:
+            continue
+
+        removed = {tuple(key) for key in section_diff.get('removed', [])}
+        changed = {tuple(c['key']): c['fields'] for c in section_diff.get('changed', [])}
+
+        records = {}
+        for key, record in keyed(section, data.get(section, [])):
+            if key in removed:
+                continue
+            if key in changed:
+                record = dict(record)
+                for field, (_, value) in changed[key].items():
+                    if value is None:
+                        record.pop(field, None)
+                    else:
+                        record[field] = value
+            records[key] = record
+
+        order = section_diff.get('order')
+        if order is not None:
+            for item in section_diff.get('added', []):
+                records[tuple(order[item['at']])] = item['record']
+            result[section] = [records[tuple(key)] for key in order]
+            continue
+
+        kept = list(records.values())
+        for item in section_diff.get('added', []):
+            kept.insert(item['at'], item['record'])
+        result[section] = kept
+    return result
+
+
+def parse_ts(value: str) -> datetime:
+    """Parse a metadata timestamp, treating naive values as Eastern time"""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=EST)
+
+
+class ChangeLog:
+    """Append-only JSONL change log with periodic snapshot entries"""
+
+    def __init__(self, path: str = CHANGE_LOG, snapshot_every: int = SNAPSHOT_EVERY):
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + '.idx.json'
+        self.snapshot_every = snapshot_every
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict:
+        if os.path.exists(self.index_path) and os.path.exists(self.path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'last_seq': 0, 'since_snapshot': 0, 'snapshots': []}
+
+    def _save_index(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, separators=(',', ':'))
+        os.replace(tmp_path, self.index_path)
+
+    def record(self, previous: Optional[Dict], current: Dict) -> Optional[Dict]:
+        """Append the diff between two scrapes; returns the entry or None if nothing changed"""
+        first_entry = not self.index['snapshots']
+        diff = diff_data(previous, current)
+        if not diff and not first_entry:
+            logger.info("No changes since last scrape")
+            return None
+
+        entry = {
+            'seq': self.index['last_seq'] + 1,
+            'ts': current.get('metadata', {}).get('last_updated', datetime.now().isoformat()),
+            'type': 'delta',
+            'diff': diff,
+        }
+
+        # Every N entries carry the full state so replay never walks far
+        if first_entry or self.index['since_snapshot'] + 1 >= self.snapshot_every:
+            entry['type'] = 'snapshot'
+            entry['data'] = current
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
+            f.write(json.dumps(entry, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n')
+
+        self.index['last_seq'] = entry['seq']
+        if entry['type'] == 'snapshot':
+            self.index['snapshots'].append([entry['seq'], entry['ts'], offset])
+            self.index['since_snapshot'] = 0
+        else:
+            self.index['since_snapshot'] += 1
+        self._save_index()
+
+        summary = ', '.join(
+            f"{section}: " + '/'.join('reordered' if k == 'order' else f"{len(v)} {k}" for k, v in changes.items())
+            for section, changes in diff.items()
+        )
+        logger.info(f"Change log entry {entry['seq']} ({entry['type']}): {summary or 'initial snapshot'}")
+        return entry
+
+    def _entries_from(self, offset: int):
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def state_at(self, ts: Optional[str] = None) -> Optional[Dict]:
+        """Rebuild the data as of a timestamp from the nearest snapshot plus its deltas"""
+        snapshots = self.index['snapshots']
+        if not snapshots:
+            return None
+
+        target = parse_ts(ts) if ts else None
+        candidates = [s for s in snapshots if target is None or parse_ts(s[1]) <= target]
+        if not candidates:
+            return None
+        _, _, offset = candidates[-1]
+
+        state = None
+        for entry in self._entries_from(offset):
+            if target is not None and parse_ts(entry['ts']) > target:
+                break
+            if entry['type'] == 'snapshot':
+                state = entry['data']
+            else:
+                state = apply_diff(state, entry['diff'])
+                state['metadata'] = dict(state.get('metadata', {}), last_updated=entry['ts'])
+        return state
+
+    def history(self, section: Optional[str] = None) -> List[Dict]:
+        """Every recorded change, optionally limited to one section"""
+        if not os.path.exists(self.path):
+            return []
+
+        changes = []
+        for entry in self._entries_from(0):
+            for name, section_diff in entry['diff'].items():
+                if section is None or name == section:
+                    changes.append({'seq': entry['seq'], 'ts': entry['ts'], 'section': name, **section_diff})
+        return changes
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Inspect the Shawnee wrestling change log")
+    parser.add_argument('--log', default=CHANGE_LOG, help="Change log path")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record = commands.add_parser('record', help="Diff two data files and append the result")
+    record.add_argument('previous')
+    record.add_argument('current', nargs='?', default=OUTPUT_FILE)
+    history = commands.add_parser('history', help="List recorded changes")
+    history.add_argument('--section', choices=SECTIONS)
+    state = commands.add_parser('state-at', help="Rebuild the data as of a timestamp")
+    state.add_argument('ts', nargs='?')
+
+    args = parser.parse_args()
+    log = ChangeLog(args.log)
+
+    if args.command == 'record':
+        with open(args.previous, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        with open(args.current, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+        log.record(previous, current)
+    elif args.command == 'history':
+        for change in log.history(args.section):
+            print(f"#{change['seq']} {change['ts']} [{change['section']}]")
+            for item in change.get('added', []):
+                print(f"  + {item['record']}")
+            for key in change.get('removed', []):
+                print(f"  - {' / '.join(key)}")
+            for item in change.get('changed', []):
+                fields = ', '.join(f"{k}: {old!r} -> {new!r}" for k, (old, new) in item['fields'].items())
+                print(f"  ~ {' / '.join(item['key'])}: {fields}")
+            if 'order' in change:
+                print("  ~ reordered")
+    elif args.command == 'state-at':
+        print(json.dumps(log.state_at(args.ts), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
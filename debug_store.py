@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Debug Artifacts
+Opt-in store for fetched pages: gzip-compressed on a background thread, tagged with a run ID and rotated by size and count
+"""
+
+import argparse
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from instrumentation import RUN_ID
+from scraper_ajax_method import EST
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+DEBUG_ENABLED = os.environ.get('DEBUG_ARTIFACTS', '0') == '1'
+DEBUG_DIR = os.environ.get('DEBUG_ARTIFACTS_DIR', 'debug')
+MAX_BYTES = 50 * 1024 * 1024   # compressed artifacts kept across all runs
+MAX_FILES = 500
+MAX_PENDING = 64               # queued artifacts; beyond this new ones are dropped, never waited on
+FLUSH_TIMEOUT = 10             # seconds to finish pending writes at exit
+
+
+def safe_name(name: str) -> str:
+    return re.sub(r'[^\w.-]+', '_', name).strip('_')[:80] or 'artifact'
+
+
+class DebugStore:
+    """Hands artifacts to one writer thread; save() only enqueues"""
+
+    def __init__(self, directory: str = DEBUG_DIR, run_id: str = RUN_ID, enabled: bool = DEBUG_ENABLED,
+                 max_bytes: int = MAX_BYTES, max_files: int = MAX_FILES):
+        self.directory = directory
+        self.run_id = run_id
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.queue: queue.Queue = queue.Queue(maxsize=MAX_PENDING)
+        self.dropped = 0
+        self.sequence = 0
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        self.files: List[Tuple[str, int]] = []     # (path, size), oldest first
+        self.total = 0
+
+    def save(self, name: str, content: str, **meta) -> Optional[str]:
+        """Queue an artifact for writing; returns the file name it will get, or None if not kept"""
+        if not self.enabled:
+            return None
+        with self.lock:
+            if self.thread is None:
+                self.start()
+            self.sequence += 1
+            filename = f"{self.sequence:04d}-{safe_name(name)}.gz"
+        try:
+            self.queue.put_nowait((filename, content, meta))
+        except queue.Full:
+            self.dropped += 1
+            return None
+        return filename
+
+    def start(self):
+        logger.info(f"Debug artifacts for run {self.run_id} go to {os.path.join(self.directory, self.run_id)}")
+        self.files = self.existing_files()
+        self.total = sum(size for _, size in self.files)
+        self.thread = threading.Thread(target=self.writer, name='debug-store', daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def existing_files(self) -> List[Tuple[str, int]]:
+        """Artifacts left by earlier runs, oldest first, so rotation covers them too"""
+        found = []
+        if os.path.isdir(self.directory):
+            for run in os.listdir(self.directory):
+                run_dir = os.path.join(self.directory, run)
+                if not os.path.isdir(run_dir):
+                    continue
+                for name in os.listdir(run_dir):
+                    if name.endswith('.gz'):
+                        path = os.path.join(run_dir, name)
+                        found.append((os.path.getmtime(path), path, os.path.getsize(path)))
+        return [(path, size) for _, path, size in sorted(found)]
+
+    def writer(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            try:
+                self.write(*item)
+            except Exception as e:
+                logger.warning(f"Could not write debug artifact {item[0]}: {e}")
+
+    def write(self, filename: str, content: str, meta: Dict):
+        run_dir = os.path.join(self.directory, self.run_id)
+        os.makedirs(run_dir, exist_ok=True)
+        path = os.path.join(run_dir, filename)
+        with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(content)
+        size = os.path.getsize(path)
+
+        with open(os.path.join(run_dir, 'manifest.jsonl'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                'run_id': self.run_id,
+                'file': filename,
+                'saved_at': datetime.now(EST).isoformat(),
+                'size': size,
+                **meta,
+            }, separators=(',', ':')) + '\n')
+
+        self.files.append((path, size))
+        self.total += size
+        self.rotate()
+
+    def rotate(self):
+        """Drop the oldest artifacts (and emptied run directories) until under both limits"""
+        while self.files and (self.total > self.max_bytes or len(self.files) > self.max_files):
+            path, size = self.files.pop(0)
+            self.total -= size
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            run_dir = os.path.dirname(path)
+            if not any(name.endswith('.gz') for name in os.listdir(run_dir)):
+                shutil.rmtree(run_dir, ignore_errors=True)
+
+    def close(self):
+        """Finish queued writes (bounded by FLUSH_TIMEOUT)"""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        self.queue.put(None)
+        self.thread.join(FLUSH_TIMEOUT)
+        if self.dropped:
+            logger.warning(f"Dropped {self.dropped} debug artifacts while the writer was behind")
+
+
+_store = DebugStore()
+
+
+def save_artifact(name: str, content: str, **meta) -> Optional[str]:
+    """Keep a fetched page for debugging when DEBUG_ARTIFACTS=1; free otherwise"""
+    return _store.save(name, content, **meta)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Inspect saved debug artifacts")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('runs', help="List runs with artifacts")
+
+    show_parser = subparsers.add_parser('show', help="List (or print) one run's artifacts")
+    show_parser.add_argument('run_id')
+    show_parser.add_argument('file', nargs='?', help="Print this artifact")
+
+    args = parser.parse_args()
+
+    if args.command == 'runs':
+        if not os.path.isdir(DEBUG_DIR):
+            logger.info(f"No artifacts in {DEBUG_DIR}; run a scraper with DEBUG_ARTIFACTS=1")
+            return
+        for run in sorted(os.listdir(DEBUG_DIR)):
+            run_dir = os.path.join(DEBUG_DIR, run)
+            artifacts = [n for n in os.listdir(run_dir) if n.endswith('.gz')] if os.path.isdir(run_dir) else []
+            print(f"  {run:<28} {len(artifacts):>4} artifacts")
+        return
+
+    run_dir = os.path.join(DEBUG_DIR, args.run_id)
+    if args.file:
+        with gzip.open(os.path.join(run_dir, args.file), 'rt', encoding='utf-8') as f:
+            print(f.read())
+        return
+    with open(os.path.join(run_dir, 'manifest.jsonl'), 'r', encoding='utf-8') as f:
+        for line in f:
+            entry = json.loads(line)
+            print(f"  {entry['file']:<40} {entry['size']:>8}  {entry.get('url', '')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Event Details
+Adds venue address, event type, team scores and weigh-in time to schedule entries from each event's page
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from results_engine import SETTLE_DAYS
+from scraper_ajax_method import EST, OUTPUT_FILE, archive_response, load_data, parse_event_date, save_data, timed_get
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+EVENT_DETAILS = 'data/event_details.json'
+MAX_WORKERS = 8
+TIME_BUDGET = 60           # seconds enrichment may add to a run
+REQUEST_TIMEOUT = 10       # one attempt per event; a miss is retried next run
+PAST_TTL = timedelta(days=30)
+FUTURE_TTL = timedelta(hours=12)
+# Event detail page. You'll need to adjust this if TrackWrestling moves it.
+EVENT_DETAIL_URL = "https://www.trackwrestling.com/tw/seasons/EventDetails.jsp?eventId={event_id}"
+
+DETAIL_LABELS = {
+    'venue': re.compile(r'venue|site|location|facility', re.I),
+    'address': re.compile(r'(?:venue\s+|street\s+)?address', re.I),
+    'event_type': re.compile(r'(?:event\s+)?type|format', re.I),
+    'weigh_in': re.compile(r'weigh[\s-]*ins?(?:\s+time)?', re.I),
+}
+LABEL_LINE = re.compile(r'^([A-Za-z][A-Za-z\s-]{1,24}?)\s*:\s*(.+)$')
+CITY_LINE = re.compile(r'^[A-Za-z .\'-]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?$')
+TEAM_SCORES_HEADER = re.compile(r'^team\s+(?:scores?|standings|results)\s*:?$', re.I)
+TEAM_SCORE = re.compile(r'^(?:\d+\.\s*)?([A-Za-z][\w .\'&-]*?)\s*[:-]?\s+(\d{1,3}(?:\.\d+)?)$')
+# "Shawnee 42 - Moorestown 27" on a dual meet page
+DUAL_SCORE = re.compile(r'^([A-Za-z][\w .\'&-]*?)\s+(\d{1,3})\s*-\s*([A-Za-z][\w .\'&-]*?)\s+(\d{1,3})$')
+
+
+def page_lines(page: str) -> List[str]:
+    """Visible text one line per cell row, with "label</td><td>value" joined as "label: value" """
+    text = re.sub(r'</t[dh]>\s*<t[dh][^>]*>', ': ', page, flags=re.I)
+    text = re.sub(r'<br\s*/?>|</(tr|li|p|div|h\d)>', '\n', text, flags=re.I)
+    text = re.sub(r'<[^>]+>', ' ', text)
+    text = text.replace('&nbsp;', ' ').replace('&amp;', '&')
+    return [re.sub(r'\s+', ' ', line).strip() for line in text.splitlines()]
+
+
+def parse_event_details(page: str) -> Dict:
+    """Venue, address, event type, weigh-in and team scores found on an event page"""
+    details: Dict = {}
+    team_scores: List[Dict] = []
+    in_scores = False
+    lines = page_lines(page)
+
+    for i, line in enumerate(lines):
+        if not line:
+            continue
+        if TEAM_SCORES_HEADER.match(line):
+            in_scores = True
+            continue
+
+        if in_scores:
+            score = TEAM_SCORE.match(line.replace(':', ' '))
+            if score:
+                team_scores.append({'team': score.group(1).strip(), 'score': score.group(2)})
+                continue
+            in_scores = False
+
+        dual = DUAL_SCORE.match(line)
+        if dual and not team_scores:
+            team_scores = [{'team': dual.group(1).strip(), 'score': dual.group(2)},
+                           {'team': dual.group(3).strip(), 'score': dual.group(4)}]
+            continue
+
+        labelled = LABEL_LINE.match(line)
+        if not labelled:
+            continue
+        label, value = labelled.group(1).strip(), labelled.group(2).strip()
+        for field, pattern in DETAIL_LABELS.items():
+            if field not in details and pattern.fullmatch(label):
+                # Addresses often put "City, ST 12345" on the next (non-blank) line
+                following = next((rest for rest in lines[i + 1:] if rest), '')
+                if field == 'address' and CITY_LINE.match(following):
+                    value = f"{value}, {following}"
+                details[field] = value
+                break
+
+    if team_scores:
+        details['team_scores'] = team_scores
+    return details
+
+
+def fetch_event_details(event_id: str, deadline: Optional[float] = None) -> Optional[Dict]:
+    """One attempt at an event page (the time budget leaves no room for backoff); None on failure
+
+    With a deadline (a time.monotonic() value) the request timeout is cut to the time left,
+    and nothing is fetched once it has passed.
+    """
+    timeout = REQUEST_TIMEOUT
+    if deadline is not None:
+        timeout = min(REQUEST_TIMEOUT, deadline - time.monotonic())
+        if timeout <= 0:
+            return None
+    try:
+        url = EVENT_DETAIL_URL.format(event_id=event_id)
+        response = timed_get('event_details', url, timeout=timeout)
+        if response.status_code != 200:
+            raise Exception(f"Status code {response.status_code}")
+        archive_response('event_details', url, response.text, event_id=event_id)
+        return parse_event_details(response.text)
+    except Exception as e:
+        logger.warning(f"Could not fetch details for event {event_id}: {e}")
+        return None
+
+
+class DetailCache:
+    """Per-event details with the time each was fetched"""
+
+    def __init__(self, path: str = EVENT_DETAILS):
+        self.path = path
+        self.events: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.events = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read event details: {e}")
+
+    @staticmethod
+    def ttl(match: Dict, today: date) -> timedelta:
+        """Settled events keep their details for weeks; upcoming and recent ones refresh twice a day"""
+        event_date = parse_event_date(match.get('date', ''))
+        if event_date is not None and today > event_date + timedelta(days=SETTLE_DAYS):
+            return PAST_TTL
+        return FUTURE_TTL
+
+    def is_fresh(self, match: Dict, today: date) -> bool:
+        entry = self.events.get(match['event_id'])
+        if entry is None:
+            return False
+        age = datetime.now(EST) - datetime.fromisoformat(entry['fetched_at'])
+        return age <= self.ttl(match, today)
+
+    def get(self, event_id: str) -> Optional[Dict]:
+        entry = self.events.get(event_id)
+        return entry['details'] if entry else None
+
+    def put(self, event_id: str, details: Dict):
+        self.events[event_id] = {'fetched_at': datetime.now(EST).isoformat(), 'details': details}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.events, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def fetch_order(matches: List[Dict], today: date) -> List[Dict]:
+    """Next meets first, then the most recent past ones, so a cut-off run drops the least useful pages"""
+    def priority(match):
+        event_date = parse_event_date(match.get('date', '')) or date.min
+        if event_date >= today:
+            return (0, event_date.toordinal())
+        return (1, -event_date.toordinal())
+    return sorted(matches, key=priority)
+
+
+def enrich(schedule: List[Dict], cache: Optional[DetailCache] = None, budget: float = TIME_BUDGET,
+           max_workers: int = MAX_WORKERS, today: Optional[date] = None) -> int:
+    """Fetch stale event details within the time budget and merge cached details into the schedule; returns fetches"""
+    cache = cache or DetailCache()
+    today = today or datetime.now(EST).date()
+    stale = fetch_order([m for m in schedule if m.get('event_id') and not cache.is_fresh(m, today)], today)
+
+    logger.info("="*60)
+    logger.info(f"Event details: {len(stale)} of {len(schedule)} events need fetching ({budget:.0f}s budget)")
+    logger.info("="*60)
+
+    fetched = 0
+    if stale:
+        start = time.monotonic()
+        deadline = start + budget
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(stale)))
+        futures = {pool.submit(fetch_event_details, m['event_id'], deadline): m['event_id'] for m in stale}
+        done, pending = wait(futures, timeout=budget)
+        # Queued fetches are dropped. The few in flight are still joined at exit, but their
+        # timeout was capped at the time left, so they give up at about the deadline (requests
+        # applies the timeout to the connect and to each read, so a trickling response can run
+        # a little past it)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        for future in done:
+            details = future.result()
+            if details is not None:
+                cache.put(futures[future], details)
+                fetched += 1
+        if pending:
+            logger.warning(f"Time budget reached after {time.monotonic() - start:.1f}s: "
+                           f"{len(pending)} events left for the next run")
+        cache.save()
+
+    # Stale details are still better than none
+    for match in schedule:
+        details = cache.get(match.get('event_id', ''))
+        if details:
+            match.update({k: v for k, v in details.items() if k != 'venue'})
+            if details.get('venue') and match.get('location') in ('', 'TBD'):
+                match['location'] = details['venue']
+    return fetched
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Add event details to the schedule")
+    parser.add_argument('--budget', type=float, default=TIME_BUDGET, help="Seconds to spend fetching")
+    parser.add_argument('--parse', metavar='FILE', help="Parse a saved event page and print the details")
+    args = parser.parse_args()
+
+    if args.parse:
+        with open(args.parse, 'r', encoding='utf-8') as f:
+            print(json.dumps(parse_event_details(f.read()), indent=2))
+        return
+
+    data = load_data(OUTPUT_FILE) or {}
+    fetched = enrich(data.get('schedule', []), budget=args.budget)
+    save_data(data, OUTPUT_FILE)
+    logger.info(f"Fetched details for {fetched} events")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling History Store
+Keeps every scrape in SQLite so rosters, meets and bouts can be queried across seasons
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import subprocess
+from typing import Dict, List, Optional
+
+from scraper_ajax_method import HISTORY_DB, HOME_LOCATION, OUTPUT_FILE, parse_event_date
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrapes (
+    scrape_id INTEGER PRIMARY KEY,
+    season_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    season TEXT,
+    scraped_at TEXT NOT NULL,
+    UNIQUE (season_id, team_id, scraped_at)
+);
+
+CREATE TABLE IF NOT EXISTS wrestlers (
+    season_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    weight_class TEXT,
+    grade TEXT,
+    record TEXT,
+    first_scrape_id INTEGER NOT NULL REFERENCES scrapes (scrape_id),
+    last_scrape_id INTEGER NOT NULL REFERENCES scrapes (scrape_id),
+    PRIMARY KEY (season_id, team_id, name_key)
+);
+CREATE INDEX IF NOT EXISTS idx_wrestlers_name ON wrestlers (name_key);
+CREATE INDEX IF NOT EXISTS idx_wrestlers_weight ON wrestlers (weight_class, season_id);
+
+CREATE TABLE IF NOT EXISTS events (
+    season_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    event_date TEXT NOT NULL,
+    opponent_key TEXT NOT NULL,
+    opponent TEXT NOT NULL,
+    location_key TEXT,
+    location TEXT,
+    time TEXT,
+    result TEXT,
+    home INTEGER NOT NULL DEFAULT 0,
+    first_scrape_id INTEGER NOT NULL REFERENCES scrapes (scrape_id),
+    last_scrape_id INTEGER NOT NULL REFERENCES scrapes (scrape_id),
+    PRIMARY KEY (season_id, team_id, event_date, opponent_key)
+);
+CREATE INDEX IF NOT EXISTS idx_events_opponent ON events (opponent_key, event_date);
+CREATE INDEX IF NOT EXISTS idx_events_location ON events (location_key, event_date);
+CREATE INDEX IF NOT EXISTS idx_events_date ON events (event_date);
+
+CREATE TABLE IF NOT EXISTS bouts (
+    season_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    bout_key TEXT NOT NULL,
+    event_date TEXT,
+    weight_class TEXT,
+    wrestler_key TEXT,
+    wrestler TEXT,
+    opponent TEXT,
+    result TEXT,
+    win_type TEXT,
+    score TEXT,
+    first_scrape_id INTEGER NOT NULL REFERENCES scrapes (scrape_id),
+    last_scrape_id INTEGER NOT NULL REFERENCES scrapes (scrape_id),
+    PRIMARY KEY (season_id, team_id, bout_key)
+);
+CREATE INDEX IF NOT EXISTS idx_bouts_wrestler ON bouts (wrestler_key, event_date);
+CREATE INDEX IF NOT EXISTS idx_bouts_weight ON bouts (weight_class, season_id);
+CREATE INDEX IF NOT EXISTS idx_bouts_date ON bouts (event_date);
+"""
+
+UPSERT_WRESTLER = """
+INSERT INTO wrestlers (season_id, team_id, name_key, name, weight_class, grade, record,
+                       first_scrape_id, last_scrape_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (season_id, team_id, name_key) DO UPDATE SET
+    name = excluded.name,
+    weight_class = excluded.weight_class,
+    grade = excluded.grade,
+    record = excluded.record,
+    last_scrape_id = excluded.last_scrape_id
+"""
+
+UPSERT_EVENT = """
+INSERT INTO events (season_id, team_id, event_date, opponent_key, opponent, location_key,
+                    location, time, result, home, first_scrape_id, last_scrape_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (season_id, team_id, event_date, opponent_key) DO UPDATE SET
+    opponent = excluded.opponent,
+    location_key = excluded.location_key,
+    location = excluded.location,
+    time = excluded.time,
+    result = excluded.result,
+    home = excluded.home,
+    last_scrape_id = excluded.last_scrape_id
+"""
+
+UPSERT_BOUT = """
+INSERT INTO bouts (season_id, team_id, bout_key, event_date, weight_class, wrestler_key,
+                   wrestler, opponent, result, win_type, score, first_scrape_id, last_scrape_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (season_id, team_id, bout_key) DO UPDATE SET
+    result = excluded.result,
+    win_type = excluded.win_type,
+    score = excluded.score,
+    last_scrape_id = excluded.last_scrape_id
+"""
+
+
+def normalize_key(value: str) -> str:
+    """Lowercase and collapse whitespace so "Cherry Hill  West" and "cherry hill west" match"""
+    return re.sub(r'\s+', ' ', (value or '')).strip().lower()
+
+
+def iso_date(value: str) -> str:
+    """Store dates as ISO strings so they sort and range-scan correctly"""
+    parsed = parse_event_date(value or '')
+    return parsed.isoformat() if parsed else (value or '')
+
+
+def season_name(season_id: str) -> str:
+    """Look up the "2025-26" style label for a season ID"""
+    try:
+        from season_config import SEASONS
+    except ImportError:
+        return season_id
+
+    for name, ids in SEASONS.items():
+        if ids.get('season_id') == season_id:
+            return name
+    return season_id
+
+
+class HistoryStore:
+    """SQLite store holding every scrape, keyed by season, team and scrape time"""
+
+    def __init__(self, db_path: str = HISTORY_DB):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def ingest(self, data: Dict) -> int:
+        """Ingest one scrape in a single transaction and return its scrape ID"""
+        metadata = data.get('metadata', {})
+        season_id = str(metadata.get('season_id', ''))
+        team_id = str(metadata.get('team_id', ''))
+        scraped_at = metadata.get('last_updated', '')
+        season = metadata.get('season') or season_name(season_id)
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO scrapes (season_id, team_id, season, scraped_at) VALUES (?, ?, ?, ?)",
+                (season_id, team_id, season, scraped_at)
+            )
+            scrape_id = self.conn.execute(
+                "SELECT scrape_id FROM scrapes WHERE season_id = ? AND team_id = ? AND scraped_at = ?",
+                (season_id, team_id, scraped_at)
+            ).fetchone()[0]
+
+            self.conn.executemany(UPSERT_WRESTLER, [
+                (season_id, team_id, normalize_key(w.get('name', '')), w.get('name', ''),
+                 w.get('weight_class', ''), w.get('grade', ''), w.get('record', ''),
+                 scrape_id, scrape_id)
+                for w in data.get('roster', []) if w.get('name')
+            ])
+
+            self.conn.executemany(UPSERT_EVENT, [
+                (season_id, team_id, iso_date(m.get('date', '')), normalize_key(m.get('opponent', '')),
+                 m.get('opponent', ''), normalize_key(m.get('location', '')), m.get('location', ''),
+                 m.get('time', ''), m.get('result', ''), int(m.get('location') == HOME_LOCATION),
+                 scrape_id, scrape_id)
+                for m in data.get('schedule', [])
+            ])
+
+            self.conn.executemany(UPSERT_BOUT, [
+                (season_id, team_id, self._bout_key(r), iso_date(r.get('date', '')),
+                 r.get('weight_class', ''), normalize_key(r.get('wrestler', '')), r.get('wrestler', ''),
+                 r.get('opponent', ''), r.get('result', ''), r.get('win_type', ''), r.get('score', ''),
+                 scrape_id, scrape_id)
+                for r in data.get('results', [])
+            ])
+
+        logger.info(f"Ingested scrape {scrape_id} ({season} / team {team_id} @ {scraped_at})")
+        return scrape_id
+
+    @staticmethod
+    def _bout_key(result: Dict) -> str:
+        """Stable key for a result row, preferring the ID the results engine assigns"""
+        if result.get('bout_id'):
+            return str(result['bout_id'])
+
+        parts = [result.get(k, '') for k in ('date', 'opponent', 'weight_class', 'wrestler', 'score')]
+        return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+    def meets_against(self, opponent: str) -> List[Dict]:
+        """Every meet against an opponent across all seasons"""
+        # Away meets list Shawnee as the opponent and the host as the location,
+        # so both indexed columns are searched
+        key = normalize_key(opponent)
+        rows = self.conn.execute(
+            """
+            SELECT e.*, s.season FROM events e
+            JOIN scrapes s ON s.scrape_id = e.last_scrape_id
+            WHERE e.opponent_key = ? OR e.location_key = ?
+            ORDER BY e.event_date
+            """,
+            (key, key)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def roster_by_weight_class(self, weight_class: Optional[str] = None,
+                               season_id: Optional[str] = None) -> Dict[str, Dict[str, List[str]]]:
+        """Roster grouped as {season: {weight_class: [names]}}"""
+        query = """
+            SELECT w.season_id, w.weight_class, w.name, s.season FROM wrestlers w
+            JOIN scrapes s ON s.scrape_id = w.last_scrape_id
+        """
+        clauses, params = [], []
+        if weight_class:
+            clauses.append("w.weight_class = ?")
+            params.append(weight_class)
+        if season_id:
+            clauses.append("w.season_id = ?")
+            params.append(season_id)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY w.season_id, CAST(w.weight_class AS INTEGER), w.name"
+
+        grouped: Dict[str, Dict[str, List[str]]] = {}
+        for row in self.conn.execute(query, params):
+            season = row['season'] or row['season_id']
+            grouped.setdefault(season, {}).setdefault(row['weight_class'] or '', []).append(row['name'])
+        return grouped
+
+    def wrestler_history(self, name: str) -> Dict[str, List[Dict]]:
+        """Every season a wrestler appears in, plus their bouts"""
+        key = normalize_key(name)
+        seasons = self.conn.execute(
+            """
+            SELECT w.*, s.season FROM wrestlers w
+            JOIN scrapes s ON s.scrape_id = w.last_scrape_id
+            WHERE w.name_key = ? ORDER BY w.season_id
+            """,
+            (key,)
+        ).fetchall()
+        bouts = self.conn.execute(
+            "SELECT * FROM bouts WHERE wrestler_key = ? ORDER BY event_date", (key,)
+        ).fetchall()
+        return {
+            'seasons': [dict(row) for row in seasons],
+            'bouts': [dict(row) for row in bouts]
+        }
+
+    def scrapes(self) -> List[Dict]:
+        """All recorded scrapes, oldest first"""
+        rows = self.conn.execute("SELECT * FROM scrapes ORDER BY scraped_at").fetchall()
+        return [dict(row) for row in rows]
+
+
+def backfill_from_git(store: HistoryStore, data_file: str = OUTPUT_FILE) -> int:
+    """Replay every committed version of the data file into the store"""
+    commits = subprocess.run(
+        ['git', 'log', '--reverse', '--format=%H', '--', data_file],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    logger.info(f"Found {len(commits)} commits touching {data_file}")
+
+    ingested = 0
+    for commit in commits:
+        blob = subprocess.run(
+            ['git', 'show', f'{commit}:{data_file}'], capture_output=True, text=True
+        )
+        if blob.returncode != 0:
+            continue
+        try:
+            store.ingest(json.loads(blob.stdout))
+            ingested += 1
+        except (json.JSONDecodeError, sqlite3.Error) as e:
+            logger.warning(f"Skipping {commit[:8]}: {e}")
+
+    return ingested
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Query the Shawnee wrestling history store")
+    parser.add_argument('--db', default=HISTORY_DB, help="SQLite database path")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help="Ingest scraper output files")
+    ingest.add_argument('files', nargs='*', default=[OUTPUT_FILE])
+    commands.add_parser('backfill', help="Ingest every committed version of the data file")
+    meets = commands.add_parser('meets', help="All meets against an opponent")
+    meets.add_argument('opponent')
+    roster = commands.add_parser('roster', help="Roster by weight class per season")
+    roster.add_argument('--weight-class')
+    roster.add_argument('--season-id')
+    wrestler = commands.add_parser('wrestler', help="Seasons and bouts for one wrestler")
+    wrestler.add_argument('name')
+
+    args = parser.parse_args()
+
+    with HistoryStore(args.db) as store:
+        if args.command == 'ingest':
+            for path in args.files:
+                with open(path, 'r', encoding='utf-8') as f:
+                    store.ingest(json.load(f))
+        elif args.command == 'backfill':
+            count = backfill_from_git(store)
+            logger.info(f"Backfilled {count} scrapes")
+        elif args.command == 'meets':
+            for meet in store.meets_against(args.opponent):
+                print(f"  {meet['event_date']}  {meet['season'] or meet['season_id']}  "
+                      f"{meet['opponent']} @ {meet['location']}, {meet['time']}  {meet['result']}")
+        elif args.command == 'roster':
+            for season, classes in store.roster_by_weight_class(args.weight_class, args.season_id).items():
+                print(f"\n{season}")
+                for weight_class, names in classes.items():
+                    print(f"  {weight_class:>4}: {', '.join(names)}")
+        elif args.command == 'wrestler':
+            print(json.dumps(store.wrestler_history(args.name), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Identity Resolver
+Links one athlete's roster entries across seasons and teams using blocking keys instead of all-pairs compares
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from history_store import HistoryStore, normalize_key, season_name
+from name_search import normalize_name, trigrams
+from scraper_ajax_method import EST, HISTORY_DB, IDENTITY_MAP
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+MATCH_THRESHOLD = 0.75     # combined score needed to link a record to an identity
+WEIGHT_CLASSES = ['106', '113', '120', '126', '132', '138', '144', '150', '157', '165', '175', '190', '215', '285']
+
+GRADES = {
+    'fr': 9, 'freshman': 9, '9': 9,
+    'so': 10, 'sophomore': 10, '10': 10,
+    'jr': 11, 'junior': 11, '11': 11,
+    'sr': 12, 'senior': 12, '12': 12,
+}
+
+
+def parse_grade(grade: str) -> Optional[int]:
+    """Grade text such as Fr., Sophomore or 11 as a number from 9 to 12"""
+    return GRADES.get(re.sub(r'[^a-z0-9]', '', (grade or '').lower()))
+
+
+def season_start_year(season: str) -> Optional[int]:
+    """Starting year of a season label (2025 for 2025-26)"""
+    match = re.match(r'(\d{4})', season or '')
+    return int(match.group(1)) if match else None
+
+
+def team_label(team_id: str) -> str:
+    """Collapse a program's per-season team IDs into one label"""
+    try:
+        from season_config import SEASONS
+    except ImportError:
+        return team_id
+    if any(ids.get('team_id') == team_id for ids in SEASONS.values()):
+        return 'shawnee'
+    return team_id
+
+
+def surname(name: str) -> str:
+    words = normalize_name(name).split()
+    return words[-1] if words else ''
+
+
+@lru_cache(maxsize=65536)
+def name_grams(name: str) -> frozenset:
+    return frozenset(trigrams(name))
+
+
+def name_similarity(a: str, b: str) -> float:
+    grams_a, grams_b = name_grams(a), name_grams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2.0 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+class IdentityMap:
+    """Persisted record -> identity assignments plus the blocks used to find candidates"""
+
+    def __init__(self, path: str = IDENTITY_MAP):
+        self.path = path
+        self.records: Dict[str, Dict] = {}        # record id -> roster record (with identity)
+        self.identities: Dict[str, List[str]] = {}  # identity -> record ids
+        self.blocks: Dict[str, List[str]] = {}    # blocking key -> record ids
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+                self.records = stored.get('records', {})
+                self.identities = stored.get('identities', {})
+                self.blocks = stored.get('blocks', {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read identity map: {e}")
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'updated': datetime.now(EST).isoformat(),
+                'records': self.records,
+                'identities': self.identities,
+                'blocks': self.blocks,
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def blocking_keys(record: Dict) -> List[str]:
+        """Keys a true match shares: program + class year + surname initial, or class year + surname for transfers"""
+        last = surname(record['name'])
+        grad = record.get('grad_year')
+        if grad is None:
+            return [f"t|{record['team']}|?|{last[:1]}"]
+        return [f"t|{record['team']}|{grad}|{last[:1]}", f"s|{grad}|{last}"]
+
+    def score(self, record: Dict, other: Dict) -> float:
+        """Name similarity, with a penalty when weight went down more than one class between seasons"""
+        if record['season_start'] == other['season_start']:
+            return 0.0
+        similarity = name_similarity(record['name'], other['name'])
+
+        earlier, later = sorted((record, other), key=lambda r: r['season_start'] or 0)
+        if earlier['weight_class'] in WEIGHT_CLASSES and later['weight_class'] in WEIGHT_CLASSES:
+            drop = WEIGHT_CLASSES.index(earlier['weight_class']) - WEIGHT_CLASSES.index(later['weight_class'])
+            if drop > 1:
+                similarity -= 0.1 * (drop - 1)
+        if record['team'] != other['team']:
+            similarity -= 0.05
+        return similarity
+
+    def add(self, record: Dict) -> Tuple[str, bool]:
+        """Assign one record to an identity (existing or new); returns (identity, is_new_record)"""
+        existing = self.records.get(record['id'])
+        if existing is not None:
+            return existing['identity'], False
+
+        # Only records sharing a block are compared, and each identity may hold one record per season
+        best, best_score = None, MATCH_THRESHOLD
+        for key in self.blocking_keys(record):
+            for other_id in self.blocks.get(key, []):
+                other = self.records[other_id]
+                score = self.score(record, other)
+                if score <= best_score:
+                    continue
+                if any(self.records[r]['season_start'] == record['season_start']
+                       for r in self.identities[other['identity']]):
+                    continue
+                best, best_score = other['identity'], score
+
+        identity = best or record['id']
+        record['identity'] = identity
+        self.records[record['id']] = record
+        self.identities.setdefault(identity, []).append(record['id'])
+        for key in self.blocking_keys(record):
+            self.blocks.setdefault(key, []).append(record['id'])
+        return identity, True
+
+    def add_records(self, records: Iterable[Dict]) -> int:
+        """Oldest seasons first so identities grow forward in time; returns new records"""
+        ordered = sorted(records, key=lambda r: (r['season_start'] or 0, r['id']))
+        return sum(1 for record in ordered if self.add(record)[1])
+
+    def career(self, identity: str) -> List[Dict]:
+        return sorted((self.records[r] for r in self.identities.get(identity, [])),
+                      key=lambda r: r['season_start'] or 0)
+
+    def find(self, name: str) -> List[str]:
+        key = normalize_name(name)
+        return sorted({r['identity'] for r in self.records.values() if normalize_name(r['name']) == key})
+
+
+def store_records(store: HistoryStore) -> List[Dict]:
+    """Every (season, team, wrestler) row in the history store as a resolver record"""
+    rows = store.conn.execute(
+        """
+        SELECT w.season_id, w.team_id, w.name_key, w.name, w.weight_class, w.grade, s.season
+        FROM wrestlers w JOIN scrapes s ON s.scrape_id = w.last_scrape_id
+        """
+    ).fetchall()
+
+    records = []
+    for row in rows:
+        season = row['season'] or season_name(row['season_id'])
+        start = season_start_year(season)
+        grade = parse_grade(row['grade'])
+        records.append({
+            'id': f"{row['season_id']}|{row['team_id']}|{row['name_key']}",
+            'season_id': row['season_id'],
+            'season': season,
+            'season_start': start,
+            'team_id': row['team_id'],
+            'team': team_label(row['team_id']),
+            'name': row['name'],
+            'name_key': row['name_key'],
+            'weight_class': row['weight_class'] or '',
+            'grade': row['grade'] or '',
+            # Class year stays fixed while grade and season both advance
+            'grad_year': start + 1 + (12 - grade) if start is not None and grade is not None else None,
+        })
+    return records
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Link wrestlers across seasons and teams")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('update', help="Resolve records added to the history store since the last run")
+
+    career_parser = subparsers.add_parser('career', help="Every season for a wrestler")
+    career_parser.add_argument('name')
+
+    args = parser.parse_args()
+    identities = IdentityMap()
+
+    if args.command == 'update':
+        with HistoryStore(HISTORY_DB) as store:
+            added = identities.add_records(store_records(store))
+        identities.save()
+        logger.info(f"{added} new records; {len(identities.records)} records, {len(identities.identities)} wrestlers")
+        return
+
+    matches = identities.find(args.name)
+    if not matches:
+        logger.info(f"No wrestler named {args.name}; run 'python identity.py update' first")
+        return
+
+    with HistoryStore(HISTORY_DB) as store:
+        for identity in matches:
+            print(f"\n{args.name}")
+            for record in identities.career(identity):
+                bouts = store.conn.execute(
+                    "SELECT result, COUNT(*) FROM bouts WHERE season_id = ? AND wrestler_key = ? GROUP BY result",
+                    (record['season_id'], normalize_key(record['name']))
+                ).fetchall()
+                tally = {row[0]: row[1] for row in bouts}
+                print(f"  {record['season']:<8} {record['grade']:<4} {record['weight_class']:>4}  "
+                      f"{record['name']:<26} {tally.get('Win', 0)}-{tally.get('Loss', 0)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Import Budget
+Fails when an entry point's cold import (python -X importtime) goes over budget or loads a backend library it doesn't need yet
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+RUNS = 5                   # the median of these is compared with the budget
+BROWSER_MODULES = ('selenium', 'playwright', 'bs4', 'lxml')
+# entry point: (import budget in ms or None, top-level packages it must not load at import)
+ENTRY_POINTS: Dict[str, Tuple[Optional[float], Tuple[str, ...]]] = {
+    'scraper_ajax_method': (75, BROWSER_MODULES + ('requests',)),   # the cron job
+    'main': (150, BROWSER_MODULES + ('requests',)),                 # the API server and its workers
+    'scraper': (None, BROWSER_MODULES),
+    'scraper_datablob': (None, BROWSER_MODULES),
+    'scraper_frame': (None, BROWSER_MODULES),
+    'scraper_beautifulsoup': (None, BROWSER_MODULES),
+    'scraper_selenium_final': (None, BROWSER_MODULES),
+    'scraper_playwright': (None, BROWSER_MODULES),
+}
+
+
+def import_times(module: str) -> List[Tuple[str, int, int]]:
+    """(name, nesting depth, cumulative microseconds) per module loaded by a fresh `import module`, in load order"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append((name.strip(), depth, int(cumulative)))
+    return times
+
+
+def direct_imports(times: List[Tuple[str, int, int]], module: str) -> List[Tuple[str, int]]:
+    """What `module` itself imported; importtime lists those just before it, one level deeper"""
+    index = max(i for i, (name, depth, _) in enumerate(times) if name == module and depth == 0)
+    children = []
+    for name, depth, cumulative in reversed(times[:index]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((name, cumulative))
+    return children
+
+
+def check(module: str, budget_ms: Optional[float], deferred: Tuple[str, ...], runs: int = RUNS) -> List[str]:
+    """Problems with one entry point (empty if it's within budget and loads nothing deferred)"""
+    import_times(module)  # warm-up: writes bytecode caches so every measured run is comparable
+    samples = [import_times(module) for _ in range(runs)]
+    median_ms = statistics.median(next(t for name, depth, t in sample if name == module and depth == 0)
+                                  for sample in samples) / 1000
+
+    problems = []
+    loaded = sorted({name.split('.')[0] for name, _, _ in samples[0]} & set(deferred))
+    if loaded:
+        problems.append(f"{module} imports {', '.join(loaded)} at module level")
+    if budget_ms is not None and median_ms > budget_ms:
+        slowest = sorted(direct_imports(samples[0], module), key=lambda item: -item[1])[:5]
+        problems.append(f"{module} takes {median_ms:.0f} ms to import (budget {budget_ms:.0f} ms); slowest: "
+                        + ', '.join(f"{name} {t / 1000:.0f} ms" for name, t in slowest))
+
+    budget = f"{budget_ms:.0f} ms" if budget_ms is not None else '-'
+    logger.info(f"{module:<24} {median_ms:>7.1f} ms  budget {budget:<7} {'FAIL' if problems else 'ok'}")
+    return problems
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Check entry point import time and deferred dependencies")
+    parser.add_argument('modules', nargs='*', help=f"Entry points to check (default: all of {', '.join(ENTRY_POINTS)})")
+    parser.add_argument('--runs', type=int, default=RUNS)
+    parser.add_argument('--budget', type=float, help="Override the budget (ms) for every checked entry point")
+    args = parser.parse_args()
+
+    problems = []
+    for module in args.modules or ENTRY_POINTS:
+        budget_ms, deferred = ENTRY_POINTS.get(module, (None, BROWSER_MODULES))
+        if args.budget is not None:
+            budget_ms = args.budget
+        try:
+            problems.extend(check(module, budget_ms, deferred, args.runs))
+        except ImportError as e:
+            problems.append(f"{module} fails to import: {e}")
+
+    for problem in problems:
+        logger.error(problem)
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
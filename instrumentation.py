@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Instrumentation
+Timing spans, per-endpoint transfer counters and tracemalloc peaks for a scrape, written as a JSON report and OpenMetrics
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+RUN_REPORT = 'data/run_report.json'
+RUN_METRICS = 'data/run_metrics.prom'
+RUN_HISTORY = 'data/run_history.jsonl'
+HISTORY_LIMIT = 400        # runs kept in RUN_HISTORY
+TRACE_MEMORY = os.environ.get('TRACE_MEMORY', '0') == '1'   # tracing slows every allocation; opt in per run
+EST = ZoneInfo("America/New_York")
+# One ID per process, shared with debug_store so artifacts can be matched to the run report.
+# CI runs use the workflow run (and attempt) so the ID also matches the uploaded artifact's name.
+RUN_ID = (os.environ.get('RUN_ID')
+          or (f"gh-{os.environ['GITHUB_RUN_ID']}-{os.environ.get('GITHUB_RUN_ATTEMPT', '1')}"
+              if os.environ.get('GITHUB_RUN_ID') else None)
+          or f"{datetime.now(EST):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}")
+
+SpanKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def max_rss_bytes() -> Optional[int]:
+    """The process's resident-memory high-water mark; one syscall, so it is sampled on every run"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024   # KiB everywhere but macOS
+
+
+class Recorder:
+    """Aggregates spans by (name, labels) and HTTP counters by endpoint; safe to use from worker threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.spans: Dict[SpanKey, Dict] = {}
+        self.endpoints: Dict[str, Dict] = {}
+        self.started: Optional[float] = None
+        self.started_at: Optional[str] = None
+        self.memory_stack: List[Dict] = []
+        self.run_peak = 0          # spans reset tracemalloc's peak, so the run's own is kept here
+
+    def start_run(self, trace_memory: bool = TRACE_MEMORY):
+        self.reset()
+        self.started = time.perf_counter()
+        self.started_at = datetime.now(EST).isoformat()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """Time a block; on the main thread also record how far it raised the RSS high-water mark,
+        and while tracing its tracemalloc peak"""
+        on_main = threading.current_thread() is threading.main_thread()
+        track_memory = tracemalloc.is_tracing() and on_main
+        rss_start = max_rss_bytes() if on_main else None
+        if track_memory:
+            # The peak counter is global, so fold it into the enclosing span before resetting it
+            current, peak = tracemalloc.get_traced_memory()
+            self.run_peak = max(self.run_peak, peak)
+            if self.memory_stack:
+                self.memory_stack[-1]['peak'] = max(self.memory_stack[-1]['peak'], peak)
+            tracemalloc.reset_peak()
+            frame = {'base': current, 'peak': current}
+            self.memory_stack.append(frame)
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            rss_growth = None
+            if rss_start is not None:
+                rss_growth = max_rss_bytes() - rss_start
+            peak_bytes = None
+            if track_memory:
+                frame = self.memory_stack.pop()
+                peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+                peak_bytes = peak - frame['base']
+                self.run_peak = max(self.run_peak, peak)
+                if self.memory_stack:
+                    self.memory_stack[-1]['peak'] = max(self.memory_stack[-1]['peak'], peak)
+            self.add_span(name, labels, elapsed, peak_bytes, rss_growth)
+
+    def add_span(self, name: str, labels: Dict[str, str], seconds: float, peak_bytes: Optional[int] = None,
+                 rss_growth_bytes: Optional[int] = None):
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self.lock:
+            stats = self.spans.setdefault(key, {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0, 'peak_bytes': None,
+                                                'rss_growth_bytes': None})
+            stats['count'] += 1
+            stats['seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            if peak_bytes is not None:
+                stats['peak_bytes'] = max(stats['peak_bytes'] or 0, peak_bytes)
+            if rss_growth_bytes is not None:
+                stats['rss_growth_bytes'] = max(stats['rss_growth_bytes'] or 0, rss_growth_bytes)
+
+    def endpoint(self, name: str) -> Dict:
+        return self.endpoints.setdefault(name, {'requests': 0, 'bytes': 0, 'retries': 0, 'failures': 0})
+
+    def record_request(self, endpoint: str, nbytes: int, ok: bool = True):
+        with self.lock:
+            stats = self.endpoint(endpoint)
+            stats['requests'] += 1
+            stats['bytes'] += nbytes
+            if not ok:
+                stats['failures'] += 1
+
+    def record_retry(self, endpoint: str):
+        with self.lock:
+            self.endpoint(endpoint)['retries'] += 1
+
+    def report(self) -> Dict:
+        with self.lock:
+            spans = [{'name': name, 'labels': dict(labels), **stats,
+                      'seconds': round(stats['seconds'], 6), 'max_seconds': round(stats['max_seconds'], 6)}
+                     for (name, labels), stats in sorted(self.spans.items())]
+            endpoints = {name: dict(stats) for name, stats in sorted(self.endpoints.items())}
+        return {
+            'run_id': RUN_ID,
+            'started_at': self.started_at,
+            'finished_at': datetime.now(EST).isoformat(),
+            'duration_seconds': round(time.perf_counter() - self.started, 6) if self.started else None,
+            'peak_memory_bytes': (max(self.run_peak, tracemalloc.get_traced_memory()[1])
+                                  if tracemalloc.is_tracing() else None),
+            'max_rss_bytes': max_rss_bytes(),
+            'spans': spans,
+            'endpoints': endpoints,
+        }
+
+
+def openmetrics(report: Dict) -> str:
+    """The report in OpenMetrics text format (terminated by # EOF)"""
+    def labels(values: Dict) -> str:
+        if not values:
+            return ''
+        escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"') for v in values.values())
+        return '{' + ','.join(f'{k}="{v}"' for k, v in zip(values, escaped)) + '}'
+
+    lines = []
+
+    def family(name, kind, help_text, samples):
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {help_text}")
+        suffix = '_total' if kind == 'counter' else ''
+        for sample_labels, value in samples:
+            lines.append(f"{name}{suffix}{labels(sample_labels)} {value}")
+
+    if report['duration_seconds'] is not None:
+        family('scraper_run_duration_seconds', 'gauge', "Wall time of the run.",
+               [({}, report['duration_seconds'])])
+    if report['peak_memory_bytes'] is not None:
+        family('scraper_run_peak_memory_bytes', 'gauge', "tracemalloc peak over the run.",
+               [({}, report['peak_memory_bytes'])])
+    if report.get('max_rss_bytes') is not None:
+        family('scraper_run_max_rss_bytes', 'gauge', "Resident memory high-water mark of the process.",
+               [({}, report['max_rss_bytes'])])
+
+    span_labels = [({'span': s['name'], **s['labels']}, s) for s in report['spans']]
+    family('scraper_span_seconds', 'counter', "Time spent in each stage.",
+           [(l, s['seconds']) for l, s in span_labels])
+    family('scraper_span', 'counter', "Times each stage ran.",
+           [(l, s['count']) for l, s in span_labels])
+    family('scraper_span_max_seconds', 'gauge', "Slowest single run of each stage.",
+           [(l, s['max_seconds']) for l, s in span_labels])
+    family('scraper_span_peak_bytes', 'gauge', "tracemalloc peak above the stage's starting usage.",
+           [(l, s['peak_bytes']) for l, s in span_labels if s['peak_bytes'] is not None])
+    family('scraper_span_rss_growth_bytes', 'gauge', "How far the stage raised the resident memory high-water mark.",
+           [(l, s['rss_growth_bytes']) for l, s in span_labels if s.get('rss_growth_bytes') is not None])
+
+    for field, help_text in (('requests', "HTTP requests made."), ('bytes', "Response bytes received."),
+                             ('retries', "Retries after a failed attempt."), ('failures', "Failed requests.")):
+        family(f'scraper_http_{field}', 'counter', help_text,
+               [({'endpoint': name}, stats[field]) for name, stats in report['endpoints'].items()])
+
+    lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
+
+
+def write_json(path: str, value):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def finish_run(report_path: str = RUN_REPORT, metrics_path: str = RUN_METRICS,
+               history_path: str = RUN_HISTORY) -> Dict:
+    """Write the JSON report, the OpenMetrics file and a line in the run history"""
+    report = recorder.report()
+    write_json(report_path, report)
+
+    tmp_path = f"{metrics_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(openmetrics(report))
+    os.replace(tmp_path, metrics_path)
+
+    # One compact line per run so regressions show up across runs
+    lines = []
+    if os.path.exists(history_path):
+        with open(history_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()[-(HISTORY_LIMIT - 1):]
+    lines.append(json.dumps(report, separators=(',', ':')) + '\n')
+    with open(f"{history_path}.tmp", 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+    os.replace(f"{history_path}.tmp", history_path)
+
+    logger.info(f"Run report: {report_path} ({report['duration_seconds']:.2f}s)")
+    return report
+
+
+recorder = Recorder()
+span = recorder.span
+start_run = recorder.start_run
+record_request = recorder.record_request
+record_retry = recorder.record_retry
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Compare stage timings across runs")
+    parser.add_argument('--runs', type=int, default=7, help="Earlier runs to average against")
+    args = parser.parse_args()
+
+    if not os.path.exists(RUN_HISTORY):
+        logger.info(f"No run history yet ({RUN_HISTORY} is written by each scrape)")
+        return
+    with open(RUN_HISTORY, 'r', encoding='utf-8') as f:
+        runs = [json.loads(line) for line in f if line.strip()]
+    latest, earlier = runs[-1], runs[-1 - args.runs:-1]
+
+    def seconds_by_span(run):
+        return {(s['name'], json.dumps(s['labels'], sort_keys=True)): s['seconds'] for s in run['spans']}
+
+    history: Dict[Tuple[str, str], List[float]] = {}
+    for run in earlier:
+        for key, seconds in seconds_by_span(run).items():
+            history.setdefault(key, []).append(seconds)
+
+    print(f"Run {latest['started_at']}: {latest['duration_seconds']:.2f}s "
+          f"(vs {len(earlier)} earlier runs)")
+    past_rss = [run['max_rss_bytes'] for run in earlier if run.get('max_rss_bytes')]
+    if latest.get('max_rss_bytes') and past_rss:
+        baseline = sum(past_rss) / len(past_rss)
+        print(f"  max RSS {latest['max_rss_bytes'] / 2**20:.1f} MiB "
+              f"({(latest['max_rss_bytes'] / baseline - 1) * 100:+.0f}%)")
+    for (name, labels), seconds in sorted(seconds_by_span(latest).items(), key=lambda item: -item[1]):
+        past = history.get((name, labels))
+        baseline = sum(past) / len(past) if past else None
+        change = f"{(seconds / baseline - 1) * 100:+.0f}%" if baseline else 'new'
+        label_text = ','.join(f"{k}={v}" for k, v in json.loads(labels).items())
+        print(f"  {name:<10} {label_text:<32} {seconds:>8.3f}s  {change}")
+
+
+if __name__ == "__main__":
+    main()
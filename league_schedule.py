@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling League Schedule
+Ingests every league team's schedule and indexes events by date and by team
+"""
+
+import argparse
+import json
+import logging
+import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from history_store import normalize_key
+from scraper_ajax_method import EST, SEASON_ID, fetch_team_schedule, parse_event_date
+from scouting import team_search_name
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+LEAGUE_SCHEDULE = 'data/league_schedule.json'
+MAX_WORKERS = 8
+
+
+def fallback_id(day: date, team: str, match: Dict) -> str:
+    """Key for an event without an ID: its date and both teams, so either team's schedule gives the same key"""
+    other = match.get('opponent', '')
+    # Away duals list the team itself as the opponent and the host as the location
+    if normalize_key(team_search_name(other)) == normalize_key(team_search_name(team)):
+        other = match.get('location', '')
+    pair = sorted(normalize_key(team_search_name(name)) for name in (team, other))
+    return f"{day.isoformat()}|{pair[0]}|{pair[1]}"
+
+
+class LeagueSchedule:
+    """League events deduplicated by event_id (or date and team pair), with a sorted date index and per-team indexes"""
+
+    def __init__(self, path: str = LEAGUE_SCHEDULE):
+        self.path = path
+        self.events: Dict[str, Dict] = {}
+        # Date index: parallel lists sorted by (start, event_id); ordinals keep comparisons cheap
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.ids: List[str] = []
+        self.max_length = 0
+        # Team index: team key -> sorted [(start, event_id)]
+        self.by_team: Dict[str, List[Tuple[int, str]]] = {}
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read league schedule: {e}")
+            return
+
+        self.events = stored.get('events', {})
+        index = stored.get('index', {})
+        if len(index.get('ids', [])) == len(self.events):
+            self.starts, self.ends, self.ids = index['starts'], index['ends'], index['ids']
+            self.max_length = index.get('max_length', 0)
+            self.by_team = {team: [tuple(item) for item in items] for team, items in index['by_team'].items()}
+        else:
+            self.rebuild_index()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'built_at': datetime.now(EST).isoformat(),
+                'events': self.events,
+                'index': {
+                    'starts': self.starts,
+                    'ends': self.ends,
+                    'ids': self.ids,
+                    'max_length': self.max_length,
+                    'by_team': self.by_team,
+                },
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def rebuild_index(self):
+        rows = []
+        by_team: Dict[str, List[Tuple[int, str]]] = {}
+        for event_id, event in self.events.items():
+            start = date.fromisoformat(event['start']).toordinal()
+            end = date.fromisoformat(event['end']).toordinal()
+            rows.append((start, event_id, end))
+            for team in event['teams']:
+                by_team.setdefault(normalize_key(team), []).append((start, event_id))
+
+        rows.sort()
+        self.starts = [r[0] for r in rows]
+        self.ids = [r[1] for r in rows]
+        self.ends = [r[2] for r in rows]
+        self.max_length = max((e - s for s, _, e in rows), default=0)
+        self.by_team = {team: sorted(items) for team, items in by_team.items()}
+
+    def add(self, team: str, schedule: List[Dict]) -> int:
+        """Merge one team's schedule; an event already seen from the other side just gains a team"""
+        added = 0
+        for match in schedule:
+            day = parse_event_date(match.get('date', ''))
+            if day is None:
+                continue
+            event_id = match.get('event_id') or fallback_id(day, team, match)
+
+            event = self.events.get(event_id)
+            if event is None:
+                event = {
+                    'event_id': event_id,
+                    'start': day.isoformat(),
+                    'end': day.isoformat(),
+                    'date': match.get('date', ''),
+                    'time': match.get('time', ''),
+                    'location': match.get('location', ''),
+                    'teams': [],
+                    'names': [],
+                }
+                self.events[event_id] = event
+                added += 1
+
+            if team not in event['teams']:
+                event['teams'].append(team)
+            opponent = match.get('opponent', '')
+            if opponent and opponent not in event['names']:
+                event['names'].append(opponent)
+        return added
+
+    def ingest(self, teams: Dict[str, str], season_id: str = SEASON_ID, max_workers: int = MAX_WORKERS) -> int:
+        """Fetch every team's schedule concurrently and merge them; returns new events"""
+        names = list(teams)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names) or 1)) as pool:
+            schedules = list(pool.map(lambda name: fetch_team_schedule(teams[name], season_id), names))
+
+        added = 0
+        for name, schedule in zip(names, schedules):
+            if schedule is None:
+                logger.warning(f"Skipping {name}: schedule fetch failed")
+                continue
+            added += self.add(name, schedule)
+        self.rebuild_index()
+        return added
+
+    def between(self, start: date, end: date) -> List[Dict]:
+        """Events overlapping [start, end], in date order"""
+        lo = bisect_left(self.starts, start.toordinal() - self.max_length)
+        hi = bisect_right(self.starts, end.toordinal())
+        first = start.toordinal()
+        return [self.events[self.ids[i]] for i in range(lo, hi) if self.ends[i] >= first]
+
+    def on(self, day: date) -> List[Dict]:
+        """Who wrestles on a given date"""
+        return self.between(day, day)
+
+    def team_events(self, team: str, before: Optional[date] = None) -> List[Dict]:
+        items = self.by_team.get(normalize_key(team), [])
+        if before is not None:
+            items = items[:bisect_left(items, (before.toordinal(), ''))]
+        return [self.events[event_id] for _, event_id in items]
+
+    def opponents(self, team: str, before: Optional[date] = None) -> Set[str]:
+        """Teams and event names a team has met (before a date, if given)"""
+        team_key = normalize_key(team)
+        met = set()
+        for event in self.team_events(team, before):
+            met.update(normalize_key(team_search_name(t)) for t in event['teams'] + event['names'])
+        met.discard(team_key)
+        return met
+
+    def shared_opponents(self, team_a: str, team_b: str, before: Optional[date] = None) -> Set[str]:
+        """Opponents both teams have faced before a date (e.g. before their own meet)"""
+        shared = self.opponents(team_a, before) & self.opponents(team_b, before)
+        shared.discard(normalize_key(team_a))
+        shared.discard(normalize_key(team_b))
+        return shared
+
+
+def print_events(events: List[Dict]):
+    for event in events:
+        print(f"  {event['date']:<20} {event.get('time', ''):<9} {' / '.join(event['teams'] + event['names'])}")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="League-wide schedule index")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = subparsers.add_parser('ingest', help="Fetch every league team's schedule")
+    ingest_parser.add_argument('--season-id', default=SEASON_ID)
+    ingest_parser.add_argument('--teams-file', help="JSON {team name: team ID} (defaults to season_config.LEAGUE_TEAMS)")
+
+    on_parser = subparsers.add_parser('on', help="Events on a date")
+    on_parser.add_argument('date', help="YYYY-MM-DD")
+
+    range_parser = subparsers.add_parser('range', help="Events between two dates")
+    range_parser.add_argument('start', help="YYYY-MM-DD")
+    range_parser.add_argument('end', help="YYYY-MM-DD")
+
+    shared_parser = subparsers.add_parser('shared', help="Opponents two teams have both faced")
+    shared_parser.add_argument('team_a')
+    shared_parser.add_argument('team_b')
+    shared_parser.add_argument('--before', help="Only events before this date (YYYY-MM-DD)")
+
+    args = parser.parse_args()
+    league = LeagueSchedule()
+
+    if args.command == 'ingest':
+        if args.teams_file:
+            with open(args.teams_file, 'r', encoding='utf-8') as f:
+                teams = json.load(f)
+        else:
+            from season_config import LEAGUE_TEAMS
+            teams = LEAGUE_TEAMS
+        added = league.ingest(teams, args.season_id)
+        league.save()
+        logger.info(f"{len(teams)} teams, {added} new events, {len(league.events)} total")
+    elif args.command == 'on':
+        print_events(league.on(date.fromisoformat(args.date)))
+    elif args.command == 'range':
+        print_events(league.between(date.fromisoformat(args.start), date.fromisoformat(args.end)))
+    elif args.command == 'shared':
+        before = date.fromisoformat(args.before) if args.before else None
+        for team in sorted(league.shared_opponents(args.team_a, args.team_b, before)):
+            print(f"  {team}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Live Meet Mode
+Polls TrackWrestling quickly during today's scheduled meets, backs off when nothing changes,
+and stops once the event window closes
+"""
+
+import argparse
+import logging
+import re
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from scraper_ajax_method import (
+    EST, OUTPUT_FILE, SEASON_ID, TEAM_ID, load_data, parse_event_date, save_data, scrape_team_schedule
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+MIN_INTERVAL = 30          # seconds between polls while results are changing
+MAX_INTERVAL = 300         # slowest poll once nothing has changed for a while
+BACKOFF = 1.5              # interval multiplier after a poll with no changes
+LEAD_TIME = timedelta(minutes=30)
+DEFAULT_START = "8:00 AM"  # used when the schedule says TBD
+DUAL_LENGTH = timedelta(hours=3)
+TOURNAMENT_LENGTH = timedelta(hours=10)
+TOURNAMENT_PATTERN = re.compile(r'tournament|invitational|classic|championship|tri[- ]?match|quad', re.I)
+
+Sink = Callable[[Dict, Dict], None]
+
+
+def event_window(match: Dict, day: date) -> Tuple[datetime, datetime]:
+    """Start/end of the window worth polling for one schedule entry"""
+    time_str = match.get('time') or DEFAULT_START
+    try:
+        start_time = datetime.strptime(time_str, '%I:%M %p').time()
+    except ValueError:
+        start_time = datetime.strptime(DEFAULT_START, '%I:%M %p').time()
+
+    start = datetime.combine(day, start_time, tzinfo=EST)
+    length = TOURNAMENT_LENGTH if TOURNAMENT_PATTERN.search(match.get('opponent', '')) else DUAL_LENGTH
+    return start - LEAD_TIME, start + length
+
+
+def todays_events(data: Dict, day: date) -> List[Dict]:
+    """Schedule entries that fall on the given day"""
+    return [m for m in data.get('schedule', []) if parse_event_date(m.get('date', '')) == day]
+
+
+def save_sink(data: Dict, diff: Dict) -> None:
+    """Default sink: data file, history store and change log (the API and live feed watch the file)"""
+    save_data(data, OUTPUT_FILE)
+
+
+class LiveMeetPoller:
+    """Adaptive poller for the meets on one day"""
+
+    def __init__(self, day: Optional[date] = None, sinks: Optional[List[Sink]] = None,
+                 min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL,
+                 team_id: str = TEAM_ID, season_id: str = SEASON_ID):
+        self.day = day or datetime.now(EST).date()
+        self.sinks = sinks if sinks is not None else [save_sink]
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.team_id = team_id
+        self.season_id = season_id
+        self.now: Callable[[], datetime] = lambda: datetime.now(EST)
+        self.sleep: Callable[[float], None] = time.sleep
+
+    def fetch_today(self, events: List[Dict]) -> Dict[str, Dict[str, List[Dict]]]:
+        """Fetch only what can change during today's meets: {section: {event_id: rows}} for what was fetched"""
+        from results_engine import ResultsEngine
+
+        schedule = scrape_team_schedule(self.team_id, self.season_id)
+        today = [m for m in schedule if parse_event_date(m.get('date', '')) == self.day] or events
+
+        engine = ResultsEngine(self.team_id, self.season_id)
+        fetched = engine.fetch_events([m for m in today if m.get('event_id')])
+        if fetched:
+            engine.save_state()
+
+        schedule_by_event: Dict[str, List[Dict]] = {}
+        for match in today:
+            schedule_by_event.setdefault(match.get('event_id') or '', []).append(match)
+        return {'schedule': schedule_by_event, 'results': fetched}
+
+    def merge(self, data: Dict, fresh: Dict[str, Dict[str, List[Dict]]]) -> Dict:
+        """Replace only the rows of events fetched on this poll, leaving everything else untouched
+
+        Rows without an event ID (keyed '') are matched by date, since nothing else identifies them.
+        """
+        merged = dict(data)
+        for section, by_event in fresh.items():
+            if not by_event:
+                continue
+
+            def replaced(row: Dict) -> bool:
+                event_id = row.get('event_id') or ''
+                if event_id:
+                    return event_id in by_event
+                return '' in by_event and parse_event_date(row.get('date', '')) == self.day
+
+            kept = [r for r in data.get(section, []) if not replaced(r)]
+            merged[section] = kept + [row for rows in by_event.values() for row in rows]
+            if section == 'schedule':
+                merged[section].sort(key=lambda m: parse_event_date(m.get('date', '')) or date.max)
+        merged['metadata'] = dict(data.get('metadata', {}), last_updated=self.now().isoformat())
+        return merged
+
+    def poll_once(self, data: Dict) -> Tuple[Dict, Dict]:
+        """One poll; returns (data, diff) and pushes to the sinks if anything changed"""
+        from change_log import diff_data
+
+        fresh = self.fetch_today(todays_events(data, self.day))
+        candidate = self.merge(data, fresh)
+        diff = diff_data(data, candidate)
+        if not diff:
+            return data, diff
+
+        for sink in self.sinks:
+            try:
+                sink(candidate, diff)
+            except Exception as e:
+                logger.warning(f"Sink {getattr(sink, '__name__', sink)} failed: {e}")
+        return candidate, diff
+
+    def run(self, data: Optional[Dict] = None) -> int:
+        """Poll until the last event window closes; returns the number of polls made"""
+        data = data if data is not None else (load_data(OUTPUT_FILE) or {})
+        events = todays_events(data, self.day)
+        if not events:
+            logger.info(f"No meets scheduled on {self.day}; nothing to poll")
+            return 0
+
+        windows = [event_window(m, self.day) for m in events]
+        start = min(w[0] for w in windows)
+        end = max(w[1] for w in windows)
+
+        logger.info("="*60)
+        logger.info(f"LIVE MODE: {len(events)} event(s) on {self.day}")
+        for match, (w_start, w_end) in zip(events, windows):
+            logger.info(f"  {match['opponent']}: {w_start:%I:%M %p} - {w_end:%I:%M %p}")
+        logger.info("="*60)
+
+        wait = (start - self.now()).total_seconds()
+        if wait > 0:
+            logger.info(f"Waiting {wait/60:.0f} minutes for the first event window")
+            self.sleep(wait)
+
+        polls = 0
+        interval = self.min_interval
+        while self.now() < end:
+            data, diff = self.poll_once(data)
+            polls += 1
+
+            if diff:
+                interval = self.min_interval
+                logger.info(f"Poll {polls}: changes in {', '.join(diff)}; next poll in {interval:.0f}s")
+            else:
+                interval = min(interval * BACKOFF, self.max_interval)
+                logger.info(f"Poll {polls}: no changes; next poll in {interval:.0f}s")
+
+            remaining = (end - self.now()).total_seconds()
+            if remaining <= 0:
+                break
+            self.sleep(min(interval, remaining))
+
+        logger.info(f"Event window closed after {polls} polls")
+        return polls
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Poll TrackWrestling during today's meets")
+    parser.add_argument('--date', help="Meet day (YYYY-MM-DD), defaults to today")
+    parser.add_argument('--min-interval', type=float, default=MIN_INTERVAL)
+    parser.add_argument('--max-interval', type=float, default=MAX_INTERVAL)
+    args = parser.parse_args()
+
+    day = date.fromisoformat(args.date) if args.date else None
+    poller = LiveMeetPoller(day, min_interval=args.min_interval, max_interval=args.max_interval)
+    poller.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Data API
+ASGI app serving roster/schedule/results from an in-memory cache of the scraper output
+
+Run locally:  uvicorn main:app --port 8000
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from scraper_ajax_method import EST, HOME_LOCATION, OUTPUT_FILE, parse_event_date
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+DATA_FILE = os.environ.get('WRESTLING_DATA_FILE', OUTPUT_FILE)
+CHECK_INTERVAL = float(os.environ.get('DATA_CHECK_INTERVAL', '1.0'))  # seconds between stat() calls
+REFRESH_TTL = float(os.environ.get('REFRESH_TTL_SECONDS', '3600'))  # 0 disables background scrapes
+REFRESH_RETRY = float(os.environ.get('REFRESH_RETRY_SECONDS', '300'))  # wait after a failed refresh
+LIVE_REFRESH_TTL = float(os.environ.get('LIVE_REFRESH_TTL_SECONDS', '120'))  # TTL while live clients are connected
+LIVE_BUFFER = 500          # events kept for Last-Event-ID resume
+LIVE_QUEUE_SIZE = 100      # per-subscriber backlog before the client is dropped
+LIVE_KEEPALIVE = 15.0      # seconds between SSE comment pings
+GZIP_MIN_SIZE = 1024
+FILTER_CACHE_SIZE = 256
+
+SECTIONS = ('metadata', 'roster', 'schedule', 'results')
+FILTER_PARAMS = ('from', 'to', 'home_away', 'weight_class')
+# Filters each endpoint honours; any other filter param is a 400 rather than silently ignored
+ENDPOINT_FILTERS = {
+    '/api/roster': ('weight_class',),
+    '/api/schedule': ('from', 'to', 'home_away'),
+    '/api/results': FILTER_PARAMS,
+}
+SEARCH_LIMIT = 25
+
+
+class Response:
+    """Pre-encoded response body with its strong ETags and gzip variant"""
+
+    __slots__ = ('body', 'etag', 'gzip_body', 'gzip_etag')
+
+    def __init__(self, payload):
+        self.body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'.encode('ascii')
+        if len(self.body) >= GZIP_MIN_SIZE:
+            self.gzip_body = gzip.compress(self.body, compresslevel=6, mtime=0)
+            self.gzip_etag = f'"{digest}-gzip"'.encode('ascii')
+        else:
+            self.gzip_body = None
+            self.gzip_etag = None
+
+
+class Snapshot:
+    """One loaded version of the data file; replaced wholesale, never mutated"""
+
+    def __init__(self, data: Dict, digest: str):
+        self.data = data
+        self.digest = digest
+        self.responses = {'/api/data': Response(data)}
+        for section in SECTIONS:
+            self.responses[f'/api/{section}'] = Response(data.get(section, [] if section != 'metadata' else {}))
+        self.filtered: OrderedDict = OrderedDict()
+        self.updated_at = self._updated_at(data)
+        self._search_index = None
+
+        # Parse dates once so filtered requests only compare ordinals
+        self.dated: Dict[str, List[Tuple[Optional[date], bool, Dict]]] = {}
+        for section in ('schedule', 'results'):
+            self.dated[section] = [
+                (parse_event_date(r.get('date', '')), r.get('location') == HOME_LOCATION, r)
+                for r in data.get(section, [])
+            ]
+
+    @property
+    def search_index(self):
+        """Saved league-wide name index plus this snapshot's names, built on first search"""
+        if self._search_index is None:
+            from name_search import NameIndex
+            index = NameIndex.load()
+            index.add_data(self.data)
+            self._search_index = index
+        return self._search_index
+
+    @staticmethod
+    def _updated_at(data: Dict) -> float:
+        """Epoch seconds of the scrape, or 0 (always stale) if unknown"""
+        try:
+            updated = datetime.fromisoformat(data.get('metadata', {}).get('last_updated', ''))
+        except (TypeError, ValueError):
+            return 0.0
+        if updated.tzinfo is None:
+            updated = updated.replace(tzinfo=EST)
+        return updated.timestamp()
+
+
+class DataCache:
+    """Holds the current Snapshot and reloads it only when the file fingerprint changes"""
+
+    def __init__(self, path: str = DATA_FILE):
+        self.path = path
+        self.snapshot: Optional[Snapshot] = None
+        self.fingerprint: Optional[Tuple[int, int, int]] = None
+        self.checked_at = 0.0
+        self.listeners: List[Callable[[Optional[Snapshot], Snapshot], None]] = []
+
+    def get(self) -> Optional[Snapshot]:
+        now = time.monotonic()
+        if self.snapshot is None or now - self.checked_at >= CHECK_INTERVAL:
+            self.checked_at = now
+            self.refresh()
+        return self.snapshot
+
+    def refresh(self) -> bool:
+        """Reload if the file changed; returns True when a new snapshot was swapped in"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+
+        fingerprint = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if fingerprint == self.fingerprint:
+            return False
+
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+        self.fingerprint = fingerprint
+
+        # A touched-but-identical file keeps the same snapshot (and ETags)
+        digest = hashlib.sha256(raw).hexdigest()
+        if self.snapshot is not None and digest == self.snapshot.digest:
+            return False
+
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            logger.error(f"Could not parse {self.path}: {e}")
+            return False
+
+        self._swap(Snapshot(data, digest))
+        logger.info(f"Loaded {self.path} ({len(raw)} bytes, {digest[:12]})")
+        return True
+
+    def install(self, snapshot: Snapshot):
+        """Swap in a snapshot built elsewhere (one reference assignment, so readers never see a mix)"""
+        try:
+            stat = os.stat(self.path)
+            self.fingerprint = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            pass
+        self._swap(snapshot)
+
+    def _swap(self, snapshot: Snapshot):
+        """Replace the current snapshot (one reference assignment) and notify listeners"""
+        previous, self.snapshot = self.snapshot, snapshot
+        for listener in self.listeners:
+            try:
+                listener(previous, snapshot)
+            except Exception as e:
+                logger.error(f"Snapshot listener failed: {e}")
+
+
+def merge_scrape(previous: Optional[Dict], fresh: Dict) -> Dict:
+    """Keep the previous section when a scrape came back empty (the scrape functions return [] on failure)"""
+    if not previous:
+        return fresh
+    merged = dict(fresh)
+    for section in ('roster', 'schedule', 'results'):
+        if not fresh.get(section) and previous.get(section):
+            logger.warning(f"Refresh returned no {section}; keeping cached {section}")
+            merged[section] = previous[section]
+    return merged
+
+
+def build_snapshot(data: Dict) -> Snapshot:
+    """Serialize exactly what save_data writes so the digest matches the file"""
+    raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return Snapshot(data, hashlib.sha256(raw).hexdigest())
+
+
+def refresh_dataset(previous: Optional[Dict]) -> Optional[Snapshot]:
+    """Blocking scrape + save, run in a worker thread"""
+    from scraper_ajax_method import SEASON_ID, TEAM_ID, save_data, scrape_all
+
+    metadata = (previous or {}).get('metadata', {})
+    fresh = scrape_all(metadata.get('team_id', TEAM_ID), metadata.get('season_id', SEASON_ID), previous=previous)
+    if not fresh['roster'] and not fresh['schedule']:
+        logger.warning("Refresh returned no data; serving cached dataset")
+        return None
+
+    data = merge_scrape(previous, fresh)
+    save_data(data, cache.path)
+    return build_snapshot(data)
+
+
+class Refresher:
+    """Stale-while-revalidate: requests never wait; one background scrape runs at a time"""
+
+    def __init__(self, ttl: float = REFRESH_TTL, retry: float = REFRESH_RETRY):
+        self.ttl = ttl
+        self.retry = retry
+        self.task: Optional[asyncio.Task] = None
+        self.last_attempt = 0.0
+
+    def is_stale(self, snapshot: Snapshot) -> bool:
+        if self.ttl <= 0:
+            return False
+        ttl = min(self.ttl, LIVE_REFRESH_TTL) if live_feed.subscribers else self.ttl
+        return time.time() - snapshot.updated_at >= ttl
+
+    def maybe_refresh(self, snapshot: Snapshot) -> bool:
+        """Start a refresh if the data is stale; concurrent callers share the running one"""
+        if self.task is not None or not self.is_stale(snapshot):
+            return False
+        if time.time() - self.last_attempt < self.retry:
+            return False
+
+        # Runs on the event loop thread, so check-then-set is race free
+        self.last_attempt = time.time()
+        self.task = asyncio.get_running_loop().create_task(self._run(snapshot))
+        return True
+
+    async def _run(self, snapshot: Snapshot):
+        started = time.monotonic()
+        logger.info("Data is stale; refreshing in the background")
+        try:
+            loop = asyncio.get_running_loop()
+            fresh = await loop.run_in_executor(None, refresh_dataset, snapshot.data)
+            if fresh is not None:
+                cache.install(fresh)
+                logger.info(f"Refreshed dataset in {time.monotonic() - started:.1f}s ({fresh.digest[:12]})")
+        except Exception as e:
+            logger.error(f"Background refresh failed: {e}")
+        finally:
+            self.task = None
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+
+
+def parse_iso(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return parse_event_date(value)
+
+
+def filter_errors(query: Dict[str, str]) -> Dict[str, str]:
+    """Why each malformed filter value can't be used (empty if they all parse)"""
+    errors = {}
+    for param in ('from', 'to'):
+        if param in query and parse_iso(query[param]) is None:
+            errors[param] = f"{query[param]!r} is not a date (use YYYY-MM-DD)"
+    if 'home_away' in query and query['home_away'].lower() not in ('home', 'away'):
+        errors['home_away'] = f"{query['home_away']!r} is not 'home' or 'away'"
+    if 'weight_class' in query and not any(query['weight_class'].split(',')):
+        errors['weight_class'] = "expected one or more comma-separated weight classes"
+    return errors
+
+
+def filter_dated(rows: List[Tuple[Optional[date], bool, Dict]], query: Dict[str, str]) -> List[Dict]:
+    """Apply date range, home/away and weight class filters to schedule or results rows"""
+    start = parse_iso(query.get('from'))
+    end = parse_iso(query.get('to'))
+    home_away = query.get('home_away', '').lower()
+    weight_classes = set(filter(None, query.get('weight_class', '').split(',')))
+
+    matches = []
+    for event_date, is_home, record in rows:
+        if start and (event_date is None or event_date < start):
+            continue
+        if end and (event_date is None or event_date > end):
+            continue
+        if home_away == 'home' and not is_home:
+            continue
+        if home_away == 'away' and is_home:
+            continue
+        if weight_classes and str(record.get('weight_class', '')) not in weight_classes:
+            continue
+        matches.append(record)
+    return matches
+
+
+def build_filtered(snapshot: Snapshot, path: str, query: Dict[str, str]) -> Optional[Response]:
+    """Filtered variant of a section response, memoized per snapshot"""
+    key = (path, tuple(sorted(query.items())))
+    response = snapshot.filtered.get(key)
+    if response is not None:
+        snapshot.filtered.move_to_end(key)
+        return response
+
+    if path == '/api/roster':
+        weight_classes = set(filter(None, query.get('weight_class', '').split(',')))
+        payload = [
+            w for w in snapshot.data.get('roster', [])
+            if not weight_classes or str(w.get('weight_class', '')) in weight_classes
+        ]
+    elif path in ('/api/schedule', '/api/results'):
+        payload = filter_dated(snapshot.dated[path.rsplit('/', 1)[1]], query)
+    else:
+        return None
+
+    response = Response(payload)
+    snapshot.filtered[key] = response
+    if len(snapshot.filtered) > FILTER_CACHE_SIZE:
+        snapshot.filtered.popitem(last=False)
+    return response
+
+
+def build_search(snapshot: Snapshot, params: Dict[str, List[str]]) -> Response:
+    """Name search results, memoized per snapshot alongside the filtered responses"""
+    query = params.get('q', [''])[-1].strip()
+    kind = params.get('kind', [''])[-1] or None
+    try:
+        limit = max(1, min(int(params.get('limit', ['10'])[-1]), SEARCH_LIMIT))
+    except ValueError:
+        limit = 10
+
+    key = ('/api/search', query.lower(), kind, limit)
+    response = snapshot.filtered.get(key)
+    if response is not None:
+        snapshot.filtered.move_to_end(key)
+        return response
+
+    response = Response(snapshot.search_index.search(query, kind, limit) if query else [])
+    snapshot.filtered[key] = response
+    if len(snapshot.filtered) > FILTER_CACHE_SIZE:
+        snapshot.filtered.popitem(last=False)
+    return response
+
+
+def accepts_gzip(header: bytes) -> bool:
+    """Whether Accept-Encoding allows gzip, honouring q-values ("gzip;q=0" refuses it)"""
+    qualities = {}
+    for part in header.decode('latin-1').lower().split(','):
+        coding, _, params = part.partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip()] = quality
+    return qualities.get('gzip', qualities.get('*', 0.0)) > 0
+
+
+def etag_matches(header: bytes, etag: bytes) -> bool:
+    """If-None-Match check supporting lists and '*'"""
+    if header.strip() == b'*':
+        return True
+    return any(candidate.strip().removeprefix(b'W/') == etag for candidate in header.split(b','))
+
+
+class Subscriber:
+    """One connected SSE client"""
+
+    __slots__ = ('queue', 'dropped')
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=LIVE_QUEUE_SIZE)
+        self.dropped = False
+
+
+class LiveFeed:
+    """Fans schedule/results changes out to every SSE client from one upstream poll"""
+
+    def __init__(self):
+        self.events: deque = deque(maxlen=LIVE_BUFFER)  # (event_id, encoded bytes)
+        self.last_id = 0
+        self.subscribers: set = set()
+        self.watcher: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def encode(event_id: int, event: str, payload) -> bytes:
+        data = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+        return f"id: {event_id}\nevent: {event}\ndata: {data}\n\n".encode('utf-8')
+
+    def on_snapshot(self, previous: Optional[Snapshot], current: Snapshot):
+        """DataCache listener: publish what changed in schedule and results"""
+        if previous is None:
+            return
+        from change_log import diff_data
+
+        diff = diff_data(previous.data, current.data)
+        for section in ('schedule', 'results'):
+            if section in diff:
+                self.publish(section, diff[section])
+
+    def publish(self, event: str, payload):
+        self.last_id += 1
+        message = self.encode(self.last_id, event, payload)
+        self.events.append((self.last_id, message))
+
+        # Encoded once; every subscriber gets the same bytes
+        for subscriber in list(self.subscribers):
+            try:
+                subscriber.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow client: drop it, it will reconnect and resume from Last-Event-ID
+                subscriber.dropped = True
+                self.subscribers.discard(subscriber)
+        logger.info(f"Published live event {self.last_id} ({event}) to {len(self.subscribers)} clients")
+
+    def subscribe(self, last_event_id: Optional[int], snapshot: Snapshot) -> Tuple[Subscriber, List[bytes]]:
+        """Register a client and return the backlog it needs to catch up"""
+        subscriber = Subscriber()
+        self.subscribers.add(subscriber)
+        self.ensure_watcher()
+
+        oldest = self.events[0][0] if self.events else self.last_id + 1
+        if last_event_id is not None and last_event_id >= oldest - 1 and last_event_id <= self.last_id:
+            backlog = [message for event_id, message in self.events if event_id > last_event_id]
+        else:
+            # Unknown or expired position: start from the full current state
+            backlog = [self.encode(self.last_id, 'snapshot', {
+                'metadata': snapshot.data.get('metadata', {}),
+                'schedule': snapshot.data.get('schedule', []),
+                'results': snapshot.data.get('results', []),
+            })]
+        return subscriber, backlog
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    def ensure_watcher(self):
+        if self.watcher is None:
+            self.watcher = asyncio.get_running_loop().create_task(self._watch())
+
+    async def _watch(self):
+        """While anyone is listening, keep checking the data file and the refresh TTL"""
+        try:
+            while self.subscribers:
+                snapshot = cache.get()
+                if snapshot is not None:
+                    refresher.maybe_refresh(snapshot)
+                await asyncio.sleep(CHECK_INTERVAL)
+        finally:
+            self.watcher = None
+
+
+cache = DataCache()
+refresher = Refresher()
+live_feed = LiveFeed()
+cache.listeners.append(live_feed.on_snapshot)
+
+
+async def wait_for_disconnect(receive):
+    """Consume the (empty) request body and return once the client goes away"""
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return
+
+
+async def stream_live(scope, receive, send, snapshot: Snapshot, request_headers: Dict[bytes, bytes]):
+    """Server-sent events endpoint: /api/live"""
+    params = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    raw_id = request_headers.get(b'last-event-id', b'').decode('latin-1') or params.get('last_event_id', [''])[-1]
+    last_event_id = int(raw_id) if raw_id.isdigit() else None
+
+    subscriber, backlog = live_feed.subscribe(last_event_id, snapshot)
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [
+        (b'content-type', b'text/event-stream; charset=utf-8'),
+        (b'cache-control', b'no-cache'),
+        (b'access-control-allow-origin', b'*'),
+        (b'x-accel-buffering', b'no'),
+    ]})
+
+    disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+    try:
+        await send({'type': 'http.response.body', 'body': b'retry: 5000\n\n' + b''.join(backlog), 'more_body': True})
+        while not subscriber.dropped:
+            getter = asyncio.ensure_future(subscriber.queue.get())
+            done, _ = await asyncio.wait({getter, disconnected}, timeout=LIVE_KEEPALIVE,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                getter.cancel()
+                break
+            if getter in done:
+                message = getter.result()
+            else:
+                getter.cancel()
+                message = b': keepalive\n\n'
+            await send({'type': 'http.response.body', 'body': message, 'more_body': True})
+    finally:
+        live_feed.unsubscribe(subscriber)
+        if not disconnected.done():
+            disconnected.cancel()
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+
+async def send_json(send, status: int, response: Optional[Response], request_headers: Dict[bytes, bytes],
+                    head: bool = False, extra_headers: Optional[List] = None):
+    headers = [
+        (b'content-type', b'application/json; charset=utf-8'),
+        (b'cache-control', b'no-cache'),
+        (b'access-control-allow-origin', b'*'),
+        (b'vary', b'Accept-Encoding'),
+    ] + (extra_headers or [])
+
+    if response is None:
+        reason = {404: 'Not Found', 405: 'Method Not Allowed'}.get(status, 'Error')
+        body = json.dumps({'error': reason}).encode('utf-8')
+    else:
+        use_gzip = response.gzip_body is not None and accepts_gzip(request_headers.get(b'accept-encoding', b''))
+        etag = response.gzip_etag if use_gzip else response.etag
+        headers.append((b'etag', etag))
+
+        if_none_match = request_headers.get(b'if-none-match')
+        if if_none_match and etag_matches(if_none_match, etag):
+            await send({'type': 'http.response.start', 'status': 304, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        body = response.gzip_body if use_gzip else response.body
+        if use_gzip:
+            headers.append((b'content-encoding', b'gzip'))
+
+    headers.append((b'content-length', str(len(body)).encode('ascii')))
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': b'' if head else body})
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            snapshot = cache.get()
+            if snapshot is not None:
+                refresher.maybe_refresh(snapshot)
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await refresher.stop()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI entry point"""
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    request_headers = dict(scope['headers'])
+    method = scope['method']
+    path = scope['path'].rstrip('/') or '/'
+
+    if method not in ('GET', 'HEAD'):
+        await send_json(send, 405, None, request_headers, extra_headers=[(b'allow', b'GET, HEAD')])
+        return
+
+    if path == '/healthz':
+        snapshot = cache.get()
+        await send_json(send, 200 if snapshot else 503, Response({
+            'ok': snapshot is not None,
+            'data_file': cache.path,
+            'version': snapshot.digest[:12] if snapshot else None,
+            'refreshing': refresher.task is not None,
+        }), {})
+        return
+
+    snapshot = cache.get()
+    if snapshot is None:
+        await send_json(send, 503, Response({'error': f'{cache.path} not loaded'}), {})
+        return
+    refresher.maybe_refresh(snapshot)
+
+    if path == '/api/live' and method == 'GET':
+        await stream_live(scope, receive, send, snapshot, request_headers)
+        return
+
+    if path == '/':
+        path = '/api/data'
+
+    params = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    if path == '/api/search':
+        await send_json(send, 200, build_search(snapshot, params), request_headers, head=method == 'HEAD')
+        return
+
+    query = {k: params[k][-1] for k in FILTER_PARAMS if k in params}
+    if path not in snapshot.responses:
+        await send_json(send, 404, None, request_headers, head=method == 'HEAD')
+        return
+
+    unsupported = [k for k in query if k not in ENDPOINT_FILTERS.get(path, ())]
+    if unsupported:
+        await send_json(send, 400, Response({
+            'error': f"{path} does not support filtering by {', '.join(unsupported)}",
+            'supported': list(ENDPOINT_FILTERS.get(path, ())),
+        }), request_headers, head=method == 'HEAD')
+        return
+
+    errors = filter_errors(query)
+    if errors:
+        await send_json(send, 400, Response({
+            'error': f"Invalid value for {', '.join(errors)}",
+            'invalid': errors,
+        }), request_headers, head=method == 'HEAD')
+        return
+
+    response = (query and build_filtered(snapshot, path, query)) or snapshot.responses[path]
+
+    await send_json(send, 200, response, request_headers, head=method == 'HEAD')
+
+
+def main():
+    """Run the API with uvicorn"""
+    try:
+        import uvicorn
+    except ImportError:
+        logger.error("uvicorn not installed. Run: pip install uvicorn")
+        return
+
+    uvicorn.run("main:app", host="127.0.0.1", port=int(os.environ.get('PORT', '8000')))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Name Search
+Trigram index over wrestler and team names for typo-tolerant lookups ("Fitzpatrick, Dan" finds Daniel Fitzpatrick)
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import math
+import os
+import re
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from scraper_ajax_method import OUTPUT_FILE, TEAM_NAME, load_data
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+NAME_INDEX = 'data/name_index.json'
+MIN_SCORE = 0.45           # Dice similarity below this isn't a match
+DEFAULT_LIMIT = 10
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, drop punctuation and flip "Last, First" to first-last order"""
+    name = (name or '').strip()
+    if name.count(',') == 1:
+        last, first = name.split(',')
+        name = f"{first} {last}"
+    return ' '.join(re.sub(r"[^\w\s]", ' ', name.lower()).split())
+
+
+def trigrams(name: str) -> List[str]:
+    """Distinct trigrams of each word padded with '$', so word order doesn't matter"""
+    grams = set()
+    for word in normalize_name(name).split():
+        padded = f"${word}$"
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return sorted(grams)
+
+
+class NameIndex:
+    """Inverted index from trigram to document ids, ranked by Dice similarity"""
+
+    def __init__(self):
+        self.docs: List[Dict] = []
+        self.sizes: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+        self.keys: Dict[Tuple[str, str, str], int] = {}
+
+    def add(self, kind: str, name: str, team: str = '', **extra) -> Optional[int]:
+        """Index one wrestler or team (once per kind/name/team); returns its id"""
+        if not name:
+            return None
+        key = (kind, normalize_name(name), normalize_name(team))
+        if key in self.keys:
+            doc = self.docs[self.keys[key]]
+            doc.update({k: v for k, v in extra.items() if v and not doc.get(k)})
+            return self.keys[key]
+
+        doc_id = len(self.docs)
+        grams = trigrams(name)
+        self.docs.append({'kind': kind, 'name': name, 'team': team,
+                          **{k: v for k, v in extra.items() if v}})
+        self.sizes.append(len(grams))
+        self.keys[key] = doc_id
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(doc_id)
+        return doc_id
+
+    def add_roster(self, roster: Iterable[Dict], team: str):
+        self.add('team', team)
+        for wrestler in roster:
+            self.add('wrestler', wrestler.get('name', ''), team, weight_class=wrestler.get('weight_class', ''))
+
+    def add_results(self, results: Iterable[Dict]):
+        for bout in results:
+            for side in ('winner', 'loser'):
+                team = bout.get(f'{side}_team', '')
+                self.add('team', team)
+                self.add('wrestler', bout.get(side, ''), team, weight_class=bout.get('weight_class', ''))
+
+    def add_data(self, data: Dict):
+        """Our roster and every wrestler and team in the bout results"""
+        self.add_roster(data.get('roster', []), TEAM_NAME)
+        self.add_results(data.get('results', []))
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = DEFAULT_LIMIT,
+               min_score: float = MIN_SCORE) -> List[Dict]:
+        """Best matches first, each with its similarity score"""
+        grams = trigrams(query)
+        if not grams:
+            return []
+
+        # A doc scoring >= min_score shares at least `need` grams with the query, so it must contain
+        # one of the (size - need + 1) rarest ones: only those postings generate candidates
+        size = len(grams)
+        need = max(1, math.ceil(min_score * size / (2.0 - min_score)))
+        grams.sort(key=lambda gram: len(self.postings.get(gram, ())))
+        probe, rest = grams[:size - need + 1], [self.postings.get(gram, []) for gram in grams[size - need + 1:]]
+
+        # Counter's update loop runs in C, which keeps the probe postings cheap
+        overlap = Counter(chain.from_iterable(self.postings.get(gram, ()) for gram in probe))
+
+        scored = []
+        for doc_id, shared in overlap.items():
+            if kind is not None and self.docs[doc_id]['kind'] != kind:
+                continue
+            if 2.0 * (shared + len(rest)) < min_score * (size + self.sizes[doc_id]):
+                continue
+            # Postings are in id order, so the common grams are checked by bisection
+            for posting in rest:
+                i = bisect_left(posting, doc_id)
+                if i < len(posting) and posting[i] == doc_id:
+                    shared += 1
+            score = 2.0 * shared / (size + self.sizes[doc_id])
+            if score >= min_score:
+                scored.append((score, doc_id))
+
+        best = heapq.nsmallest(limit, scored, key=lambda item: (-item[0], item[1]))
+        return [{'score': round(score, 3), **self.docs[doc_id]} for score, doc_id in best]
+
+    def save(self, path: str = NAME_INDEX):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'docs': self.docs, 'sizes': self.sizes, 'postings': self.postings},
+                      f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = NAME_INDEX) -> 'NameIndex':
+        """Saved index as-is (no re-tokenizing), or an empty one"""
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            index.docs, index.sizes, index.postings = stored['docs'], stored['sizes'], stored['postings']
+            index.keys = {(d['kind'], normalize_name(d['name']), normalize_name(d.get('team', ''))): i
+                          for i, d in enumerate(index.docs)}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not read name index: {e}")
+            return cls()
+        return index
+
+
+def build_index(paths: List[str], scouting: bool = True) -> NameIndex:
+    """Index data files plus any scouted opponent rosters"""
+    index = NameIndex()
+    for path in paths:
+        index.add_data(load_data(path) or {})
+
+    if scouting:
+        from scouting import RosterCache
+        for entry in RosterCache().teams.values():
+            index.add_roster(entry.get('roster', []), entry.get('team', ''))
+    return index
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Fuzzy search over wrestler and team names")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="Rebuild data/name_index.json")
+    build_parser.add_argument('--input', nargs='+', default=[OUTPUT_FILE],
+                              help="Data files to index (e.g. every team in the league)")
+
+    find_parser = subparsers.add_parser('find', help="Search names")
+    find_parser.add_argument('query')
+    find_parser.add_argument('--kind', choices=['wrestler', 'team'])
+    find_parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT)
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        index = build_index(args.input)
+        index.save()
+        logger.info(f"Indexed {len(index.docs)} names ({len(index.postings)} trigrams) into {NAME_INDEX}")
+        return
+
+    index = NameIndex.load()
+    if not index.docs:
+        index = build_index([OUTPUT_FILE])
+    for match in index.search(args.query, args.kind, args.limit):
+        team = f" ({match['team']})" if match.get('team') else ''
+        weight = f" {match['weight_class']}" if match.get('weight_class') else ''
+        print(f"  {match['score']:.2f}  {match['kind']:<8} {match['name']}{team}{weight}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Ratings
+Elo ratings for every wrestler in the results, updated one rating period (meet day) at a time
+"""
+
+import argparse
+import json
+import logging
+import os
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from records import wrestler_key
+from scraper_ajax_method import OUTPUT_FILE, RATINGS_STATE, load_data, parse_event_date, weight_sort_key
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+SCALE = 400.0
+MIN_BOUTS = 3              # bouts needed before a wrestler shows up in rankings
+
+
+def expected(rating: float, opponent: float) -> float:
+    return 1.0 / (1.0 + 10 ** ((opponent - rating) / SCALE))
+
+
+def rated_bouts(results: List[Dict], skip: Optional[set] = None) -> List[Tuple[date, Dict]]:
+    """Bouts that count toward ratings (minus any bout_ids in skip), with their dates, in date order"""
+    days: Dict[str, Optional[date]] = {}
+    dated = []
+    for bout in results:
+        if bout.get('win_type') == 'NC' or (skip and bout.get('bout_id') in skip):
+            continue
+        text = bout.get('date', '')
+        if text not in days:
+            days[text] = parse_event_date(text)
+        if days[text] is not None:
+            dated.append((days[text], bout))
+    dated.sort(key=lambda item: item[0])
+    return dated
+
+
+def group_periods(dated: List[Tuple[date, Dict]]) -> List[Tuple[date, List[Dict]]]:
+    periods: Dict[date, List[Dict]] = defaultdict(list)
+    for day, bout in dated:
+        periods[day].append(bout)
+    return sorted(periods.items())
+
+
+class RatingEngine:
+    """Checkpointed Elo ratings; each period is rated against the ratings from before it"""
+
+    def __init__(self, state_path: str = RATINGS_STATE):
+        self.state_path = state_path
+        self.ratings: Dict[str, Dict] = {}
+        self.applied: set = set()
+        self.through: Optional[date] = None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.ratings = state.get('ratings', {})
+            self.applied = set(state.get('applied', []))
+            self.through = date.fromisoformat(state['through']) if state.get('through') else None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not read ratings state, recomputing: {e}")
+            self.ratings, self.applied, self.through = {}, set(), None
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'through': self.through.isoformat() if self.through else None,
+                'applied': sorted(self.applied),
+                'ratings': self.ratings,
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, self.state_path)
+
+    def _entry(self, name: str, team: str) -> Dict:
+        key = wrestler_key(name, team)
+        entry = self.ratings.get(key)
+        if entry is None:
+            entry = {'name': name, 'team': team, 'rating': INITIAL_RATING, 'bouts': 0, 'weight_class': ''}
+            self.ratings[key] = entry
+        return entry
+
+    def _touch(self, bout: Dict, day: date):
+        """Bookkeeping shared by the incremental and batch paths"""
+        weight = bout.get('weight_class', '')
+        for name, team in ((bout.get('winner', ''), bout.get('winner_team', '')),
+                           (bout.get('loser', ''), bout.get('loser_team', ''))):
+            entry = self._entry(name, team)
+            entry['bouts'] += 1
+            entry['weight_class'] = weight or entry['weight_class']
+        self.applied.add(bout.get('bout_id', ''))
+        self.through = max(self.through or day, day)
+
+    def apply_period(self, day: date, bouts: List[Dict]):
+        """Rate one period: expectations use the ratings from before the period"""
+        deltas: Dict[int, List] = {}
+        for bout in bouts:
+            winner = self._entry(bout.get('winner', ''), bout.get('winner_team', ''))
+            loser = self._entry(bout.get('loser', ''), bout.get('loser_team', ''))
+            change = K_FACTOR * (1.0 - expected(winner['rating'], loser['rating']))
+            deltas.setdefault(id(winner), [winner, 0.0])[1] += change
+            deltas.setdefault(id(loser), [loser, 0.0])[1] -= change
+
+        for entry, change in deltas.values():
+            entry['rating'] += change
+        for bout in bouts:
+            self._touch(bout, day)
+
+    def update(self, results: List[Dict]) -> int:
+        """Apply bouts not seen before; returns how many were applied"""
+        new = rated_bouts(results, skip=self.applied)
+        if not new:
+            return 0
+
+        # A late result for an already-rated period can't be replayed in order; start over
+        if self.through is not None and new[0][0] <= self.through:
+            logger.info(f"New bouts dated on or before {self.through}; recomputing all ratings")
+            self.recompute(results)
+            return len(new)
+
+        for day, bouts in group_periods(new):
+            self.apply_period(day, bouts)
+        return len(new)
+
+    def recompute(self, results: List[Dict]):
+        """Rebuild from scratch, vectorized across all bouts in each period"""
+        try:
+            import numpy as np
+        except ImportError:
+            logger.warning("numpy not installed, recomputing one bout at a time. Run: pip install numpy")
+            self.ratings, self.applied, self.through = {}, set(), None
+            for day, bouts in group_periods(rated_bouts(results)):
+                self.apply_period(day, bouts)
+            return
+
+        self.ratings, self.applied, self.through = {}, set(), None
+        periods = group_periods(rated_bouts(results))
+
+        ids: Dict[str, int] = {}
+        winners_by_period, losers_by_period = [], []
+        for day, bouts in periods:
+            for bout in bouts:
+                self._touch(bout, day)
+            winners_by_period.append(np.fromiter(
+                (ids.setdefault(wrestler_key(b.get('winner', ''), b.get('winner_team', '')), len(ids))
+                 for b in bouts), dtype=np.int64, count=len(bouts)))
+            losers_by_period.append(np.fromiter(
+                (ids.setdefault(wrestler_key(b.get('loser', ''), b.get('loser_team', '')), len(ids))
+                 for b in bouts), dtype=np.int64, count=len(bouts)))
+
+        ratings = np.full(len(ids), INITIAL_RATING)
+        for winners, losers in zip(winners_by_period, losers_by_period):
+            change = K_FACTOR * (1.0 - 1.0 / (1.0 + 10 ** ((ratings[losers] - ratings[winners]) / SCALE)))
+            ratings += (np.bincount(winners, weights=change, minlength=len(ids))
+                        - np.bincount(losers, weights=change, minlength=len(ids)))
+
+        for key, index in ids.items():
+            self.ratings[key]['rating'] = float(ratings[index])
+
+    def rating_for(self, name: str, team: str) -> Optional[Dict]:
+        """A wrestler's entry, matching any team spelling that contains the given team name"""
+        entry = self.ratings.get(wrestler_key(name, team))
+        if entry is not None:
+            return entry
+        name_key = wrestler_key(name, '')
+        team_key = wrestler_key('', team)[1:]
+        matches = [e for key, e in self.ratings.items() if key.startswith(name_key) and team_key in key[len(name_key):]]
+        return max(matches, key=lambda e: e['bouts']) if matches else None
+
+    def rankings(self, weight_class: Optional[str] = None, team: Optional[str] = None,
+                 min_bouts: int = MIN_BOUTS) -> Dict[str, List[Dict]]:
+        """{weight_class: wrestlers by rating}, using each wrestler's most recent weight"""
+        by_weight: Dict[str, List[Dict]] = defaultdict(list)
+        for entry in self.ratings.values():
+            if entry['bouts'] < min_bouts:
+                continue
+            if weight_class and entry['weight_class'] != weight_class:
+                continue
+            if team and team.lower() not in entry['team'].lower():
+                continue
+            by_weight[entry['weight_class']].append(entry)
+
+        return {
+            weight: sorted(entries, key=lambda e: -e['rating'])
+            for weight, entries in sorted(by_weight.items(), key=lambda item: weight_sort_key(item[0]))
+        }
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Elo ratings and rankings by weight class")
+    parser.add_argument('--input', nargs='+', default=[OUTPUT_FILE],
+                        help="Data files whose results to rate (e.g. every team in the league)")
+    parser.add_argument('--recompute', action='store_true', help="Rebuild ratings from every bout")
+    parser.add_argument('--weight', help="Only this weight class")
+    parser.add_argument('--team', help="Only wrestlers whose team contains this text")
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--min-bouts', type=int, default=MIN_BOUTS)
+    args = parser.parse_args()
+
+    bouts = {}
+    for path in args.input:
+        for bout in (load_data(path) or {}).get('results', []):
+            bouts.setdefault(bout.get('bout_id') or id(bout), bout)
+    results = list(bouts.values())
+
+    engine = RatingEngine()
+    if args.recompute:
+        engine.recompute(results)
+    else:
+        applied = engine.update(results)
+        logger.info(f"Applied {applied} new bouts (rated through {engine.through})")
+    engine.save()
+
+    for weight, entries in engine.rankings(args.weight, args.team, args.min_bouts).items():
+        print(f"\n{weight} lbs")
+        for rank, entry in enumerate(entries[:args.top], 1):
+            print(f"  {rank:>2}. {entry['name']:<28} {entry['team']:<24} {entry['rating']:7.1f} ({entry['bouts']} bouts)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Raw Archive
+Keeps every raw AJAX/HTML response content-addressed and compressed, and re-runs the current parsers over it offline
+"""
+
+import argparse
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from scraper_ajax_method import EST, OUTPUT_FILE, SEASON_ID, TEAM_ID, TEAM_NAME, save_data
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+ARCHIVE_DIR = 'data/raw'
+ARCHIVE_ENABLED = os.environ.get('RAW_ARCHIVE', '0') == '1'
+MAX_PENDING = 256          # queued responses; past this, fetches wait for the writer rather than drop data
+REPARSED_FILE = 'data/reparsed.json'
+# Cache-busting and session parameters that would make every fetch of the same page look new
+VOLATILE_PARAMS = {'TIM', 'RANDOM', 'twSessionId'}
+
+_lock = threading.Lock()
+
+
+def load_zstd():
+    """zstandard module, or None (gzip is used instead)"""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def normalize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in VOLATILE_PARAMS]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+def decode_rows(body: str) -> List:
+    """JSON rows from an AjaxFunctions response (which may arrive wrapped in quotes)"""
+    if body.startswith('"') and body.endswith('"'):
+        body = body[1:-1]
+    return json.loads(body)
+
+
+class RawArchive:
+    """Blobs under objects/ named by SHA-256, plus an append-only index.jsonl of (time, url, kind, meta, hash)"""
+
+    def __init__(self, directory: str = ARCHIVE_DIR):
+        self.directory = directory
+        self.index_path = os.path.join(directory, 'index.jsonl')
+
+    def blob_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.directory, 'objects', digest[:2], f"{digest[2:]}.{codec}")
+
+    def put(self, kind: str, url: str, body: str, fetched_at: Optional[str] = None, **meta) -> str:
+        """Store a response (once per distinct content) and index this fetch; returns the hash"""
+        data = body.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        zstd = load_zstd()
+        codec = 'zst' if zstd else 'gz'
+
+        with _lock:
+            existing = next((c for c in ('zst', 'gz') if os.path.exists(self.blob_path(digest, c))), None)
+            if existing:
+                codec = existing
+            else:
+                path = self.blob_path(digest, codec)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                packed = zstd.ZstdCompressor(level=10).compress(data) if zstd else gzip.compress(data, mtime=0)
+                with open(f"{path}.tmp", 'wb') as f:
+                    f.write(packed)
+                os.replace(f"{path}.tmp", path)
+
+            entry = {
+                'fetched_at': fetched_at or datetime.now(EST).isoformat(),
+                'kind': kind,
+                'url': normalize_url(url),
+                'sha256': digest,
+                'codec': codec,
+                'size': len(data),
+                'meta': meta,
+            }
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        return digest
+
+    def get(self, digest: str, codec: str) -> str:
+        with open(self.blob_path(digest, codec), 'rb') as f:
+            packed = f.read()
+        if codec == 'zst':
+            zstd = load_zstd()
+            if zstd is None:
+                raise RuntimeError("zstandard not installed. Run: pip install zstandard")
+            return zstd.ZstdDecompressor().decompress(packed).decode('utf-8')
+        return gzip.decompress(packed).decode('utf-8')
+
+    def entries(self, kind: Optional[str] = None, url: Optional[str] = None,
+                since: Optional[str] = None, until: Optional[str] = None) -> List[Dict]:
+        """Index entries in fetch order, filtered by kind, URL (substring) and ISO time range"""
+        if not os.path.exists(self.index_path):
+            return []
+        matches = []
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if kind and entry['kind'] != kind:
+                    continue
+                if url and url not in entry['url']:
+                    continue
+                if since and entry['fetched_at'] < since:
+                    continue
+                if until and entry['fetched_at'] > until:
+                    continue
+                matches.append(entry)
+        return matches
+
+    def latest(self, entries: Iterable[Dict]) -> List[Dict]:
+        """The newest fetch of each distinct request (kind + URL, plus the frame for browser pages)"""
+        newest: Dict[Tuple[str, str, str], Dict] = {}
+        for entry in entries:
+            newest[(entry['kind'], entry['url'], entry['meta'].get('source', ''))] = entry
+        return list(newest.values())
+
+
+class ArchiveWriter:
+    """Hashes, compresses and indexes responses on one background thread so fetches only enqueue"""
+
+    def __init__(self, store: Optional[RawArchive] = None):
+        self.store = store or RawArchive()
+        self.queue: queue.Queue = queue.Queue(maxsize=MAX_PENDING)
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def submit(self, kind: str, url: str, body: str, meta: Dict):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.writer, name='raw-archive', daemon=True)
+                self.thread.start()
+                atexit.register(self.close)
+        # The fetch time is taken now, not when the writer gets to it
+        self.queue.put((kind, url, body, meta, datetime.now(EST).isoformat()))
+
+    def writer(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            kind, url, body, meta, fetched_at = item
+            try:
+                self.store.put(kind, url, body, fetched_at=fetched_at, **meta)
+            except Exception as e:
+                logger.warning(f"Could not archive {kind} response: {e}")
+
+    def close(self):
+        """Write everything queued (the archive is only useful if it's complete)"""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        self.queue.put(None)
+        self.thread.join()
+
+
+_writer = ArchiveWriter()
+
+
+def archive(kind: str, url: str, body: str, **meta) -> bool:
+    """Queue a response for the archive when RAW_ARCHIVE=1; free otherwise"""
+    if not ARCHIVE_ENABLED:
+        return False
+    _writer.submit(kind, url, body, meta)
+    return True
+
+
+# Parsers by kind, each taking (body, meta); imported lazily so workers only load what they use
+
+def parse_schedule(body: str, meta: Dict) -> List[Dict]:
+    from scraper_ajax_method import parse_schedule_entry
+    return [parse_schedule_entry(entry) for entry in decode_rows(body)]
+
+
+def parse_roster(body: str, meta: Dict) -> List[Dict]:
+    from scraper_ajax_method import parse_roster_entry
+    return [w for w in (parse_roster_entry(entry) for entry in decode_rows(body)) if w]
+
+
+def parse_event_matches(body: str, meta: Dict) -> List[Dict]:
+    from results_engine import parse_bouts
+    return parse_bouts(body, meta['event'])
+
+
+def parse_bracket_page(body: str, meta: Dict) -> List[Dict]:
+    from brackets import parse_bracket
+    return parse_bracket(body, meta['weight'], meta['event'])
+
+
+def parse_event_page(body: str, meta: Dict) -> Dict:
+    from enrichment import parse_event_details
+    return parse_event_details(body)
+
+
+def parse_frame(body: str, meta: Dict) -> List[Dict]:
+    from scraper_frame import TrackWrestlingFrameScraper
+    scraper = TrackWrestlingFrameScraper(meta.get('team_id', TEAM_ID), meta.get('season_id', SEASON_ID))
+    return scraper.parse_schedule_blob(scraper.extract_data_blob(body))
+
+
+def parse_page(body: str, meta: Dict) -> List[Dict]:
+    from bs4 import BeautifulSoup
+    from scraper_beautifulsoup import TrackWrestlingScraper
+    scraper = TrackWrestlingScraper(meta.get('team_id', TEAM_ID), meta.get('season_id', SEASON_ID))
+    soup = BeautifulSoup(body, 'html.parser')
+    if meta.get('page_name') == 'TeamRoster.jsp':
+        return scraper.parse_roster(soup)
+    if meta.get('page_name') == 'TeamResults.jsp':
+        return scraper.parse_results(soup)
+    return scraper.parse_schedule(soup)
+
+
+def parse_bracket_weights(body: str, meta: Dict) -> List[Dict]:
+    from brackets import parse_weights
+    return [{'weight_id': weight_id, 'weight_class': weight} for weight_id, weight in parse_weights(body)]
+
+
+def parse_selenium_page(body: str, meta: Dict) -> List[Dict]:
+    from scraper_selenium_final import extract_schedule_from_html
+    return extract_schedule_from_html(body, meta.get('source', 'archive'))
+
+
+PARSERS = {
+    'schedule': parse_schedule,
+    'roster': parse_roster,
+    'event_matches': parse_event_matches,
+    'bracket': parse_bracket_page,
+    'bracket_weights': parse_bracket_weights,
+    'event_details': parse_event_page,
+    'frame': parse_frame,
+    'page': parse_page,
+    'selenium_page': parse_selenium_page,
+}
+
+
+def reparse_entry(directory: str, entry: Dict):
+    """Worker: decompress one archived response and run its current parser"""
+    logging.getLogger().setLevel(logging.WARNING)
+    body = RawArchive(directory).get(entry['sha256'], entry['codec'])
+    return PARSERS[entry['kind']](body, entry['meta'])
+
+
+def reparse(entries: List[Dict], directory: str = ARCHIVE_DIR, max_workers: Optional[int] = None) -> List[Tuple[Dict, object]]:
+    """(entry, parsed) for every entry with a parser, parsed across a process pool"""
+    entries = [e for e in entries if e['kind'] in PARSERS]
+    if not entries:
+        return []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        parsed = list(pool.map(reparse_entry, [directory] * len(entries), entries,
+                               chunksize=max(1, len(entries) // (4 * (os.cpu_count() or 1)))))
+    return list(zip(entries, parsed))
+
+
+def rebuild(archive_store: RawArchive, team_id: str = TEAM_ID, season_id: str = SEASON_ID,
+            team_name: str = TEAM_NAME, max_workers: Optional[int] = None) -> Dict:
+    """A wrestling_data.json structure from the newest archived responses for one team and season"""
+    entries = archive_store.entries()
+
+    def newest(kind, **meta):
+        matches = [e for e in entries if e['kind'] == kind and all(e['meta'].get(k) == v for k, v in meta.items())]
+        if not matches:
+            return []
+        entry = matches[-1]
+        return PARSERS[kind](archive_store.get(entry['sha256'], entry['codec']), entry['meta'])
+
+    schedule = newest('schedule', team_id=team_id, season_id=season_id)
+    roster = newest('roster', team_name=team_name, season_id=season_id)
+    event_ids = {match['event_id'] for match in schedule if match.get('event_id')}
+
+    # Everything per event goes through the process pool
+    def wanted(entry):
+        meta = entry['meta']
+        if entry['kind'] == 'event_matches':
+            return meta.get('team_id') == team_id and meta.get('season_id') == season_id
+        if entry['kind'] == 'bracket':
+            return meta['event']['event_id'] in event_ids
+        return entry['kind'] == 'event_details' and meta.get('event_id') in event_ids
+
+    parsed = reparse(archive_store.latest(e for e in entries if wanted(e)), archive_store.directory, max_workers)
+
+    results: List[Dict] = []
+    brackets: Dict[str, List[Dict]] = {}
+    details: Dict[str, Dict] = {}
+    for entry, value in parsed:
+        if entry['kind'] == 'event_matches':
+            results.extend(value)
+        elif entry['kind'] == 'bracket':
+            brackets.setdefault(entry['meta']['event']['event_id'], []).extend(value)
+        else:
+            details[entry['meta']['event_id']] = value
+
+    from brackets import merge_results
+    results = merge_results(results, brackets)
+    for match in schedule:
+        match.update({k: v for k, v in details.get(match.get('event_id'), {}).items() if k != 'venue'})
+
+    logger.info(f"Reparsed {len(parsed)} event responses: {len(schedule)} matches, {len(roster)} wrestlers, "
+                f"{len(results)} bouts")
+    return {
+        'metadata': {
+            'team_id': team_id,
+            'season_id': season_id,
+            'last_updated': datetime.now(EST).isoformat(),
+            'team_name': 'Shawnee High School',
+            'rebuilt_from': archive_store.directory,
+        },
+        'roster': roster,
+        'schedule': schedule,
+        'results': results,
+    }
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Raw response archive")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help="Show archived fetches")
+    list_parser.add_argument('--kind')
+    list_parser.add_argument('--url', help="Substring of the URL")
+    list_parser.add_argument('--since', help="ISO date/time")
+    list_parser.add_argument('--until', help="ISO date/time")
+
+    show_parser = subparsers.add_parser('show', help="Print an archived response")
+    show_parser.add_argument('sha256', help="Hash (or a unique prefix)")
+
+    reparse_parser = subparsers.add_parser('reparse', help="Rebuild the data file from the archive (no network)")
+    reparse_parser.add_argument('--team-id', default=TEAM_ID)
+    reparse_parser.add_argument('--season-id', default=SEASON_ID)
+    reparse_parser.add_argument('--team-name', default=TEAM_NAME)
+    reparse_parser.add_argument('--workers', type=int, help="Worker processes (default: one per CPU)")
+    reparse_parser.add_argument('--output', default=REPARSED_FILE)
+    reparse_parser.add_argument('--apply', action='store_true', help=f"Save over {OUTPUT_FILE} instead")
+    reparse_parser.add_argument('--kind', choices=sorted(PARSERS),
+                                help="Only reparse the newest responses of one kind and write {hash: parsed}")
+
+    args = parser.parse_args()
+    store = RawArchive()
+
+    if args.command == 'list':
+        for entry in store.entries(args.kind, args.url, args.since, args.until):
+            print(f"  {entry['fetched_at'][:19]}  {entry['kind']:<14} {entry['sha256'][:12]}  "
+                  f"{entry['size']:>8}  {entry['url']}")
+    elif args.command == 'show':
+        matches = {(e['sha256'], e['codec']) for e in store.entries() if e['sha256'].startswith(args.sha256)}
+        if len(matches) != 1:
+            logger.error(f"{len(matches)} archived responses match {args.sha256}")
+            return
+        print(store.get(*matches.pop()))
+    elif args.command == 'reparse' and args.kind:
+        parsed = reparse(store.latest(store.entries(args.kind)), store.directory, args.workers)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({entry['sha256']: value for entry, value in parsed}, f, indent=2)
+        logger.info(f"Reparsed {len(parsed)} {args.kind} responses into {args.output}")
+    elif args.command == 'reparse':
+        data = rebuild(store, args.team_id, args.season_id, args.team_name, args.workers)
+        if args.apply:
+            save_data(data, OUTPUT_FILE)
+            logger.info("Run 'python records.py --rebuild' to recount records from the rebuilt bouts")
+        else:
+            os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            logger.info(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Records
+Keeps per-wrestler W-L counters up to date by applying only new bouts
+"""
+
+import argparse
+import json
+import logging
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from history_store import normalize_key
+from scraper_ajax_method import OUTPUT_FILE, RECORDS_STATE, load_data
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+TEAM_NAME = "Shawnee"
+
+# Which counter each win type feeds
+WIN_BUCKETS = {'F': 'falls', 'TF': 'tech_falls', 'MD': 'majors', 'D': 'decisions',
+               'FF': 'other', 'INJ': 'other', 'DQ': 'other'}
+COUNTERS = ('wins', 'losses', 'falls', 'tech_falls', 'majors', 'decisions', 'other')
+
+
+def wrestler_key(name: str, team: str) -> str:
+    return f"{normalize_key(name)}|{normalize_key(team)}"
+
+
+class RecordBook:
+    """Per-wrestler counters plus the per-event contributions needed to undo a refetched event"""
+
+    def __init__(self, state_path: str = RECORDS_STATE):
+        self.state_path = state_path
+        self.wrestlers: Dict[str, Dict] = {}
+        self.events: Dict[str, List[List[str]]] = {}
+        self._by_name: Optional[Dict[str, List[str]]] = None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.wrestlers = state.get('wrestlers', {})
+            self.events = state.get('events', {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read records state, rebuilding: {e}")
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'wrestlers': self.wrestlers, 'events': self.events}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.state_path)
+
+    def _counter(self, key: str, name: str, team: str) -> Dict:
+        counter = self.wrestlers.get(key)
+        if counter is None:
+            counter = {'name': name, 'team': team, **{c: 0 for c in COUNTERS}}
+            self.wrestlers[key] = counter
+            if self._by_name is not None:
+                self._by_name.setdefault(key.split('|', 1)[0], []).append(key)
+        return counter
+
+    def _add(self, winner_key: str, loser_key: str, win_type: str, sign: int, bout: Optional[Dict] = None):
+        if win_type == 'NC':
+            return
+        winner = self.wrestlers.get(winner_key) or self._counter(
+            winner_key, bout.get('winner', ''), bout.get('winner_team', ''))
+        loser = self.wrestlers.get(loser_key) or self._counter(
+            loser_key, bout.get('loser', ''), bout.get('loser_team', ''))
+        winner['wins'] += sign
+        winner[WIN_BUCKETS.get(win_type, 'decisions')] += sign
+        loser['losses'] += sign
+
+    def apply_event(self, event_id: str, bouts: List[Dict]):
+        """Replace one event's contribution: undo what it added before, then add its current bouts"""
+        for _, winner_key, loser_key, win_type in self.events.pop(event_id, []):
+            self._add(winner_key, loser_key, win_type, -1)
+
+        applied = []
+        for bout in bouts:
+            winner_key = wrestler_key(bout.get('winner', ''), bout.get('winner_team', ''))
+            loser_key = wrestler_key(bout.get('loser', ''), bout.get('loser_team', ''))
+            win_type = bout.get('win_type', 'D')
+            self._add(winner_key, loser_key, win_type, 1, bout)
+            applied.append([bout.get('bout_id', ''), winner_key, loser_key, win_type])
+        self.events[event_id] = applied
+
+    def apply(self, fetched: Dict[str, List[Dict]]) -> int:
+        """Apply freshly fetched events; cost is proportional to the bouts in them"""
+        for event_id, bouts in fetched.items():
+            self.apply_event(event_id, bouts)
+        return sum(len(b) for b in fetched.values())
+
+    def sync(self, results: List[Dict], fetched: Dict[str, List[Dict]]) -> int:
+        """Apply new bouts, bootstrapping from the full results list the first time"""
+        if not self.events and results:
+            logger.info("No records state yet; building from all results")
+            fetched = group_by_event(results)
+        return self.apply(fetched)
+
+    def record_for(self, name: str, team: str = TEAM_NAME) -> Optional[Dict]:
+        """Combined counters for a wrestler, across spellings of the team ("Shawnee" vs "Shawnee HS")"""
+        if self._by_name is None:
+            self._by_name = defaultdict(list)
+            for key in self.wrestlers:
+                self._by_name[key.split('|', 1)[0]].append(key)
+
+        team_key = normalize_key(team)
+        matches = [self.wrestlers[key] for key in self._by_name.get(normalize_key(name), [])
+                   if team_key in key.split('|', 1)[1]]
+        if not matches:
+            return None
+        return {c: sum(m[c] for m in matches) for c in COUNTERS}
+
+    def attach(self, roster: List[Dict], team: str = TEAM_NAME) -> List[Dict]:
+        """Fill in 'record' ("W-L") and the win breakdown on each roster entry"""
+        for wrestler in roster:
+            counter = self.record_for(wrestler.get('name', ''), team)
+            if counter is None:
+                continue
+            wrestler['record'] = f"{counter['wins']}-{counter['losses']}"
+            wrestler['record_breakdown'] = {c: counter[c] for c in COUNTERS}
+        return roster
+
+
+def group_by_event(results: Iterable[Dict]) -> Dict[str, List[Dict]]:
+    grouped: Dict[str, List[Dict]] = defaultdict(list)
+    for bout in results:
+        grouped[bout.get('event_id', '')].append(bout)
+    return dict(grouped)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Show wrestler records")
+    parser.add_argument('--rebuild', action='store_true', help="Recompute from every bout in the data file")
+    args = parser.parse_args()
+
+    data = load_data(OUTPUT_FILE) or {}
+    if args.rebuild and os.path.exists(RECORDS_STATE):
+        os.remove(RECORDS_STATE)
+
+    book = RecordBook()
+    book.sync(data.get('results', []), {})
+    book.save()
+
+    for wrestler in book.attach(data.get('roster', [])):
+        print(f"  {wrestler.get('weight_class', ''):>4}  {wrestler['name']:<28} {wrestler.get('record') or 'N/A'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Results Engine
+Fetches bout-by-bout results for past events, only refetching events that are new or may still change
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+from instrumentation import record_retry, span
+from scraper_ajax_method import (
+    EST, INITIAL_PAUSE, MAX_RETRIES, OUTPUT_FILE, RESULTS_STATE, SEASON_ID, TEAM_ID,
+    archive_response, load_data, parse_event_date, save_data, timed_get, weight_sort_key
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+TEAM_NAME = "Shawnee"
+MAX_WORKERS = 4            # concurrent event fetches
+SETTLE_DAYS = 3            # results can still be corrected this long after an event
+# The AJAX call the TeamSchedule page makes when an event is expanded.
+# You'll need to adjust this if TrackWrestling renames it.
+EVENT_MATCHES_FUNCTION = "getEventMatches"
+
+# Team points per win type (NFHS dual meet scoring)
+TEAM_POINTS = {'F': 6, 'FF': 6, 'INJ': 6, 'DQ': 6, 'TF': 5, 'MD': 4, 'D': 3, 'NC': 0}
+
+# A weight class label: "106", or a named class such as "285+" or "HWT" (see weight_sort_key)
+WEIGHT_LABEL = r'\d{2,3}\+?|(?i:hwt)\b'
+# "106 - Daniel Fitzpatrick (Shawnee) over John Doe (Moorestown) (Fall 1:23)"
+BOUT_PATTERN = re.compile(
+    rf'(?P<weight>\b(?:{WEIGHT_LABEL}))\s*-?\s*'
+    r'(?P<winner>[^()\n]+?)\s*\((?P<winner_team>[^()]+)\)\s+over\s+'
+    r'(?P<loser>[^()\n]+?)\s*\((?P<loser_team>[^()]+)\)\s*'
+    r'\((?P<decision>[^()]*(?:\([^()]*\))?[^()]*)\)'
+)
+
+WIN_TYPE_PATTERNS = [
+    (re.compile(r'^(fall|pin)\b', re.I), 'F'),
+    (re.compile(r'^tf\b|tech', re.I), 'TF'),
+    (re.compile(r'^md\b|major', re.I), 'MD'),
+    (re.compile(r'^(dec|sv|tb|utb|ot)\b', re.I), 'D'),
+    (re.compile(r'for\b|forf|^ff\b', re.I), 'FF'),
+    (re.compile(r'^inj|^def\b', re.I), 'INJ'),
+    (re.compile(r'^dq\b|disq', re.I), 'DQ'),
+    (re.compile(r'^nc\b', re.I), 'NC'),
+]
+
+
+def parse_win_type(decision: str) -> str:
+    """Normalize TrackWrestling decision text ("Fall 1:23", "MD 12-2", "SV-1 5-3") to a win type code"""
+    decision = decision.strip()
+    for pattern, code in WIN_TYPE_PATTERNS:
+        if pattern.search(decision):
+            return code
+    return 'D'
+
+
+def score_margin(score: str) -> Optional[int]:
+    """Point margin from a decision string, or None for falls and forfeits"""
+    match = re.search(r'(\d+)-(\d+)', score or '')
+    if not match:
+        return None
+    return abs(int(match.group(1)) - int(match.group(2)))
+
+
+def make_bout_id(event_id: str, weight: str, winner: str, loser: str, decision: str) -> str:
+    key = '|'.join([event_id, weight, winner.lower(), loser.lower(), decision.lower()])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def extract_text_cells(payload: str) -> Iterable[str]:
+    """Yield candidate bout strings from a JSON grid response or an HTML page"""
+    body = payload.strip()
+    if body.startswith('"') and body.endswith('"'):
+        body = body[1:-1]
+
+    try:
+        stack = [json.loads(body)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(reversed(item))
+            elif isinstance(item, str):
+                yield html.unescape(re.sub(r'<[^>]+>', ' ', item))
+        return
+    except (json.JSONDecodeError, ValueError):
+        pass
+
+    text = re.sub(r'<br\s*/?>|</(tr|li|p|div)>', '\n', body, flags=re.I)
+    text = html.unescape(re.sub(r'<[^>]+>', ' ', text))
+    yield from text.splitlines()
+
+
+def parse_bouts(payload: str, event: Dict, team_name: str = TEAM_NAME) -> List[Dict]:
+    """Parse every bout in a response into result records"""
+    bouts = []
+    seen: Set[str] = set()
+    event_id = event.get('event_id', '')
+
+    for cell in extract_text_cells(payload):
+        for match in BOUT_PATTERN.finditer(re.sub(r'\s+', ' ', cell)):
+            weight = match.group('weight').upper()
+            winner, loser = match.group('winner').strip(), match.group('loser').strip()
+            winner_team, loser_team = match.group('winner_team').strip(), match.group('loser_team').strip()
+            decision = match.group('decision').strip()
+
+            bout_id = make_bout_id(event_id, weight, winner, loser, decision)
+            if bout_id in seen:
+                continue
+            seen.add(bout_id)
+
+            # Report from our wrestler's side when we're in the bout, otherwise the winner's
+            ours_lost = team_name.lower() in loser_team.lower() and team_name.lower() not in winner_team.lower()
+            bouts.append({
+                'bout_id': bout_id,
+                'event_id': event_id,
+                'date': event.get('date', ''),
+                'event': event.get('opponent', ''),
+                'location': event.get('location', ''),
+                'weight_class': weight,
+                'wrestler': loser if ours_lost else winner,
+                'team': loser_team if ours_lost else winner_team,
+                'opponent': winner if ours_lost else loser,
+                'opponent_team': winner_team if ours_lost else loser_team,
+                'result': 'Loss' if ours_lost else 'Win',
+                'win_type': parse_win_type(decision),
+                'score': decision,
+                'winner': winner,
+                'winner_team': winner_team,
+                'loser': loser,
+                'loser_team': loser_team,
+            })
+
+    return bouts
+
+
+class ResultsEngine:
+    """Fetches bouts for past events with a persistent seen-event set"""
+
+    def __init__(self, team_id: str = TEAM_ID, season_id: str = SEASON_ID,
+                 state_path: str = RESULTS_STATE, max_workers: int = MAX_WORKERS):
+        self.team_id = team_id
+        self.season_id = season_id
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.state = self._load_state()
+        self.fetched: Dict[str, List[Dict]] = {}
+
+    def _load_state(self) -> Dict:
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read results state: {e}")
+        return {'events': {}}
+
+    def save_state(self):
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def needs_fetch(self, event: Dict, today: date, have_bouts: Set[str]) -> bool:
+        """Fetch events never seen, or seen before their results could have settled"""
+        event_date = parse_event_date(event.get('date', ''))
+        if not event.get('event_id') or event_date is None or event_date > today:
+            return False
+
+        seen = self.state['events'].get(event['event_id'])
+        if seen is None:
+            return True
+        if seen.get('bouts') and event['event_id'] not in have_bouts:
+            return True  # state says we had bouts but the data file lost them
+
+        fetched_on = date.fromisoformat(seen['fetched_at'][:10])
+        return fetched_on <= event_date + timedelta(days=SETTLE_DAYS)
+
+    def fetch_event(self, event: Dict) -> Optional[List[Dict]]:
+        """Fetch and parse one event's bouts; None if every attempt failed"""
+        retries = 0
+        pause = INITIAL_PAUSE
+
+        while retries < MAX_RETRIES:
+            try:
+                url = (f"https://www.trackwrestling.com/tw/seasons/AjaxFunctions.jsp?TIM={int(time.time()*1000)}"
+                       f"&twSessionId=kmgthfvfkl&function={EVENT_MATCHES_FUNCTION}"
+                       f"&eventId={event['event_id']}&teamId={self.team_id}&seasonId={self.season_id}")
+                response = timed_get(EVENT_MATCHES_FUNCTION, url)
+
+                if response.status_code == 200:
+                    archive_response('event_matches', url, response.text, event=event,
+                                     team_id=self.team_id, season_id=self.season_id)
+                    with span('normalize', endpoint=EVENT_MATCHES_FUNCTION):
+                        bouts = parse_bouts(response.text, event)
+                    logger.info(f"  ✓ {event['date']} - {event.get('opponent', '')}: {len(bouts)} bouts")
+                    return bouts
+
+                raise Exception(f"Status code {response.status_code}")
+
+            except Exception as e:
+                retries += 1
+                if retries < MAX_RETRIES:
+                    record_retry(EVENT_MATCHES_FUNCTION)
+                    logger.warning(f"Error fetching event {event['event_id']}: {e}. Retrying in {pause} seconds...")
+                    time.sleep(pause)
+                    pause *= 2
+                else:
+                    logger.error(f"Failed to fetch event {event['event_id']} after {MAX_RETRIES} attempts: {e}")
+        return None
+
+    def fetch_events(self, events: List[Dict]) -> Dict[str, List[Dict]]:
+        """Fetch several events concurrently; returns {event_id: bouts} for the ones that succeeded"""
+        if not events:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(events))) as pool:
+            fetched = list(pool.map(self.fetch_event, events))
+
+        now = datetime.now(EST).isoformat()
+        results = {}
+        for event, bouts in zip(events, fetched):
+            if bouts is None:
+                continue
+            results[event['event_id']] = bouts
+            self.state['events'][event['event_id']] = {
+                'fetched_at': now,
+                'date': event.get('date', ''),
+                'bouts': len(bouts),
+            }
+        return results
+
+    def update(self, schedule: List[Dict], previous_results: List[Dict],
+               today: Optional[date] = None) -> List[Dict]:
+        """Merge freshly fetched events into the previous results and return the full list"""
+        today = today or datetime.now(EST).date()
+        have_bouts = {r.get('event_id') for r in previous_results}
+        to_fetch = [e for e in schedule if self.needs_fetch(e, today, have_bouts)]
+
+        logger.info("="*60)
+        logger.info(f"Results: {len(to_fetch)} of {len(schedule)} events need fetching")
+        logger.info("="*60)
+
+        fetched = self.fetch_events(to_fetch)
+        self.fetched = fetched
+        if fetched:
+            self.save_state()
+
+        # Keep everything we didn't refetch, swap in the refetched events
+        results = [r for r in previous_results if r.get('event_id') not in fetched]
+        for bouts in fetched.values():
+            results.extend(bouts)
+
+        results.sort(key=lambda r: (parse_event_date(r.get('date', '')) or date.max,
+                                    r.get('event_id', ''), weight_sort_key(r.get('weight_class'))))
+        return results
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Fetch bout results for past events")
+    parser.add_argument('--parse', metavar='FILE', help="Parse a saved response instead of fetching")
+    args = parser.parse_args()
+
+    if args.parse:
+        with open(args.parse, 'r', encoding='utf-8') as f:
+            bouts = parse_bouts(f.read(), {'event_id': 'local'})
+        print(json.dumps(bouts, indent=2))
+        return
+
+    data = load_data(OUTPUT_FILE) or {}
+    engine = ResultsEngine()
+    results = engine.update(data.get('schedule', []), data.get('results', []))
+    if results != data.get('results', []):
+        data['results'] = results
+        save_data(data, OUTPUT_FILE)
+
+    wins = sum(1 for r in results if r['result'] == 'Win' and TEAM_NAME.lower() in r.get('team', '').lower())
+    losses = sum(1 for r in results if r['result'] == 'Loss')
+    logger.info(f"Total bouts: {len(results)} (Shawnee {wins}-{losses})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Schema Drift
+Fingerprints the columns of AJAX rows and remaps a field's index when TrackWrestling moves its column
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from instrumentation import RUN_ID
+from scraper_ajax_method import COLUMN_MAP, COLUMNS, EST
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+SCHEMA_PROFILE = 'data/schema_profile.json'
+DRIFT_THRESHOLD = 0.5      # a field whose column resembles its profile less than this has drifted
+MATCH_THRESHOLD = 0.8      # a column must resemble the profile at least this much to take the field
+MIN_VALUES = 3             # columns with fewer non-empty values say nothing either way
+MAX_SHIFT = 3              # furthest a block of columns is expected to move
+AUTO_REMAP = True          # apply confirmed remaps (False only logs the proposal)
+REMAP_CONFIRMATIONS = 3    # consecutive runs that must propose the same remap before it is written
+
+# Value patterns, checked in order
+PATTERNS = [
+    ('yyyymmdd', re.compile(r'(19|20)\d{2}(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])')),
+    ('hhmm', re.compile(r'([01]\d|2[0-3])[0-5]\d')),
+    ('home_away', re.compile(r'[HAN]')),
+    ('grade', re.compile(r'(fr|so|jr|sr|freshman|sophomore|junior|senior)\.?|9|1[0-2]', re.I)),
+    ('weight', re.compile(r'(7\d|[89]\d|[12]\d\d|300)')),
+    ('id', re.compile(r'\d{6,}')),
+    ('int', re.compile(r'-?\d+')),
+    ('decimal', re.compile(r'-?\d*\.\d+')),
+    ('word', re.compile(r"[A-Za-z][A-Za-z'.-]*")),
+    ('words', re.compile(r"[A-Za-z][\w'.,&()/-]*(\s+[\w'.,&()/-]+)+")),
+]
+
+_lock = threading.Lock()
+
+
+def classify(value) -> str:
+    if value is None or value == '':
+        return 'empty'
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, (list, dict)):
+        return 'nested'
+    text = str(value).strip()
+    if not text:
+        return 'empty'
+    for name, pattern in PATTERNS:
+        if pattern.fullmatch(text):
+            return name
+    return 'text'
+
+
+def fingerprint(values: List) -> Dict:
+    """Share of each value pattern among a column's non-empty values"""
+    counts = Counter(classify(v) for v in values)
+    empty = counts.pop('empty', 0)
+    filled = sum(counts.values())
+    return {
+        'filled': filled,
+        'empty': empty,
+        'classes': {name: round(n / filled, 3) for name, n in counts.items()} if filled else {},
+    }
+
+
+def fingerprint_rows(rows: List) -> List[Dict]:
+    """One fingerprint per column position across all rows"""
+    rows = [row for row in rows if isinstance(row, list)]
+    width = max((len(row) for row in rows), default=0)
+    return [fingerprint([row[i] if i < len(row) else None for row in rows]) for i in range(width)]
+
+
+def similarity(current: Dict, profile: Dict) -> Optional[float]:
+    """Overlap of the two pattern mixes (1.0 = same); None when the column is too sparse to judge"""
+    if current['filled'] < MIN_VALUES:
+        # A column that used to be mostly filled and is now empty is evidence too
+        expected = profile['filled'] / max(1, profile['filled'] + profile['empty'])
+        return 0.0 if expected >= 0.5 else None
+    return sum(min(share, profile['classes'].get(name, 0.0)) for name, share in current['classes'].items())
+
+
+def propose(fingerprints: List[Dict], columns: Dict[str, int], profile: Dict[str, Dict]) -> Dict[str, int]:
+    """{field: new index} for fields whose column moved and whose profile clearly matches another column"""
+    def fit(field, index):
+        if index < 0 or index >= len(fingerprints):
+            return 0.0
+        return similarity(fingerprints[index], profile[field])
+
+    def total(mapping):
+        scores = [fit(f, i) for f, i in mapping.items() if f in profile]
+        return sum(0.5 if score is None else score for score in scores)
+
+    drifted = [f for f, i in columns.items() if f in profile and (fit(f, i) is not None and fit(f, i) < DRIFT_THRESHOLD)]
+    if not drifted:
+        return {}
+
+    # Usually a column was inserted or dropped and everything after it moved together,
+    # so try every (position, shift) and keep the one that fits the profile best
+    best, best_total = dict(columns), total(columns)
+    for point in sorted(set(columns.values())):
+        for shift in range(-MAX_SHIFT, MAX_SHIFT + 1):
+            if shift == 0:
+                continue
+            mapping = {f: i + shift if i >= point else i for f, i in columns.items()}
+            if len(set(mapping.values())) == len(mapping) and total(mapping) > best_total:
+                best, best_total = mapping, total(mapping)
+    remap = {f: i for f, i in best.items() if i != columns[f] and fit(f, i) != 0.0}
+
+    # Anything still unexplained moves only to a column that it alone matches
+    taken = {remap.get(f, i) for f, i in columns.items()}
+    for field in drifted:
+        if (fit(field, remap.get(field, columns[field])) or 0.0) >= MATCH_THRESHOLD:
+            continue
+        options = [j for j in range(len(fingerprints)) if j not in taken and (fit(field, j) or 0.0) >= MATCH_THRESHOLD]
+        if len(options) == 1:
+            remap[field] = options[0]
+            taken.add(options[0])
+        else:
+            logger.warning(f"Column for '{field}' moved but {len(options) or 'no'} columns match its profile")
+    return remap
+
+
+class SchemaProfile:
+    """Expected fingerprint of each field's column, recorded while the mapping is known to be right"""
+
+    def __init__(self, path: str = SCHEMA_PROFILE):
+        self.path = path
+        self.kinds: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.kinds = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read schema profile: {e}")
+
+    def record(self, kind: str, fingerprints: List[Dict], columns: Dict[str, int]):
+        self.kinds[kind] = {
+            'recorded_at': datetime.now(EST).isoformat(),
+            'width': len(fingerprints),
+            'fields': {f: fingerprints[i] for f, i in columns.items()
+                       if i < len(fingerprints) and fingerprints[i]['filled'] >= MIN_VALUES},
+        }
+
+    def fields(self, kind: str) -> Dict[str, Dict]:
+        return self.kinds.get(kind, {}).get('fields', {})
+
+    def confirm(self, kind: str, remap: Dict[str, int], run_id: str) -> int:
+        """Note that this run proposed the remap; returns how many consecutive runs have proposed it"""
+        entry = self.kinds.setdefault(kind, {})
+        pending = entry.get('pending')
+        if not pending or pending['remap'] != remap:
+            pending = {'remap': remap, 'runs': []}
+        if run_id not in pending['runs']:
+            pending['runs'].append(run_id)
+        entry['pending'] = pending
+        return len(pending['runs'])
+
+    def clear_pending(self, kind: str) -> bool:
+        """Forget an unconfirmed remap; returns True if there was one"""
+        return self.kinds.get(kind, {}).pop('pending', None) is not None
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.kinds, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def save_column_map(path: str = COLUMN_MAP):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(COLUMNS, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def check_rows(kind: str, rows: List, apply: bool = AUTO_REMAP, profile: Optional[SchemaProfile] = None,
+               confirmations: int = REMAP_CONFIRMATIONS) -> Dict[str, int]:
+    """Compare a response against the stored profile and remap moved fields; returns the proposed remap
+
+    A remap is written only once `confirmations` consecutive runs have proposed the same one, since
+    column_map.json is committed and one false positive would misread every later scrape.
+    """
+    with _lock:
+        profile = profile or SchemaProfile()
+        fingerprints = fingerprint_rows(rows)
+        columns = COLUMNS[kind]
+
+        remap = propose(fingerprints, columns, profile.fields(kind))
+        if not remap:
+            if profile.clear_pending(kind):
+                profile.save()
+                logger.info(f"{kind} columns match the profile again; dropped the pending remap")
+            # The first response (and fields too sparse until now) become the profile
+            known = profile.fields(kind)
+            unprofiled = [f for f, i in columns.items() if f not in known
+                          and i < len(fingerprints) and fingerprints[i]['filled'] >= MIN_VALUES]
+            if unprofiled:
+                profile.record(kind, fingerprints, columns)
+                profile.kinds[kind]['fields'] = {**profile.fields(kind), **known}
+                profile.save()
+                logger.info(f"Profiled {kind} columns: {', '.join(unprofiled)}")
+            return {}
+
+        moves = ', '.join(f"{field} {columns[field]} -> {index}" for field, index in sorted(remap.items()))
+        if not apply:
+            logger.warning(f"{kind} columns appear to have moved: {moves} (not applied)")
+            return remap
+        seen = profile.confirm(kind, remap, RUN_ID)
+        if seen < confirmations:
+            profile.save()
+            logger.warning(f"{kind} columns appear to have moved: {moves} "
+                           f"(seen on {seen} of {confirmations} runs; not applied yet)")
+            return remap
+        logger.warning(f"{kind} columns moved upstream; remapping {moves}")
+        columns.update(remap)
+        save_column_map()
+        profile.clear_pending(kind)
+        profile.save()
+        return remap
+
+
+def load_rows(path: str) -> List:
+    """Rows from a saved AJAX response (optionally still wrapped in quotes)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = f.read().strip()
+    if data.startswith('"') and data.endswith('"'):
+        data = data[1:-1]
+    return json.loads(data)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Check AJAX responses for moved columns")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    check_parser = subparsers.add_parser('check', help="Compare a saved response against the profile")
+    check_parser.add_argument('kind', choices=sorted(COLUMNS))
+    check_parser.add_argument('file')
+    check_parser.add_argument('--apply', action='store_true',
+                              help=f"Write remaps to {COLUMN_MAP} now, without waiting for confirmation")
+
+    profile_parser = subparsers.add_parser('profile', help="Record a known-good response as the profile")
+    profile_parser.add_argument('kind', choices=sorted(COLUMNS))
+    profile_parser.add_argument('file')
+
+    args = parser.parse_args()
+    rows = load_rows(args.file)
+    fingerprints = fingerprint_rows(rows)
+    profile = SchemaProfile()
+
+    if args.command == 'profile':
+        profile.record(args.kind, fingerprints, COLUMNS[args.kind])
+        profile.save()
+        logger.info(f"Recorded {len(profile.fields(args.kind))} {args.kind} fields from {len(rows)} rows")
+        return
+
+    fields = profile.fields(args.kind)
+    if not fields:
+        logger.error(f"No {args.kind} profile yet; run 'python schema_drift.py profile {args.kind} FILE' first")
+        return
+    for field, index in COLUMNS[args.kind].items():
+        score = similarity(fingerprints[index], fields[field]) if field in fields and index < len(fingerprints) else None
+        print(f"  {field:<14} column {index:>3}  {'-' if score is None else f'{score:.2f}'}")
+    remap = check_rows(args.kind, rows, apply=args.apply, profile=profile, confirmations=1)
+    if not remap:
+        print("No columns moved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Scouting
+Fetches upcoming opponents' rosters concurrently (cached per team) and lines them up against ours
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from live_mode import TOURNAMENT_PATTERN
+from scraper_ajax_method import (
+    EST, HOME_LOCATION, OUTPUT_FILE, SEASON_ID, TEAM_NAME, fetch_wrestlers, load_data, parse_event_date, same_team,
+    weight_sort_key
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+SCOUTING_CACHE = 'data/scouting_cache.json'
+CACHE_TTL = timedelta(days=7)   # rosters change slowly; refetch weekly at most
+MAX_WORKERS = 6
+TEAM_SUFFIX_PATTERN = re.compile(
+    r'^(vs\.?|@|at)\s+|\s+(high school|h\.?s\.?|regional|senior high)$|\s*\([^()]*\)$', re.I)
+
+
+def team_search_name(opponent: str) -> str:
+    """The name getWrestlers matches on ("@ Moorestown  High School" -> "Moorestown")"""
+    name = ' '.join(opponent.split())
+    while True:
+        stripped = TEAM_SUFFIX_PATTERN.sub('', name).strip()
+        if stripped == name:
+            return name
+        name = stripped
+
+
+def dual_opponent(match: Dict) -> Optional[str]:
+    """The other team in a dual meet, or None for tournaments and other multi-team events"""
+    opponent, location = match.get('opponent', ''), match.get('location', '')
+    if TOURNAMENT_PATTERN.search(opponent):
+        return None
+    # Away duals list us as the opponent and the host as the location
+    if same_team(opponent, TEAM_NAME):
+        if not location or location in ('TBD', HOME_LOCATION) or same_team(location, TEAM_NAME):
+            return None
+        return location
+    # Events we only attend ("2025 TCNJ Pride", "Beast of the East") have us in the location column
+    if same_team(location, TEAM_NAME):
+        return None
+    return opponent or None
+
+
+def upcoming_opponents(schedule: List[Dict], today: Optional[date] = None) -> List[str]:
+    """Distinct dual-meet opponents from today on, in schedule order"""
+    today = today or datetime.now(EST).date()
+    opponents: Dict[str, None] = {}
+    for match in schedule:
+        day = parse_event_date(match.get('date', ''))
+        opponent = dual_opponent(match)
+        if day is None or day < today or not opponent:
+            continue
+        opponents.setdefault(team_search_name(opponent), None)
+    return list(opponents)
+
+
+class RosterCache:
+    """Per-team rosters with the time each was fetched"""
+
+    def __init__(self, path: str = SCOUTING_CACHE, ttl: timedelta = CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.teams: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.teams = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read scouting cache: {e}")
+
+    @staticmethod
+    def key(season_id: str, team: str) -> str:
+        return f"{season_id}|{team.lower()}"
+
+    def get(self, season_id: str, team: str, allow_stale: bool = False) -> Optional[List[Dict]]:
+        entry = self.teams.get(self.key(season_id, team))
+        if entry is None:
+            return None
+        age = datetime.now(EST) - datetime.fromisoformat(entry['fetched_at'])
+        if age > self.ttl and not allow_stale:
+            return None
+        return entry['roster']
+
+    def put(self, season_id: str, team: str, roster: List[Dict]):
+        self.teams[self.key(season_id, team)] = {
+            'team': team,
+            'fetched_at': datetime.now(EST).isoformat(),
+            'roster': roster,
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.teams, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def scout(teams: List[str], season_id: str = SEASON_ID, cache: Optional[RosterCache] = None,
+          refresh: bool = False, max_workers: int = MAX_WORKERS) -> Dict[str, List[Dict]]:
+    """Rosters for each team: fresh cache entries as-is, everything else fetched concurrently
+
+    Teams are identified by name, not team ID: the schedule carries no ID for the opponent and
+    getWrestlers only filters by teamName. So each team is searched under its cleaned name
+    (team_search_name) and only rows whose team column is exactly that name are kept.
+    """
+    cache = cache or RosterCache()
+    rosters: Dict[str, List[Dict]] = {}
+    missing = []
+    for team in teams:
+        cached = None if refresh else cache.get(season_id, team)
+        if cached is not None:
+            rosters[team] = cached
+        else:
+            missing.append(team)
+
+    logger.info(f"Scouting {len(teams)} teams: {len(rosters)} cached, {len(missing)} to fetch")
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+            fetched = list(pool.map(lambda team: fetch_wrestlers(season_id, team, exact=True), missing))
+
+        for team, roster in zip(missing, fetched):
+            if roster is not None:
+                cache.put(season_id, team, roster)
+                rosters[team] = roster
+            else:
+                # A stale roster beats no roster the night before a meet
+                stale = cache.get(season_id, team, allow_stale=True)
+                if stale is not None:
+                    logger.warning(f"Using cached roster for {team} after fetch failed")
+                    rosters[team] = stale
+        cache.save()
+
+    return rosters
+
+
+def compare(ours: List[Dict], theirs: List[Dict]) -> List[Dict]:
+    """One row per weight class with both teams' wrestlers at that weight"""
+    weights: Dict[str, Dict[str, List[Dict]]] = {}
+    for side, roster in (('ours', ours), ('theirs', theirs)):
+        for wrestler in roster:
+            row = weights.setdefault(wrestler.get('weight_class', ''), {'ours': [], 'theirs': []})
+            row[side].append({k: wrestler[k] for k in ('name', 'grade', 'record') if wrestler.get(k)})
+
+    return [{'weight_class': w, **weights[w]} for w in sorted(weights, key=weight_sort_key)]
+
+
+def print_comparison(team: str, rows: List[Dict]):
+    print(f"\n{TEAM_NAME} vs {team}")
+    print(f"{'wt':>5}  {TEAM_NAME:<34} {team:<34}")
+    for row in rows:
+        for i in range(max(len(row['ours']), len(row['theirs']), 1)):
+            left = row['ours'][i] if i < len(row['ours']) else {}
+            right = row['theirs'][i] if i < len(row['theirs']) else {}
+            label = row['weight_class'] if i == 0 else ''
+            left_text = f"{left.get('name', '')} {left.get('record', '')}".strip()
+            right_text = f"{right.get('name', '')} {right.get('record', '')}".strip()
+            print(f"{label:>5}  {left_text:<34} {right_text:<34}")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Scout upcoming opponents' rosters")
+    parser.add_argument('teams', nargs='*', help="Team names (defaults to upcoming opponents on the schedule)")
+    parser.add_argument('--refresh', action='store_true', help="Ignore cached rosters")
+    parser.add_argument('--save-dir', help="Also write each opponent's roster to DIR/<team>.json")
+    parser.add_argument('--json', action='store_true', help="Print JSON instead of tables")
+    args = parser.parse_args()
+
+    data = load_data(OUTPUT_FILE) or {}
+    season_id = data.get('metadata', {}).get('season_id', SEASON_ID)
+    teams = args.teams or upcoming_opponents(data.get('schedule', []))
+    if not teams:
+        logger.info("No upcoming opponents to scout")
+        return
+
+    rosters = scout(teams, season_id, refresh=args.refresh)
+    ours = data.get('roster', [])
+    comparisons = {team: compare(ours, roster) for team, roster in rosters.items()}
+
+    if args.save_dir:
+        os.makedirs(args.save_dir, exist_ok=True)
+        for team, roster in rosters.items():
+            slug = re.sub(r'[^a-z0-9]+', '_', team.lower()).strip('_')
+            with open(os.path.join(args.save_dir, f"{slug}.json"), 'w', encoding='utf-8') as f:
+                json.dump(roster, f, indent=2)
+
+    if args.json:
+        print(json.dumps(comparisons, indent=2))
+        return
+    for team, rows in comparisons.items():
+        print_comparison(team, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,9 +12,6 @@ from datetime import datetime
 from typing import Dict, List
 import logging
 import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -27,6 +24,14 @@ INITIAL_PAUSE = 1
 
 def get_current_season_id():
     """Get current season ID from TrackWrestling (optional - we already have it)"""
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.common.by import By
+    except ImportError:
+        logger.warning("Selenium not installed, using configured season ID. Run: pip install selenium")
+        return SEASON_ID
+    
     chrome_options = Options()
     chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
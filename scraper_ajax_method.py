@@ -8,31 +8,159 @@ import json
 import os
 import time
 import re
-from datetime import datetime
-from typing import Dict, List
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
 import logging
-import requests
 from zoneinfo import ZoneInfo  # Python 3.9+
 
+from instrumentation import finish_run, record_request, record_retry, span, start_run
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Configuration
 TEAM_ID = "768996150"
 SEASON_ID = "1560212138"
+TEAM_NAME = "Shawnee"
 MAX_RETRIES = 3
 INITIAL_PAUSE = 1
 EST = ZoneInfo("America/New_York")
+OUTPUT_FILE = 'data/wrestling_data.json'
+HISTORY_DB = 'data/wrestling_history.db'
+CHANGE_LOG = 'data/changes.jsonl'
+RESULTS_STATE = 'data/results_state.json'
+RECORDS_STATE = 'data/records_state.json'
+RATINGS_STATE = 'data/ratings_state.json'
+IDENTITY_MAP = 'data/identity_map.json'
+HOME_LOCATION = "Shawnee High School"
+COLUMN_MAP = 'data/column_map.json'
 
-def scrape_team_schedule(team_id: str, season_id: str) -> List[Dict]:
-    """Scrape schedule using TrackWrestling AJAX endpoint"""
+# Row indices in the AJAX responses. schema_drift.py checks them on every fetch and
+# records any column that moved in COLUMN_MAP, which overrides these defaults.
+SCHEDULE_COLUMNS = {
+    'event_id': 0,
+    'event_name': 2,
+    'date': 3,
+    'time': 4,
+    'home_away': 12,
+    'location': 16,
+    'opponent': 19,
+}
+ROSTER_COLUMNS = {
+    'first_name': 2,
+    'last_name': 3,
+    'team': 6,
+    'weight_class': 9,
+    'grade': 11,
+}
+COLUMNS = {'schedule': SCHEDULE_COLUMNS, 'roster': ROSTER_COLUMNS}
+
+def load_column_map(path: str = COLUMN_MAP) -> None:
+    """Apply saved column remaps over the default indices"""
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        for kind, columns in COLUMNS.items():
+            columns.update({field: int(index) for field, index in stored.get(kind, {}).items() if field in columns})
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning(f"Could not read column map: {e}")
+
+def column(entry: List, kind: str, field: str):
+    index = COLUMNS[kind][field]
+    return entry[index] if len(entry) > index else ""
+
+def timed_get(endpoint: str, url: str, timeout: int = 30) -> 'requests.Response':
+    """requests.get recorded as a fetch span plus the endpoint's request/byte counters"""
+    # Imported on first fetch: the API server imports this module but rarely fetches
+    import requests
+
+    with span('fetch', endpoint=endpoint):
+        try:
+            response = requests.get(url, timeout=timeout)
+        except requests.RequestException:
+            record_request(endpoint, 0, ok=False)
+            raise
+    record_request(endpoint, len(response.content), response.status_code == 200)
+    return response
+
+def archive_response(kind: str, url: str, body: str, **meta) -> None:
+    """Keep the raw response in raw_archive for offline reparsing; never fails a scrape"""
+    try:
+        from raw_archive import archive
+        archive(kind, url, body, **meta)
+    except Exception as e:
+        logger.warning(f"Could not archive {kind} response: {e}")
+
+def check_columns(kind: str, rows: List) -> None:
+    """Let schema_drift remap columns that moved upstream; never fails a scrape"""
+    try:
+        from schema_drift import check_rows
+        check_rows(kind, rows)
+    except Exception as e:
+        logger.warning(f"Could not check {kind} columns: {e}")
+
+def parse_event_date(value: str) -> Optional[date]:
+    """Turn a display date ("December 13, 2025", "12/13/2025" or "20251213") back into a date"""
     
-    logger.info("="*60)
-    logger.info(f"Scraping schedule for Team ID: {team_id}")
-    logger.info(f"Season ID: {season_id}")
-    logger.info("="*60)
+    for fmt in ('%B %d, %Y', '%m/%d/%Y', '%Y%m%d', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(value.strip(), fmt).date()
+        except (AttributeError, ValueError):
+            continue
+    
+    return None
+
+def parse_schedule_entry(entry: List) -> Dict:
+    """Turn one getTeamSchedule row into a schedule entry"""
+    
+    # Extract fields from TrackWrestling format (indices in SCHEDULE_COLUMNS)
+    event_id = column(entry, 'schedule', 'event_id')
+    event_name = column(entry, 'schedule', 'event_name')
+    date_str = column(entry, 'schedule', 'date')
+    time_str = column(entry, 'schedule', 'time')
+    home_away = column(entry, 'schedule', 'home_away')
+    location = column(entry, 'schedule', 'location')
+    opponent = column(entry, 'schedule', 'opponent')
+    
+    # Format date
+    if date_str and len(date_str) == 8:
+        year = date_str[0:4]
+        month = date_str[4:6]
+        day = date_str[6:8]
+        months = ['', 'January', 'February', 'March', 'April', 'May', 'June',
+                 'July', 'August', 'September', 'October', 'November', 'December']
+        formatted_date = f"{months[int(month)]} {int(day)}, {year}"
+    else:
+        formatted_date = date_str
+    
+    # Format time
+    if time_str and len(time_str) >= 4:
+        hour = int(time_str[0:2])
+        minute = time_str[2:4]
+        am_pm = "AM" if hour < 12 else "PM"
+        if hour > 12:
+            hour -= 12
+        elif hour == 0:
+            hour = 12
+        formatted_time = f"{hour}:{minute} {am_pm}"
+    else:
+        formatted_time = "TBD"
+    
+    return {
+        'event_id': str(event_id) if event_id else '',
+        'date': formatted_date,
+        'opponent': opponent if opponent else event_name,
+        'location': HOME_LOCATION if home_away == "H" else (location or "TBD"),
+        'time': formatted_time,
+        'result': 'TBD'
+    }
+
+def fetch_team_schedule(team_id: str, season_id: str) -> Optional[List[Dict]]:
+    """Fetch one team's schedule through the getTeamSchedule endpoint; None if every attempt failed"""
     
-    schedule = []
     retries = 0
     pause = INITIAL_PAUSE
     
@@ -44,74 +172,34 @@ def scrape_team_schedule(team_id: str, season_id: str) -> List[Dict]:
             
             logger.info(f"Fetching: {url}")
             
-            response = requests.get(url, timeout=30)
+            response = timed_get('getTeamSchedule', url)
             
             if response.status_code == 200:
                 data = response.text
                 logger.info(f"Got response: {len(data)} bytes")
+                archive_response('schedule', url, data, team_id=team_id, season_id=season_id)
                 
                 # The response might be wrapped in quotes, remove them
                 if data.startswith('"') and data.endswith('"'):
                     data = data[1:-1]
                 
                 # Parse the JSON
-                import json
-                schedule_data = json.loads(data)
+                with span('decode', endpoint='getTeamSchedule'):
+                    schedule_data = json.loads(data)
                 
                 logger.info(f"Parsed {len(schedule_data)} schedule entries")
+                check_columns('schedule', schedule_data)
                 
                 # Convert to our format
-                for entry in schedule_data:
-                    # Extract fields from TrackWrestling format
-                    # You'll need to adjust indices based on actual data structure
-                    try:
-                        event_name = entry[2] if len(entry) > 2 else ""
-                        date_str = entry[3] if len(entry) > 3 else ""
-                        time_str = entry[4] if len(entry) > 4 else ""
-                        home_away = entry[12] if len(entry) > 12 else ""
-                        location = entry[16] if len(entry) > 16 else ""
-                        opponent = entry[19] if len(entry) > 19 else ""
-                        
-                        # Format date
-                        if date_str and len(date_str) == 8:
-                            year = date_str[0:4]
-                            month = date_str[4:6]
-                            day = date_str[6:8]
-                            months = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                                     'July', 'August', 'September', 'October', 'November', 'December']
-                            formatted_date = f"{months[int(month)]} {int(day)}, {year}"
-                        else:
-                            formatted_date = date_str
-                        
-                        # Format time
-                        if time_str and len(time_str) >= 4:
-                            hour = int(time_str[0:2])
-                            minute = time_str[2:4]
-                            am_pm = "AM" if hour < 12 else "PM"
-                            if hour > 12:
-                                hour -= 12
-                            elif hour == 0:
-                                hour = 12
-                            formatted_time = f"{hour}:{minute} {am_pm}"
-                        else:
-                            formatted_time = "TBD"
-                        
-                        match = {
-                            'date': formatted_date,
-                            'opponent': opponent if opponent else event_name,
-                            'location': "Shawnee High School" if home_away == "H" else (location or "TBD"),
-                            'time': formatted_time,
-                            'result': 'TBD'
-                        }
-                        
-                        schedule.append(match)
-                        logger.info(f"  ✓ {formatted_date} - {match['opponent']}")
-                        
-                    except Exception as e:
-                        logger.warning(f"Error parsing entry: {e}")
-                        continue
+                schedule = []
+                with span('normalize', endpoint='getTeamSchedule'):
+                    for entry in schedule_data:
+                        try:
+                            schedule.append(parse_schedule_entry(entry))
+                        except Exception as e:
+                            logger.warning(f"Error parsing entry: {e}")
+                            continue
                 
-                logger.info(f"Successfully got {len(schedule)} matches")
                 return schedule
                 
             else:
@@ -121,78 +209,107 @@ def scrape_team_schedule(team_id: str, season_id: str) -> List[Dict]:
         except Exception as e:
             retries += 1
             if retries < MAX_RETRIES:
+                record_retry('getTeamSchedule')
                 logger.warning(f"Error: {e}. Retrying in {pause} seconds... (Attempt {retries}/{MAX_RETRIES})")
                 time.sleep(pause)
                 pause *= 2
             else:
                 logger.error(f"Failed after {MAX_RETRIES} attempts: {e}")
-                return []
+                return None
     
-    return []
+    return None
 
-def scrape_team_roster(team_id: str, season_id: str) -> List[Dict]:
-    """Scrape roster using direct AJAX endpoint"""
+def scrape_team_schedule(team_id: str, season_id: str) -> List[Dict]:
+    """Scrape schedule using TrackWrestling AJAX endpoint"""
     
     logger.info("="*60)
-    logger.info(f"Scraping roster for Team ID: {team_id}")
+    logger.info(f"Scraping schedule for Team ID: {team_id}")
+    logger.info(f"Season ID: {season_id}")
     logger.info("="*60)
     
-    roster = []
+    schedule = fetch_team_schedule(team_id, season_id) or []
+    for match in schedule:
+        logger.info(f"  ✓ {match['date']} - {match['opponent']}")
+    
+    logger.info(f"Successfully got {len(schedule)} matches")
+    return schedule
+
+def parse_roster_entry(entry: List) -> Optional[Dict]:
+    """Turn one getWrestlers row into a roster entry (None if it has no name)"""
+    
+    # Indices in ROSTER_COLUMNS
+    first_name = column(entry, 'roster', 'first_name')
+    last_name = column(entry, 'roster', 'last_name')
+    weight_class = column(entry, 'roster', 'weight_class')
+    grade = column(entry, 'roster', 'grade')
+    
+    full_name = f"{first_name} {last_name}".strip()
+    if not full_name:
+        return None
+    
+    return {
+        'name': full_name,
+        'weight_class': str(weight_class) if weight_class else '',
+        'grade': str(grade) if grade else '',
+        'record': ''
+    }
+
+def weight_sort_key(weight_class: Union[str, int, None]) -> Tuple:
+    """Sort key for weight classes: numeric ones in order, then named ones such as "HWT" or "285+\""""
+    weight = str(weight_class or '').strip()
+    return (0, int(weight)) if weight.isdigit() else (1, weight)
+
+def same_team(a: str, b: str) -> bool:
+    """Team names equal apart from case and spacing ("Cherry Hill  West" is "Cherry Hill West")"""
+    return ' '.join(a.split()).lower() == ' '.join(b.split()).lower()
+
+def fetch_wrestlers(season_id: str, team_name: str, exact: bool = False) -> Optional[List[Dict]]:
+    """Fetch one team's wrestlers through the getWrestlers endpoint; None if every attempt failed
+
+    teamName is a substring search, so with exact=True rows from other teams ("Cherry Hill East" for
+    "Cherry Hill") are dropped.
+    """
+    
     retries = 0
     pause = INITIAL_PAUSE
     
     while retries < MAX_RETRIES:
         try:
             # Direct AJAX call - no Selenium needed!
-            url = f"https://www.trackwrestling.com/seasons/AjaxFunctions.jsp?TIM={int(time.time()*1000)}&twSessionId=agcbbyaghq&function=getWrestlers&seasonId={season_id}&orderBy=wc.order_number%2C%20t.team_name%2C%20w.last_name%2C%20w.first_name%2C%20w.gender%2C%20g.order_number%2C%20l.order_number%2C%2020%2C%2018%2C%20w.eligible&gbId=36&firstName=&lastName=&teamName=Shawnee&gender=&gradeId=&phyClearance=&levelId=&leagueId=&limit=250&eligible=&RANDOM={int(time.time()*1000) % 100000}"
+            url = f"https://www.trackwrestling.com/seasons/AjaxFunctions.jsp?TIM={int(time.time()*1000)}&twSessionId=agcbbyaghq&function=getWrestlers&seasonId={season_id}&orderBy=wc.order_number%2C%20t.team_name%2C%20w.last_name%2C%20w.first_name%2C%20w.gender%2C%20g.order_number%2C%20l.order_number%2C%2020%2C%2018%2C%20w.eligible&gbId=36&firstName=&lastName=&teamName={quote(team_name)}&gender=&gradeId=&phyClearance=&levelId=&leagueId=&limit=250&eligible=&RANDOM={int(time.time()*1000) % 100000}"
             
             logger.info(f"Fetching: {url}")
             
-            response = requests.get(url, timeout=30)
+            response = timed_get('getWrestlers', url)
             
             if response.status_code == 200:
                 data = response.text
                 logger.info(f"Got response: {len(data)} bytes")
+                archive_response('roster', url, data, team_name=team_name, season_id=season_id)
                 
                 # Remove wrapping quotes if present
                 if data.startswith('"') and data.endswith('"'):
                     data = data[1:-1]
                 
                 # Parse JSON array directly
-                roster_data = json.loads(data)
+                with span('decode', endpoint='getWrestlers'):
+                    roster_data = json.loads(data)
                 logger.info(f"Parsed {len(roster_data)} roster entries")
+                check_columns('roster', roster_data)
                 
-                # Parse roster entries
-                # entry[2] = first name
-                # entry[3] = last name
-                # entry[9] = weight class
-                # entry[11] = grade
-                
-                for idx, entry in enumerate(roster_data):
-                    try:
-                        first_name = entry[2] if len(entry) > 2 else ""
-                        last_name = entry[3] if len(entry) > 3 else ""
-                        weight_class = entry[9] if len(entry) > 9 else ""
-                        grade = entry[11] if len(entry) > 11 else ""
-                        
-                        full_name = f"{first_name} {last_name}".strip()
-                        
-                        if full_name:
-                            wrestler = {
-                                'name': full_name,
-                                'weight_class': str(weight_class) if weight_class else '',
-                                'grade': str(grade) if grade else '',
-                                'record': ''
-                            }
-                            
-                            roster.append(wrestler)
-                            logger.info(f"  {idx+1}. {full_name} - {weight_class} lbs - {grade}")
-                    
-                    except Exception as e:
-                        logger.warning(f"Error parsing roster entry {idx}: {e}")
-                        continue
+                roster = []
+                with span('normalize', endpoint='getWrestlers'):
+                    for idx, entry in enumerate(roster_data):
+                        try:
+                            if exact and not same_team(str(column(entry, 'roster', 'team')), team_name):
+                                continue
+                            wrestler = parse_roster_entry(entry)
+                            if wrestler:
+                                roster.append(wrestler)
+                        except Exception as e:
+                            logger.warning(f"Error parsing roster entry {idx}: {e}")
+                            continue
                 
-                logger.info(f"Successfully got {len(roster)} wrestlers")
                 return roster
                 
             else:
@@ -202,46 +319,176 @@ def scrape_team_roster(team_id: str, season_id: str) -> List[Dict]:
         except Exception as e:
             retries += 1
             if retries < MAX_RETRIES:
+                record_retry('getWrestlers')
                 logger.warning(f"Error: {e}. Retrying in {pause} seconds... (Attempt {retries}/{MAX_RETRIES})")
                 time.sleep(pause)
                 pause *= 2
             else:
                 logger.error(f"Failed after {MAX_RETRIES} attempts: {e}")
-                return []
+                return None
     
-    return []
+    return None
 
-def main():
-    """Main function"""
+def scrape_team_roster(team_id: str, season_id: str, team_name: str = TEAM_NAME) -> List[Dict]:
+    """Scrape roster using direct AJAX endpoint"""
     
-    logger.info("Starting Shawnee Wrestling Scraper")
-    logger.info(f"Current date: {datetime.now()}")
+    logger.info("="*60)
+    logger.info(f"Scraping roster for Team ID: {team_id}")
+    logger.info("="*60)
+    
+    roster = fetch_wrestlers(season_id, team_name) or []
+    for idx, wrestler in enumerate(roster):
+        logger.info(f"  {idx+1}. {wrestler['name']} - {wrestler['weight_class']} lbs - {wrestler['grade']}")
+    
+    logger.info(f"Successfully got {len(roster)} wrestlers")
+    return roster
+
+def scrape_all(team_id: str = TEAM_ID, season_id: str = SEASON_ID, previous: Optional[Dict] = None) -> Dict:
+    """Scrape schedule, roster and bout results into the wrestling_data.json structure"""
     
     # Get schedule
-    schedule = scrape_team_schedule(TEAM_ID, SEASON_ID)
+    with span('step', step='schedule'):
+        schedule = scrape_team_schedule(team_id, season_id)
     
     # Get roster
-    roster = scrape_team_roster(TEAM_ID, SEASON_ID)
+    with span('step', step='roster'):
+        roster = scrape_team_roster(team_id, season_id)
+    
+    # Event details (venue address, event type, team scores, weigh-in) within a fixed time budget;
+    # runs first because brackets go by the event type
+    with span('step', step='enrichment'):
+        try:
+            from enrichment import enrich
+            enrich(schedule)
+        except Exception as e:
+            logger.warning(f"Could not update event details: {e}")
+    
+    # Get bout results (only for events that are new or may still change)
+    previous_results = (previous or {}).get('results', [])
+    with span('step', step='results'):
+        try:
+            from results_engine import ResultsEngine
+            engine = ResultsEngine(team_id, season_id)
+            results = engine.update(schedule, previous_results)
+            fetched = engine.fetched
+        except Exception as e:
+            logger.warning(f"Could not update results: {e}")
+            results = previous_results
+            fetched = {}
+    
+    # Tournament brackets (completed tournaments come from the permanent cache)
+    with span('step', step='brackets'):
+        try:
+            from brackets import BracketIngestor, merge_results
+            ingestor = BracketIngestor()
+            results = merge_results(results, ingestor.ingest(schedule))
+            for event_id in ingestor.fetched:
+                fetched[event_id] = [r for r in results if r.get('event_id') == event_id]
+        except Exception as e:
+            logger.warning(f"Could not update brackets: {e}")
+    
+    # Fill in W-L records, applying only the bouts fetched this run
+    with span('step', step='records'):
+        try:
+            from records import RecordBook
+            book = RecordBook()
+            book.sync(results, fetched)
+            book.save()
+            book.attach(roster)
+        except Exception as e:
+            logger.warning(f"Could not update records: {e}")
+    
+    # Rate only bouts newer than the ratings checkpoint
+    with span('step', step='ratings'):
+        try:
+            from ratings import RatingEngine
+            ratings = RatingEngine()
+            if ratings.update(results):
+                ratings.save()
+        except Exception as e:
+            logger.warning(f"Could not update ratings: {e}")
     
     # Create data structure
-    data = {
+    return {
         'metadata': {
-            'team_id': TEAM_ID,
-            'season_id': SEASON_ID,
+            'team_id': team_id,
+            'season_id': season_id,
             'last_updated': datetime.now(EST).isoformat(),
             'team_name': 'Shawnee High School'
         },
         'roster': roster,
         'schedule': schedule,
-        'results': []
+        'results': results
     }
+
+def load_data(path: str = OUTPUT_FILE) -> Optional[Dict]:
+    """Load a previously saved data file, or None if there isn't a readable one"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not read previous data: {e}")
+        return None
+
+def save_data(data: Dict, output_file: str = OUTPUT_FILE) -> None:
+    """Write the data file atomically, then record the scrape in history and the change log"""
     
-    # Save to JSON
-    output_file = 'data/wrestling_data.json'
-    os.makedirs('data', exist_ok=True)
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    previous = load_data(output_file)
+    
+    # Write to a temp file and rename so readers never see a half-written file
+    with span('write', target='data_file'):
+        tmp_file = f"{output_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, output_file)
+    
+    # Keep every scrape queryable, not just the latest one
+    with span('write', target='history'):
+        try:
+            from history_store import HistoryStore
+            with HistoryStore(HISTORY_DB) as store:
+                store.ingest(data)
+            logger.info(f"Recorded scrape in: {HISTORY_DB}")
+        except Exception as e:
+            logger.warning(f"Could not update history store: {e}")
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Link any new roster entries to the same wrestler in earlier seasons
+    with span('write', target='identity_map'):
+        try:
+            from history_store import HistoryStore
+            from identity import IdentityMap, store_records
+            identities = IdentityMap(IDENTITY_MAP)
+            with HistoryStore(HISTORY_DB) as store:
+                if identities.add_records(store_records(store)):
+                    identities.save()
+        except Exception as e:
+            logger.warning(f"Could not update identity map: {e}")
+    
+    # Record what changed since the previous scrape
+    with span('write', target='change_log'):
+        try:
+            from change_log import ChangeLog
+            ChangeLog(CHANGE_LOG).record(previous, data)
+        except Exception as e:
+            logger.warning(f"Could not update change log: {e}")
+
+def main():
+    """Main function"""
+    
+    logger.info("Starting Shawnee Wrestling Scraper")
+    logger.info(f"Current date: {datetime.now()}")
+    start_run()
+    
+    data = scrape_all(TEAM_ID, SEASON_ID, previous=load_data(OUTPUT_FILE))
+    roster = data['roster']
+    schedule = data['schedule']
+    
+    # Save to JSON
+    output_file = OUTPUT_FILE
+    save_data(data, output_file)
     
     logger.info("="*60)
     logger.info("COMPLETE")
@@ -249,8 +496,14 @@ def main():
     logger.info(f"Saved to: {output_file}")
     logger.info(f"Roster entries: {len(roster)}")
     logger.info(f"Schedule entries: {len(schedule)}")
+    logger.info(f"Bout results: {len(data['results'])}")
     logger.info("="*60)
     
+    try:
+        finish_run()
+    except Exception as e:
+        logger.warning(f"Could not write run report: {e}")
+    
     if schedule or roster:
         print("\n✓ SUCCESS!")
         if roster:
@@ -264,5 +517,7 @@ def main():
         print("\n✗ NO DATA")
         print("Check logs above for errors")
 
+load_column_map()
+
 if __name__ == "__main__":
     main()
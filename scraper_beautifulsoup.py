@@ -11,7 +11,9 @@ from typing import Dict, List
 import logging
 import os
 import requests
-from bs4 import BeautifulSoup
+
+from debug_store import save_artifact
+from scraper_ajax_method import archive_response
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -31,8 +33,10 @@ class TrackWrestlingScraper:
             'Connection': 'keep-alive',
         })
     
-    def fetch_page(self, page_name: str) -> BeautifulSoup:
+    def fetch_page(self, page_name: str) -> 'BeautifulSoup':
         """Fetch a page from TrackWrestling"""
+        from bs4 import BeautifulSoup
+        
         url = f"{self.base_url}?seasonId={self.season_id}&gbId=36&pageName={page_name};teamId={self.team_id}"
         
         logger.info(f"Fetching: {page_name}")
@@ -45,12 +49,11 @@ class TrackWrestlingScraper:
             logger.info(f"Response status: {response.status_code}")
             logger.info(f"Final URL: {response.url}")
             logger.info(f"Content length: {len(response.text)} bytes")
+            archive_response('page', url, response.text, page_name=page_name,
+                             team_id=self.team_id, season_id=self.season_id)
             
-            # Save HTML for debugging
-            debug_file = f'/tmp/{page_name.replace(".jsp", "")}_debug.html'
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            logger.info(f"Saved to: {debug_file}")
+            # Save HTML for debugging (only with DEBUG_ARTIFACTS=1; written in the background)
+            save_artifact(page_name, response.text, url=url, status=response.status_code)
             
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -70,7 +73,10 @@ class TrackWrestlingScraper:
         logger.info("SCRAPING SCHEDULE")
         logger.info("="*60)
         
-        soup = self.fetch_page("TeamSchedule.jsp")
+        return self.parse_schedule(self.fetch_page("TeamSchedule.jsp"))
+    
+    def parse_schedule(self, soup: 'BeautifulSoup') -> List[Dict]:
+        """Schedule rows from a TeamSchedule.jsp page"""
         schedule = []
         
         tables = soup.find_all('table')
@@ -125,7 +131,10 @@ class TrackWrestlingScraper:
         logger.info("SCRAPING ROSTER")
         logger.info("="*60)
         
-        soup = self.fetch_page("TeamRoster.jsp")
+        return self.parse_roster(self.fetch_page("TeamRoster.jsp"))
+    
+    def parse_roster(self, soup: 'BeautifulSoup') -> List[Dict]:
+        """Roster rows from a TeamRoster.jsp page"""
         roster = []
         
         tables = soup.find_all('table')
@@ -168,7 +177,10 @@ class TrackWrestlingScraper:
         logger.info("SCRAPING RESULTS")
         logger.info("="*60)
         
-        soup = self.fetch_page("TeamResults.jsp")
+        return self.parse_results(self.fetch_page("TeamResults.jsp"))
+    
+    def parse_results(self, soup: 'BeautifulSoup') -> List[Dict]:
+        """Results rows from a TeamResults.jsp page"""
         results = []
         
         tables = soup.find_all('table')
@@ -256,7 +268,7 @@ def main():
     
     if len(data['schedule']) == 0:
         logger.warning("\n⚠️  NO SCHEDULE DATA FOUND!")
-        logger.warning("Check the HTML files saved in /tmp/ to see what was returned")
+        logger.warning("Rerun with DEBUG_ARTIFACTS=1 and check 'python debug_store.py runs' to see what was returned")
 
 
 if __name__ == "__main__":
@@ -80,6 +80,7 @@ class TrackWrestlingDataBlobScraper:
                 # row[12] = Home/Away indicator (H/A)
                 # row[16] = Opponent/Location
                 
+                event_id = row[0] if len(row) > 0 else ""
                 event_name = row[2] if len(row) > 2 else ""
                 date_str = row[3] if len(row) > 3 else ""
                 time_str = row[4] if len(row) > 4 else ""
@@ -132,6 +133,7 @@ class TrackWrestlingDataBlobScraper:
                     match_location = location or "TBD"
                 
                 match = {
+                    'event_id': str(event_id) if event_id else '',
                     'date': formatted_date,
                     'opponent': opponent,
                     'location': match_location,
@@ -184,17 +186,18 @@ class TrackWrestlingDataBlobScraper:
         # For now, return empty array
         return []
     
-    def scrape_results(self) -> List[Dict]:
-        """Scrape results"""
+    def scrape_results(self, schedule: List[Dict]) -> List[Dict]:
+        """Scrape bout results for the past events on the schedule"""
         logger.info("="*60)
         logger.info("SCRAPING RESULTS")
         logger.info("="*60)
         
-        # Results would be parsed similarly from their data blob
-        return []
+        from results_engine import ResultsEngine
+        return ResultsEngine(self.team_id, self.season_id).update(schedule, [])
     
     def scrape_all(self) -> Dict:
         """Scrape all data"""
+        schedule = self.scrape_schedule()
         data = {
             'metadata': {
                 'team_id': self.team_id,
@@ -203,8 +206,8 @@ class TrackWrestlingDataBlobScraper:
                 'team_name': 'Shawnee High School'
             },
             'roster': self.scrape_roster(),
-            'schedule': self.scrape_schedule(),
-            'results': self.scrape_results()
+            'schedule': schedule,
+            'results': self.scrape_results(schedule)
         }
         
         return data
@@ -11,7 +11,9 @@ from typing import Dict, List
 import logging
 import os
 import requests
-from bs4 import BeautifulSoup
+
+from debug_store import save_artifact
+from scraper_ajax_method import archive_response
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -31,6 +33,8 @@ class TrackWrestlingFrameScraper:
     
     def find_frame_url(self, main_url: str) -> str:
         """Find the iframe URL that contains the actual data"""
+        from bs4 import BeautifulSoup
+        
         logger.info(f"Fetching main page: {main_url}")
         
         try:
@@ -200,11 +204,10 @@ class TrackWrestlingFrameScraper:
             response = self.session.get(frame_url, timeout=30)
             html = response.text
             logger.info(f"Got frame content: {len(html)} bytes")
+            archive_response('frame', frame_url, html, team_id=self.team_id, season_id=self.season_id)
             
-            # Save for debugging
-            with open('/tmp/frame_content.html', 'w', encoding='utf-8') as f:
-                f.write(html)
-            logger.info("Saved to /tmp/frame_content.html")
+            # Save for debugging (only with DEBUG_ARTIFACTS=1; written in the background)
+            save_artifact('frame_content', html, url=frame_url)
             
         except Exception as e:
             logger.error(f"Error fetching frame: {e}")
@@ -272,7 +275,7 @@ def main():
             print(f"  {match['date']} - {match['opponent']} @ {match['location']}, {match['time']}")
     else:
         print("\n✗ NO SCHEDULE DATA")
-        print("Check /tmp/frame_content.html to see what was returned")
+        print("Rerun with DEBUG_ARTIFACTS=1 and check 'python debug_store.py runs' to see what was returned")
 
 
 if __name__ == "__main__":
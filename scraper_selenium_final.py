@@ -12,6 +12,9 @@ import logging
 import os
 import time
 
+from debug_store import save_artifact
+from scraper_ajax_method import archive_response
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -72,11 +75,11 @@ def scrape_trackwrestling(team_id: str, season_id: str) -> Dict:
         # Get page source
         page_source = driver.page_source
         logger.info(f"Got page source: {len(page_source)} bytes")
+        archive_response('selenium_page', driver.current_url, page_source, source="main page",
+                         team_id=team_id, season_id=season_id)
         
-        # Save for debugging
-        with open('/tmp/selenium_page.html', 'w', encoding='utf-8') as f:
-            f.write(page_source)
-        logger.info("Saved to /tmp/selenium_page.html")
+        # Save for debugging (only with DEBUG_ARTIFACTS=1; written in the background)
+        save_artifact('selenium_page', page_source, url=driver.current_url)
         
         # Check for iframes
         iframes = driver.find_elements(By.TAG_NAME, "iframe")
@@ -98,11 +101,11 @@ def scrape_trackwrestling(team_id: str, season_id: str) -> Dict:
                     
                     frame_source = driver.page_source
                     logger.info(f"Frame {idx} source: {len(frame_source)} bytes")
+                    archive_response('selenium_page', driver.current_url, frame_source, source=f"iframe {idx}",
+                                     team_id=team_id, season_id=season_id)
                     
                     # Save frame source
-                    with open(f'/tmp/selenium_frame_{idx}.html', 'w', encoding='utf-8') as f:
-                        f.write(frame_source)
-                    logger.info(f"Saved to /tmp/selenium_frame_{idx}.html")
+                    save_artifact(f'selenium_frame_{idx}', frame_source, url=driver.current_url)
                     
                     schedule = extract_schedule_from_html(frame_source, f"iframe {idx}")
                     
@@ -294,7 +297,7 @@ def main():
             print()
     else:
         print("\n✗ NO SCHEDULE FOUND")
-        print("Check /tmp/selenium_*.html files")
+        print("Rerun with DEBUG_ARTIFACTS=1 and check 'python debug_store.py runs'")
 
 if __name__ == "__main__":
     main()
@@ -23,5 +23,12 @@ SEASONS = {
     # }
 }
 
+# League teams for the current season (team name -> TrackWrestling team ID)
+# Used by league_schedule.py; find IDs in each team's TrackWrestling URL (teamId=...)
+LEAGUE_TEAMS = {
+    "Shawnee": TEAM_ID,
+    # "Moorestown": "TEAM_ID",
+}
+
 # TrackWrestling URLs (for reference)
 # Format: https://www.trackwrestling.com/tw/seasons/LoadBalance.jsp?seasonId={SEASON_ID}&gbId=36&pageName=TeamRoster.jsp;teamId={TEAM_ID}
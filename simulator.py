@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Dual Meet Simulator
+Monte Carlo win probabilities for a dual meet and a search over bump-up lineups
+"""
+
+import argparse
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from ratings import SCALE, RatingEngine
+from results_engine import TEAM_POINTS
+from scraper_ajax_method import OUTPUT_FILE, load_data
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+WEIGHT_CLASSES = ['106', '113', '120', '126', '132', '138', '144', '150', '157', '165', '175', '190', '215', '285']
+SIMULATIONS = 20000
+MAX_WORKERS = os.cpu_count() or 2
+MAX_CHAIN = 3              # longest run of consecutive bump-ups to try
+BUMP_PENALTY = 40.0        # Elo points a wrestler gives up moving up a weight
+TEAM_NAME = "Shawnee"
+
+# How wins are split by type when a wrestler has no history: decision, major, tech, fall
+WIN_TYPE_ORDER = ['D', 'MD', 'TF', 'F']
+DEFAULT_MIX = [0.45, 0.2, 0.1, 0.25]
+FORFEIT_POINTS = TEAM_POINTS['FF']
+
+
+def load_numpy():
+    try:
+        import numpy as np
+        return np
+    except ImportError:
+        logger.error("numpy not installed. Run: pip install numpy")
+        return None
+
+
+def parse_record(record: str) -> Tuple[int, int]:
+    try:
+        wins, losses = (record or '').split('-')[:2]
+        return int(wins), int(losses)
+    except ValueError:
+        return 0, 0
+
+
+def competitor(entry: Dict, ratings: Optional[RatingEngine], team: str) -> Dict:
+    """A roster entry with what the simulator needs: rating or record, and a win-type mix"""
+    wins, losses = parse_record(entry.get('record', ''))
+    breakdown = entry.get('record_breakdown') or {}
+    counts = [breakdown.get(k, 0) for k in ('decisions', 'majors', 'tech_falls', 'falls')]
+
+    # Smooth toward the default mix so two falls in two bouts doesn't mean 100% pins
+    total = sum(counts) + 4
+    mix = [(c + 4 * d) / total for c, d in zip(counts, DEFAULT_MIX)]
+
+    rating = entry.get('rating')
+    if rating is None and ratings is not None:
+        found = ratings.rating_for(entry.get('name', ''), team)
+        rating = found['rating'] if found else None
+
+    return {
+        'name': entry.get('name', ''),
+        'weight_class': str(entry.get('weight_class', '')),
+        'rating': rating,
+        'win_pct': (wins + 1) / (wins + losses + 2),
+        'mix': mix,
+    }
+
+
+def win_probability(ours: Dict, theirs: Dict, bump: int = 0) -> float:
+    """Chance our wrestler wins: Elo when both are rated, otherwise log5 on smoothed records"""
+    if ours['rating'] is not None and theirs['rating'] is not None:
+        diff = theirs['rating'] - (ours['rating'] - BUMP_PENALTY * bump)
+        return 1.0 / (1.0 + 10 ** (diff / SCALE))
+
+    p, q = ours['win_pct'], theirs['win_pct']
+    p = p * (1 - 0.1 * bump)
+    return p * (1 - q) / (p * (1 - q) + q * (1 - p))
+
+
+def matchups(lineup: Dict[str, Dict], opponents: Dict[str, Dict]) -> List[Dict]:
+    """Per-weight bout setup: win probability and both sides' point mixes (or a forfeit)"""
+    bouts = []
+    for weight in WEIGHT_CLASSES:
+        ours, theirs = lineup.get(weight), opponents.get(weight)
+        if ours is None and theirs is None:
+            continue
+        if ours is None or theirs is None:
+            bouts.append({'weight': weight, 'forfeit': 'ours' if ours else 'theirs'})
+            continue
+        bump = WEIGHT_CLASSES.index(weight) - WEIGHT_CLASSES.index(ours['weight_class']) \
+            if ours['weight_class'] in WEIGHT_CLASSES else 0
+        bouts.append({
+            'weight': weight,
+            'p': win_probability(ours, theirs, bump),
+            'our_mix': ours['mix'],
+            'their_mix': theirs['mix'],
+        })
+    return bouts
+
+
+def simulate(bouts: List[Dict], sims: int = SIMULATIONS, seed: int = 0) -> Dict:
+    """Simulate every bout of every dual at once; returns win probability and score distribution"""
+    np = load_numpy()
+    rng = np.random.default_rng(seed)
+    values = np.array([TEAM_POINTS[t] for t in WIN_TYPE_ORDER], dtype=np.int64)
+
+    ours = np.zeros(sims, dtype=np.int64)
+    theirs = np.zeros(sims, dtype=np.int64)
+    contested = [b for b in bouts if 'forfeit' not in b]
+    ours += FORFEIT_POINTS * sum(1 for b in bouts if b.get('forfeit') == 'ours')
+    theirs += FORFEIT_POINTS * sum(1 for b in bouts if b.get('forfeit') == 'theirs')
+
+    if contested:
+        p = np.array([b['p'] for b in contested])
+        our_cum = np.cumsum([b['our_mix'] for b in contested], axis=1)
+        their_cum = np.cumsum([b['their_mix'] for b in contested], axis=1)
+
+        won = rng.random((sims, len(contested))) < p
+        u = rng.random((sims, len(contested)))[:, :, None]
+        our_pts = values[np.minimum((u > our_cum[None]).sum(axis=2), len(values) - 1)]
+        their_pts = values[np.minimum((u > their_cum[None]).sum(axis=2), len(values) - 1)]
+
+        ours += np.where(won, our_pts, 0).sum(axis=1)
+        theirs += np.where(won, 0, their_pts).sum(axis=1)
+
+    margin = ours - theirs
+    return {
+        'win_probability': float((margin > 0).mean()),
+        'tie_probability': float((margin == 0).mean()),
+        'expected_score': [round(float(ours.mean()), 1), round(float(theirs.mean()), 1)],
+        'margin_percentiles': {str(q): int(v) for q, v in zip((5, 25, 50, 75, 95),
+                                                              np.percentile(margin, [5, 25, 50, 75, 95]))},
+        'bout_win_probability': {b['weight']: round(b['p'], 3) for b in contested},
+    }
+
+
+def depth_chart(roster: List[Dict]) -> Dict[str, List[Dict]]:
+    """Wrestlers at each weight, best first (by rating, then record)"""
+    chart: Dict[str, List[Dict]] = {}
+    for wrestler in roster:
+        chart.setdefault(wrestler['weight_class'], []).append(wrestler)
+    for wrestlers in chart.values():
+        wrestlers.sort(key=lambda w: (w['rating'] or 0, w['win_pct']), reverse=True)
+    return chart
+
+
+def candidate_lineups(chart: Dict[str, List[Dict]], max_chain: int = MAX_CHAIN) -> List[Tuple[str, Dict[str, Dict]]]:
+    """The starting lineup plus every chain of up to max_chain one-weight bump-ups (backfilled or forfeited)"""
+    lineup = {weight: wrestlers[0] for weight, wrestlers in chart.items()}
+    candidates = [('as weighed', lineup)]
+    for start in range(len(WEIGHT_CLASSES) - 1):
+        for length in range(1, max_chain + 1):
+            chain = WEIGHT_CLASSES[start:start + length + 1]
+            if len(chain) < length + 1 or any(w not in lineup for w in chain[:-1]):
+                break
+            bumped = dict(lineup)
+            backups = chart[chain[0]][1:]
+            if backups:
+                bumped[chain[0]] = backups[0]
+            else:
+                bumped.pop(chain[0])
+            for lower, upper in zip(chain, chain[1:]):
+                bumped[upper] = lineup[lower]
+            moves = ', '.join(f"{lineup[w]['name']} {w}->{u}" for w, u in zip(chain, chain[1:]))
+            candidates.append((moves, bumped))
+    return candidates
+
+
+def evaluate(args: Tuple[str, Dict[str, Dict], Dict[str, Dict], int, int]) -> Dict:
+    """One lineup's simulation (runs in a worker process)"""
+    label, lineup, opponents, sims, seed = args
+    result = simulate(matchups(lineup, opponents), sims, seed)
+    result['lineup'] = label
+    return result
+
+
+def search_lineups(chart: Dict[str, List[Dict]], opponents: Dict[str, Dict], sims: int = SIMULATIONS,
+                   workers: int = MAX_WORKERS, top: int = 5, seed: int = 0) -> List[Dict]:
+    """Simulate every candidate lineup across a process pool, best first"""
+    # Same seed for every lineup so differences come from the lineup, not the dice
+    jobs = [(label, candidate, opponents, sims, seed) for label, candidate in candidate_lineups(chart)]
+    if workers <= 1:
+        results = [evaluate(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(evaluate, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    results.sort(key=lambda r: (-r['win_probability'], -(r['expected_score'][0] - r['expected_score'][1])))
+    return results[:top]
+
+
+def opponent_roster(team: str, ratings: RatingEngine, path: Optional[str] = None) -> List[Dict]:
+    """Opponent wrestlers from a roster file, or from everyone on that team in the ratings"""
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return [
+        {'name': e['name'], 'weight_class': e['weight_class'], 'rating': e['rating']}
+        for e in ratings.ratings.values() if team.lower() in e['team'].lower()
+    ]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Simulate a dual meet and search bump-up lineups")
+    parser.add_argument('opponent', help="Opponent team name as it appears in results")
+    parser.add_argument('--opponent-file', help="JSON roster for the opponent ({name, weight_class, record})")
+    parser.add_argument('--sims', type=int, default=SIMULATIONS)
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS)
+    parser.add_argument('--top', type=int, default=5)
+    args = parser.parse_args()
+
+    if load_numpy() is None:
+        return
+
+    data = load_data(OUTPUT_FILE) or {}
+    ratings = RatingEngine()
+    ours = depth_chart([competitor(w, ratings, TEAM_NAME) for w in data.get('roster', [])])
+    theirs = {weight: wrestlers[0] for weight, wrestlers in depth_chart(
+        [competitor(w, ratings, args.opponent)
+         for w in opponent_roster(args.opponent, ratings, args.opponent_file)]).items()}
+    if not theirs:
+        logger.error(f"No wrestlers found for {args.opponent}; pass --opponent-file")
+        return
+
+    logger.info("="*60)
+    logger.info(f"{TEAM_NAME} vs {args.opponent}: {args.sims} simulations per lineup")
+    logger.info("="*60)
+
+    for rank, result in enumerate(search_lineups(ours, theirs, args.sims, args.workers, args.top), 1):
+        ours_pts, theirs_pts = result['expected_score']
+        print(f"{rank}. {result['lineup']}")
+        print(f"   win {result['win_probability']:.1%}  tie {result['tie_probability']:.1%}  "
+              f"expected {ours_pts}-{theirs_pts}  margin p5/p50/p95 "
+              f"{result['margin_percentiles']['5']}/{result['margin_percentiles']['50']}/"
+              f"{result['margin_percentiles']['95']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Season Stats
+Bonus-point rate, pin rate, average margin and team points per wrestler and per weight class
+"""
+
+import argparse
+import json
+import logging
+from typing import Dict, List, Optional
+
+from results_engine import TEAM_POINTS, score_margin
+from scraper_ajax_method import OUTPUT_FILE, load_data, weight_sort_key
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+WIN_TYPES = ['F', 'TF', 'MD', 'D', 'FF', 'INJ', 'DQ', 'NC']
+BONUS_TYPES = ['F', 'TF', 'MD']
+MIN_BOUTS = 1
+
+
+def load_numpy():
+    try:
+        import numpy as np
+        return np
+    except ImportError:
+        logger.error("numpy not installed. Run: pip install numpy")
+        return None
+
+
+class BoutColumns:
+    """Bouts as parallel arrays, one row per wrestler per bout (winner row and loser row)"""
+
+    def __init__(self, bouts: List[Dict]):
+        np = load_numpy()
+        if np is None:
+            raise ImportError("numpy is required for stats")
+        self.np = np
+
+        codes = {t: i for i, t in enumerate(WIN_TYPES)}
+        n = len(bouts)
+
+        # Intern wrestler labels and score strings; both repeat heavily across a season
+        ids: Dict[str, int] = {}
+        winners = [ids.setdefault(f"{b.get('winner', '')}|{b.get('winner_team', '')}", len(ids)) for b in bouts]
+        losers = [ids.setdefault(f"{b.get('loser', '')}|{b.get('loser_team', '')}", len(ids)) for b in bouts]
+        scores: Dict[str, int] = {}
+        score_ids = np.fromiter((scores.setdefault(b.get('score', ''), len(scores)) for b in bouts),
+                                dtype=np.int64, count=n)
+        score_margins = np.array([np.nan if (m := score_margin(s)) is None else m for s in scores],
+                                 dtype=np.float64)
+
+        # Weight classes as codes in weight order, so "HWT" or "285+" sort after the numbered classes
+        self.weight_labels = sorted({str(b.get('weight_class') or '') for b in bouts}, key=weight_sort_key)
+        weight_codes = {w: i for i, w in enumerate(self.weight_labels)}
+        weight = np.fromiter((weight_codes[str(b.get('weight_class') or '')] for b in bouts), dtype=np.int32, count=n)
+        win_type = np.fromiter((codes.get(b.get('win_type'), codes['D']) for b in bouts), dtype=np.int8, count=n)
+        margin = score_margins[score_ids] if n else np.zeros(0)
+
+        self.labels = list(ids)
+        self.wrestler = np.array(winners + losers, dtype=np.int64)
+        self.weight = np.concatenate([weight, weight])
+        self.win_type = np.concatenate([win_type, win_type])
+        self.won = np.concatenate([np.ones(n, dtype=bool), np.zeros(n, dtype=bool)])
+        self.margin = np.concatenate([margin, -margin])
+
+        # A no contest is neither a win nor a loss
+        self.decided = self.win_type != codes['NC']
+        self.won &= self.decided
+
+        points_by_code = np.array([TEAM_POINTS.get(t, 0) for t in WIN_TYPES], dtype=np.int64)
+        self.points = np.where(self.won, points_by_code[self.win_type], 0)
+        self.bonus = self.won & np.isin(self.win_type, [codes[t] for t in BONUS_TYPES])
+        self.pins = self.won & (self.win_type == codes['F'])
+
+    def split_labels(self):
+        if not len(self.labels):
+            return [], []
+        names, teams = zip(*(label.split('|', 1) for label in self.labels))
+        return list(names), list(teams)
+
+    def team_rows(self, team: str):
+        """Row mask for wrestlers whose team contains the given text"""
+        np = self.np
+        _, teams = self.split_labels()
+        ours = np.char.find(np.char.lower(np.array(teams, dtype=str)), team.lower()) >= 0
+        return ours[self.wrestler]
+
+    def aggregate(self, group, size: int, rows=None) -> Dict:
+        """Every stat for every group in one pass of bincounts, over all rows or a row mask"""
+        np = self.np
+        if rows is None:
+            rows = np.ones(len(group), dtype=bool)
+        group = group[rows]
+        has_margin = ~np.isnan(self.margin[rows])
+
+        def total(values):
+            return np.bincount(group, weights=values[rows], minlength=size)
+
+        bouts = total(self.decided)
+        wins = total(self.won)
+        bonus = total(self.bonus)
+        pins = total(self.pins)
+        points = total(self.points)
+        margin_sum = np.bincount(group[has_margin], weights=self.margin[rows][has_margin], minlength=size)
+        margin_n = np.bincount(group[has_margin], minlength=size)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'bouts': bouts.astype(np.int64),
+                'wins': wins.astype(np.int64),
+                'losses': (bouts - wins).astype(np.int64),
+                'bonus_rate': np.where(wins > 0, bonus / wins, 0.0),
+                'pin_rate': np.where(wins > 0, pins / wins, 0.0),
+                'avg_margin': np.where(margin_n > 0, margin_sum / margin_n, np.nan),
+                'team_points': points.astype(np.int64),
+            }
+
+
+def to_rows(keys: Dict[str, List], stats: Dict, mask) -> List[Dict]:
+    """Turn column arrays into table rows, keeping only the masked groups"""
+    rows = []
+    columns = {**keys, **{k: v.tolist() for k, v in stats.items()}}
+    for i in mask.nonzero()[0].tolist():
+        row = {k: v[i] for k, v in columns.items()}
+        for k in ('bonus_rate', 'pin_rate', 'avg_margin'):
+            row[k] = None if row[k] != row[k] else round(row[k], 3)
+        rows.append(row)
+    rows.sort(key=lambda r: (-r['team_points'], -r['wins']))
+    return rows
+
+
+def wrestler_stats(columns: BoutColumns, team: Optional[str] = None, min_bouts: int = MIN_BOUTS) -> List[Dict]:
+    """Per-wrestler table, optionally limited to one team"""
+    stats = columns.aggregate(columns.wrestler, len(columns.labels))
+    names, teams = columns.split_labels()
+
+    mask = stats['bouts'] >= min_bouts
+    if team:
+        mask &= columns.np.bincount(columns.wrestler, weights=columns.team_rows(team),
+                                    minlength=len(columns.labels)) > 0
+    return to_rows({'wrestler': names, 'team': teams}, stats, mask)
+
+
+def weight_class_stats(columns: BoutColumns, team: Optional[str] = None) -> List[Dict]:
+    """Per-weight-class table; league-wide each bout counts once per side"""
+    np = columns.np
+    weights, group = np.unique(columns.weight, return_inverse=True)
+    rows = columns.team_rows(team) if team else None
+
+    stats = columns.aggregate(group.astype(np.int64), len(weights), rows)
+    labels = [columns.weight_labels[code] for code in weights.tolist()]
+    table = to_rows({'weight_class': labels}, stats, stats['bouts'] > 0)
+    table.sort(key=lambda r: weight_sort_key(r['weight_class']))
+    return table
+
+
+def print_table(rows: List[Dict], key_columns: List[str]):
+    header = key_columns + ['W', 'L', 'bonus%', 'pin%', 'margin', 'pts']
+    print('  '.join(f"{h:>8}" if h not in ('wrestler', 'team') else f"{h:<24}" for h in header))
+    for row in rows:
+        cells = [f"{str(row[k]):<24}" if k in ('wrestler', 'team') else f"{row[k]:>8}" for k in key_columns]
+        margin = '' if row['avg_margin'] is None else f"{row['avg_margin']:+.1f}"
+        cells += [f"{row['wins']:>8}", f"{row['losses']:>8}", f"{row['bonus_rate']*100:>7.0f}%",
+                  f"{row['pin_rate']*100:>7.0f}%", f"{margin:>8}", f"{row['team_points']:>8}"]
+        print('  '.join(cells))
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Season stats from bout results")
+    parser.add_argument('table', choices=['wrestlers', 'weights'])
+    parser.add_argument('--input', nargs='+', default=[OUTPUT_FILE],
+                        help="Data files whose results to combine (e.g. every team in the league)")
+    parser.add_argument('--team', help="Only wrestlers whose team contains this text")
+    parser.add_argument('--min-bouts', type=int, default=MIN_BOUTS)
+    parser.add_argument('--json', action='store_true', help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    if load_numpy() is None:
+        return
+
+    # The same bout shows up in both teams' files; keep one copy
+    bouts = {}
+    for path in args.input:
+        for bout in (load_data(path) or {}).get('results', []):
+            bouts.setdefault(bout.get('bout_id') or id(bout), bout)
+    columns = BoutColumns(list(bouts.values()))
+
+    if args.table == 'wrestlers':
+        rows = wrestler_stats(columns, args.team, args.min_bouts)
+        keys = ['wrestler', 'team']
+    else:
+        rows = weight_class_stats(columns, args.team)
+        keys = ['weight_class']
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows, keys)
+
+
+if __name__ == "__main__":
+    main()
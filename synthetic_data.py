@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Synthetic Data
+Generates state-sized getTeamSchedule/getWrestlers rows, initDataGrid pages and bracket pages, and measures how the parsers scale with them
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from scraper_ajax_method import COLUMNS
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configuration
+OUTPUT_DIR = 'benchmarks/synthetic'
+SEED = 2026
+SEASON_START = date(2025, 12, 12)
+SEASON_DAYS = 80
+GB_ID = '36'
+SCHEDULE_WIDTH = 22        # getTeamSchedule rows have 22 fields, getWrestlers rows 14
+ROSTER_WIDTH = 14
+WEIGHTS = ['106', '113', '120', '126', '132', '138', '144', '150', '157', '165', '175', '190', '215', '285']
+GRADES = ['Fr.', 'So.', 'Jr.', 'Sr.']
+START_TIMES = ['0900', '0830', '1000', '1600', '1700', '1730', '1800', '1900', '']
+MAX_EXPONENT = 5           # the curve stops at 10^5 rows unless asked for more (10^6 needs a few GB)
+
+TOWNS = [
+    'Shawnee', 'Cherry Hill', 'Moorestown', 'Lenape', 'Cherokee', 'Seneca', 'Eastern', 'Washington Township',
+    'Kingsway', 'Delsea', 'Clearview', 'Williamstown', 'Toms River', 'Southern', 'Jackson', 'Howell',
+    'Brick', 'Hunterdon Central', 'Phillipsburg', 'Bergen Catholic', 'Delbarton', 'Paramus Catholic',
+    'Camden Catholic', 'Pennsville', 'Haddonfield', 'Collingswood', 'Pemberton', 'Rancocas Valley',
+    'Burlington', 'Hammonton', 'Ocean City', 'Mainland', 'Absegami', 'Middle Township', 'Millville',
+    'Vineland', 'Bridgeton', 'Hopewell Valley', 'Steinert', 'Hamilton', 'Nottingham', 'Allentown',
+    'Robbinsville', 'Princeton', 'Montgomery', 'Hillsborough', 'Bound Brook', 'Somerville', 'Bernards',
+    'Ridge', 'Warren Hills', 'North Hunterdon', 'Voorhees', 'Sussex Tech', 'High Point', 'Kittatinny',
+    'Vernon', 'Wayne Hills', 'Wayne Valley', 'Pope John', 'Morris Knolls', 'Roxbury', 'Mount Olive',
+]
+SUFFIXES = ['', ' East', ' West', ' North', ' South', ' Regional', ' Memorial', ' Central', ' Tech']
+FIRST_NAMES = [
+    'Aiden', 'Anthony', 'Benjamin', 'Caleb', 'Carlos', 'Chris', 'Colin', 'Daniel', 'Dylan', 'Evan', 'Gabriel',
+    'Garrett', 'Gavin', 'Gino', 'Giovanni', 'Jack', 'Jadiel', 'Jake', 'Joseph', 'Liam', 'Logan', 'Luis',
+    'Mason', 'Matt', 'Noah', 'Owen', 'Ryan', 'Tyler', 'Nicholas', 'Michael', 'Brandon', 'Ethan', 'Hunter',
+    'Isaiah', 'Jayden', 'Kevin', 'Lucas', 'Marco', 'Nathan', 'Patrick', 'Rocco', 'Sean', 'Vincent', 'Zach',
+]
+LAST_NAMES = [
+    'Adams', 'Augusta', 'Blahut', 'Borlaug', 'Brooks', 'Caldwell', 'Carter', 'Cole', 'Curiale', 'Davis',
+    'Dowd', 'Esquivel', 'Evans', 'Fitzpatrick', 'Ford', 'Gleeson', 'Gonzalez', 'Hart', 'Hayes', 'Lopez',
+    'Miller', 'Nguyen', 'Ortiz', 'Pollock', 'Price', 'Reed', 'Reice', 'Ross', 'Shaw', 'Sloan', 'Ward',
+    'Bianchi', 'Castillo', 'DeMarco', 'Kowalski', "O'Brien", 'Patel', 'Romano', 'Santiago', 'Sullivan',
+    'Thompson', 'Walsh', 'Yang', 'Zielinski', 'McCarthy', 'Russo', 'Ferraro', 'Kim', 'Murphy', 'Rivera',
+]
+TOURNAMENTS = ['{town} Invitational', '{town} Holiday Classic', '{town} Tri-Match', '{town} Quad',
+               'Beast of the East {year}', '{year} {town} Tournament']
+BRACKET_EVENT = re.compile(r'Invitational|Classic|Beast of the East|Tournament')   # the non tri/quad names above
+# (bracket wording, score text) pairs, in the proportions they show up on real brackets
+DECISIONS = [
+    ('by fall', 'Fall {m}:{s:02d}'), ('by fall', 'Fall {m}:{s:02d}'), ('by decision', 'Dec {w}-{l}'),
+    ('by decision', 'Dec {w}-{l}'), ('by decision', 'Dec {w}-{l}'), ('by major decision', 'MD {w8}-{l}'),
+    ('by tech fall', 'TF {w15}-{l} {m}:{s:02d}'), ('in sudden victory', 'SV-1 {w}-{l}'),
+]
+ROUNDS = ['Champ. Round 1', 'Champ. Round 2', 'Quarterfinal', 'Semifinal', 'Cons. Round 1', 'Cons. Round 2',
+          'Cons. Semi', '3rd Place Match', '1st Place Match']
+
+
+def team_names(count: int) -> List[str]:
+    """`count` distinct school names (towns first, then town + suffix)"""
+    names = [town + suffix for suffix in SUFFIXES for town in TOWNS]
+    extra = 2
+    while len(names) < count:
+        names.extend(f"{town} {extra}" for town in TOWNS)
+        extra += 1
+    return names[:count]
+
+
+class SyntheticSeason:
+    """A reproducible season of teams, events, wrestlers and bouts in TrackWrestling's layouts"""
+
+    def __init__(self, teams: int = 40, wrestlers: int = 40, events: int = 20, seed: int = SEED):
+        self.rng = random.Random(seed)
+        self.teams = [{'team_id': str(768996150 + i * 1009), 'name': name}
+                      for i, name in enumerate(team_names(teams))]
+        self.wrestlers_per_team = wrestlers
+        self.events_per_team = events
+        self.next_id = 7750000
+
+    def new_id(self) -> str:
+        self.next_id += self.rng.randint(1, 300)
+        return str(self.next_id)
+
+    def opponent(self, team: Dict) -> str:
+        """Any other team's name"""
+        other = self.rng.randrange(len(self.teams) - 1) if len(self.teams) > 1 else 0
+        if len(self.teams) > 1 and self.teams[other] is team:
+            other = len(self.teams) - 1
+        return self.teams[other]['name']
+
+    def schedule_row(self, team: Dict) -> List[str]:
+        """One getTeamSchedule row for `team` (a dual, or a tournament it attends)"""
+        columns = COLUMNS['schedule']
+        row = [''] * SCHEDULE_WIDTH
+        row[1], row[5], row[6], row[9], row[20], row[21] = team['team_id'], '0', '1', 'N', GB_ID, '1'
+        day = SEASON_START + timedelta(days=self.rng.randrange(SEASON_DAYS))
+        opponent = self.opponent(team)
+
+        if self.rng.random() < 0.3:
+            name = self.rng.choice(TOURNAMENTS).format(town=opponent, year=day.year)
+            row[columns['event_name']] = name
+            row[columns['home_away']] = 'A'
+            row[columns['location']] = opponent
+            if self.rng.random() < 0.5:
+                row[columns['opponent']] = name
+        else:
+            home = self.rng.random() < 0.5
+            row[columns['event_name']] = opponent
+            row[columns['home_away']] = 'H' if home else 'A'
+            row[columns['location']] = '' if home else opponent
+            row[columns['opponent']] = opponent
+
+        row[columns['event_id']] = self.new_id()
+        row[columns['date']] = day.strftime('%Y%m%d')
+        row[columns['time']] = self.rng.choice(START_TIMES)
+        return row
+
+    def roster_row(self, team: Dict) -> List[str]:
+        """One getWrestlers row for a wrestler on `team`"""
+        columns = COLUMNS['roster']
+        row = [''] * ROSTER_WIDTH
+        row[0], row[1], row[4], row[6], row[7], row[8], row[12], row[13] = (
+            self.new_id(), team['team_id'], 'M', team['name'], '1', '1', 'Y', '1')
+        row[columns['first_name']] = self.rng.choice(FIRST_NAMES)
+        row[columns['last_name']] = self.rng.choice(LAST_NAMES)
+        row[columns['weight_class']] = self.rng.choice(WEIGHTS)
+        row[columns['grade']] = self.rng.choice(GRADES)
+        return row
+
+    def schedule_rows(self, count: Optional[int] = None) -> List[List[str]]:
+        """`count` rows, or events-per-team rows for every team"""
+        count = count if count is not None else len(self.teams) * self.events_per_team
+        return [self.schedule_row(self.teams[i % len(self.teams)]) for i in range(count)]
+
+    def roster_rows(self, count: Optional[int] = None) -> List[List[str]]:
+        count = count if count is not None else len(self.teams) * self.wrestlers_per_team
+        return [self.roster_row(self.teams[i % len(self.teams)]) for i in range(count)]
+
+    def wrestler(self) -> Tuple[str, str]:
+        return (f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}",
+                self.rng.choice(self.teams)['name'])
+
+    def decision(self) -> Tuple[str, str]:
+        wording, score = self.rng.choice(DECISIONS)
+        loser = self.rng.randint(0, 6)
+        winner = loser + self.rng.randint(1, 7)
+        return wording, score.format(m=self.rng.randint(0, 5), s=self.rng.randint(0, 59), w=winner, l=loser,
+                                     w8=loser + self.rng.randint(8, 14), w15=loser + 15)
+
+    def bracket_lines(self, count: int) -> List[str]:
+        """Bracket viewer lines: "Round - Winner (Team) won by fall over Loser (Team) (Fall 1:23)" """
+        lines = []
+        for _ in range(count):
+            (winner, winner_team), (loser, loser_team) = self.wrestler(), self.wrestler()
+            wording, score = self.decision()
+            lines.append(f"{self.rng.choice(ROUNDS)} - {winner} ({winner_team}) won {wording} "
+                         f"over {loser} ({loser_team}) ({score})")
+        return lines
+
+    def bout_lines(self, count: int) -> List[str]:
+        """Dual meet lines: "106 - Winner (Team) over Loser (Team) (Dec 5-2)" """
+        lines = []
+        for _ in range(count):
+            (winner, winner_team), (loser, loser_team) = self.wrestler(), self.wrestler()
+            lines.append(f"{self.rng.choice(WEIGHTS)} - {winner} ({winner_team}) over "
+                         f"{loser} ({loser_team}) ({self.decision()[1]})")
+        return lines
+
+
+def grid_page(rows: List[List[str]], title: str = 'Team Schedule') -> str:
+    """A TeamSchedule.jsp page with the rows in its initDataGrid call, as the frame scrapers see it"""
+    return (f'<html><head><title>{title}</title>\n<script type="text/javascript">\n'
+            f'function loadPage() {{ initDataGrid(1000, false, "{json.dumps(rows)}"); }}\n'
+            '</script></head><body onload="loadPage()"><div id="dataGrid"></div></body></html>\n')
+
+
+def weights_page(tournament_id: str) -> str:
+    """The bracket viewer's weight picker"""
+    options = ''.join(f'<option value="{int(tournament_id) * 100 + i}">{weight}</option>'
+                      for i, weight in enumerate(WEIGHTS))
+    return (f'<html><body><form action="BracketViewer.jsp?tournamentId={tournament_id}">'
+            f'<select name="weightClassId">{options}</select></form></body></html>\n')
+
+
+def bracket_page(lines: List[str]) -> str:
+    rows = ''.join(f'<tr><td class="bout">{line}</td></tr>\n' for line in lines)
+    return f'<html><body><table class="bracket">\n{rows}</table></body></html>\n'
+
+
+def matches_page(lines: List[str]) -> str:
+    rows = ''.join(f'<tr><td class="bout">{line}</td></tr>\n' for line in lines)
+    return f'<table class="tw-matches">\n{rows}</table>\n'
+
+
+def write(path: str, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def generate(season: SyntheticSeason, output_dir: str, bouts: int, tournaments: int) -> Dict[str, int]:
+    """Write the whole dataset: endpoint responses, pages and one bracket per weight per tournament"""
+    schedule, roster = season.schedule_rows(), season.roster_rows()
+    write(os.path.join(output_dir, 'getTeamSchedule.json'), json.dumps(schedule))
+    write(os.path.join(output_dir, 'getWrestlers.json'), json.dumps(roster))
+    write(os.path.join(output_dir, 'TeamSchedule.html'), grid_page(schedule))
+    write(os.path.join(output_dir, 'event_matches.html'), matches_page(season.bout_lines(bouts)))
+
+    from scraper_ajax_method import parse_schedule_entry
+
+    events = [parse_schedule_entry(row) for row in schedule]
+    tournament_ids = [event['event_id'] for event in events if BRACKET_EVENT.search(event['opponent'])][:tournaments]
+    for tournament_id in tournament_ids:
+        directory = os.path.join(output_dir, 'brackets', tournament_id)
+        write(os.path.join(directory, 'weights.html'), weights_page(tournament_id))
+        for weight in WEIGHTS:
+            write(os.path.join(directory, f'{weight}.html'), bracket_page(season.bracket_lines(bouts)))
+
+    return {'teams': len(season.teams), 'schedule_rows': len(schedule), 'roster_rows': len(roster),
+            'brackets': len(tournament_ids) * len(WEIGHTS), 'bouts_per_page': bouts}
+
+
+def curve_cases(seed: int = SEED) -> List:
+    """Parser cases whose input is `n` synthetic rows (benchmark.Case with n as the scale)"""
+    from benchmark import Case
+    from brackets import parse_bracket
+    from results_engine import parse_bouts
+    from scraper_ajax_method import parse_roster_entry, parse_schedule_entry
+    from scraper_frame import TrackWrestlingFrameScraper
+    from scraper_selenium_final import extract_schedule_from_html
+
+    frame = TrackWrestlingFrameScraper('', '')
+    event = {'event_id': 'synthetic'}
+    season = SyntheticSeason(teams=400, seed=seed)
+    return [
+        Case('ajax.schedule_response', lambda n: json.dumps(season.schedule_rows(n)),
+             lambda body: [parse_schedule_entry(row) for row in json.loads(body)]),
+        Case('ajax.roster_response', lambda n: json.dumps(season.roster_rows(n)),
+             lambda body: [w for w in (parse_roster_entry(row) for row in json.loads(body)) if w]),
+        Case('frame.extract_and_parse', lambda n: grid_page(season.schedule_rows(n)),
+             lambda page: frame.parse_schedule_blob(frame.extract_data_blob(page))),
+        Case('selenium_final.extract_schedule_from_html', lambda n: grid_page(season.schedule_rows(n)),
+             lambda page: extract_schedule_from_html(page, 'synthetic')),
+        Case('brackets.parse_bracket', lambda n: bracket_page(season.bracket_lines(n)),
+             lambda page: parse_bracket(page, '106', event)),
+        Case('results_engine.parse_bouts', lambda n: matches_page(season.bout_lines(n)),
+             lambda page: parse_bouts(page, event)),
+    ]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Generate synthetic TrackWrestling data and scaling curves")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate_parser = subparsers.add_parser('generate', help="Write a synthetic season to a directory")
+    generate_parser.add_argument('--teams', type=int, default=40)
+    generate_parser.add_argument('--wrestlers', type=int, default=40, help="Wrestlers per team")
+    generate_parser.add_argument('--events', type=int, default=20, help="Events per team")
+    generate_parser.add_argument('--bouts', type=int, default=32, help="Bouts per bracket and on the dual page")
+    generate_parser.add_argument('--tournaments', type=int, default=2)
+    generate_parser.add_argument('--seed', type=int, default=SEED)
+    generate_parser.add_argument('--output', default=OUTPUT_DIR)
+
+    curve_parser = subparsers.add_parser('curve', help="Time each parser at 10^2 .. 10^N synthetic rows")
+    curve_parser.add_argument('--max-exponent', type=int, default=MAX_EXPONENT)
+    curve_parser.add_argument('--filter', help="Only cases whose name contains this")
+    curve_parser.add_argument('--repeat', type=int, default=3)
+    curve_parser.add_argument('--seed', type=int, default=SEED)
+    curve_parser.add_argument('--json', action='store_true', help="Print the curves as JSON")
+
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        season = SyntheticSeason(args.teams, args.wrestlers, args.events, args.seed)
+        counts = generate(season, args.output, args.bouts, args.tournaments)
+        logger.info(f"Wrote synthetic season to {args.output}: {counts}")
+        return
+
+    from benchmark import measure
+
+    # Parsers log every row; that's I/O, not parsing
+    logging.disable(logging.INFO)
+    curves = {}
+    for case in curve_cases(args.seed):
+        if args.filter and args.filter not in case.name:
+            continue
+        curves[case.name] = []
+        for exponent in range(2, args.max_exponent + 1):
+            result = measure(case, 10 ** exponent, args.repeat)
+            curves[case.name].append({'input_rows': 10 ** exponent, **result})
+            if not args.json:
+                print(f"{case.name:<44} 10^{exponent} {result['rows']:>8} rows {result['median_seconds']:>9.3f}s "
+                      f"{result['per_row_us'] or 0:>8.2f} us/row {result['peak_bytes'] / 1024 / 1024:>8.1f} MB")
+    logging.disable(logging.NOTSET)
+
+    if args.json:
+        print(json.dumps(curves, indent=2))
+
+
+if __name__ == "__main__":
+    main()
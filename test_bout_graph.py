@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Bout Graph Tests
+Team edges come from dual meet outcomes, not from individual bouts
+"""
+
+from bout_graph import BoutGraph, team_key
+
+
+def bout(event_id, weight, winner_team, loser_team, win_type):
+    return {'bout_id': f"{event_id}-{weight}", 'event_id': event_id, 'weight_class': weight,
+            'winner': f"{winner_team} {weight}", 'winner_team': winner_team,
+            'loser': f"{loser_team} {weight}", 'loser_team': loser_team, 'win_type': win_type}
+
+
+def test_one_team_edge_per_dual_for_the_team_that_won_it():
+    # Moorestown wins more bouts (3 decisions = 9) but Shawnee wins the dual on pins (2 falls = 12)
+    graph = BoutGraph([
+        bout('e1', '106', 'Moorestown', 'Shawnee', 'D'),
+        bout('e1', '113', 'Moorestown', 'Shawnee', 'D'),
+        bout('e1', '120', 'Moorestown', 'Shawnee', 'D'),
+        bout('e1', '126', 'Shawnee', 'Moorestown', 'F'),
+        bout('e1', '132', 'Shawnee', 'Moorestown', 'F'),
+    ])
+    shawnee, moorestown = team_key('Shawnee'), team_key('Moorestown')
+    assert graph.teams.head_to_head(shawnee, moorestown) == (1, 0)
+    assert graph.event_points['e1'] == {moorestown: 9, shawnee: 12}
+
+
+def test_late_bouts_move_the_dual_edge():
+    graph = BoutGraph([bout('e1', '106', 'Moorestown', 'Shawnee', 'D')])
+    shawnee, moorestown = team_key('Shawnee'), team_key('Moorestown')
+    assert graph.teams.head_to_head(moorestown, shawnee) == (1, 0)
+
+    graph.add_bouts([bout('e1', '113', 'Shawnee', 'Moorestown', 'F')])
+    assert graph.teams.head_to_head(shawnee, moorestown) == (1, 0)
+    assert graph.teams.chain(moorestown, shawnee) is None
+
+
+def test_tournaments_and_ties_add_no_team_win_but_common_opponents_still_form():
+    graph = BoutGraph([
+        bout('t1', '106', 'Shawnee', 'Moorestown', 'F'),
+        bout('t1', '113', 'Lenape', 'Cherokee', 'F'),
+        bout('d1', '106', 'Shawnee', 'Cherokee', 'D'),
+        bout('d1', '113', 'Cherokee', 'Shawnee', 'D'),
+        bout('d2', '106', 'Moorestown', 'Cherokee', 'MD'),
+    ])
+    shawnee, moorestown, cherokee = team_key('Shawnee'), team_key('Moorestown'), team_key('Cherokee')
+    assert graph.teams.head_to_head(shawnee, moorestown) == (0, 0)
+    assert graph.teams.head_to_head(shawnee, cherokee) == (0, 0)
+    assert graph.teams.head_to_head(moorestown, cherokee) == (1, 0)
+    assert graph.common_opponents('team', shawnee, moorestown) == {cherokee: {'a': (0, 0), 'b': (1, 0)}}
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for bracket viewer parsing
+"""
+
+from benchmark import fixture
+from datetime import date
+
+import brackets
+from brackets import BracketCache, BracketIngestor, is_tournament, merge_results, parse_bracket, parse_weights
+
+TOURNAMENT = {'event_id': '7750411', 'date': 'December 20, 2025', 'opponent': 'Beast of the East 2025'}
+
+
+def test_parse_weights():
+    assert parse_weights(fixture('bracket_weight.html')) == [('9101', '106'), ('9102', '113'), ('9114', 'HWT')]
+    assert parse_weights('<option value="7">285+</option><option value="8">hwt</option>') == [('7', '285+'), ('8', 'HWT')]
+
+
+def test_parse_bracket():
+    bouts = parse_bracket(fixture('bracket_weight.html'), '106', TOURNAMENT)
+
+    assert [(b['winner'], b['loser'], b['win_type']) for b in bouts] == [
+        ('Daniel Fitzpatrick', 'Jim Roe', 'F'),
+        ('Sam Lee', 'Tom Hart', 'D'),
+        ('Sam Lee', 'Daniel Fitzpatrick', 'MD'),
+        ('Jim Roe', 'Tom Hart', 'D'),
+    ]
+    assert all(b['source'] == 'bracket' and b['weight_class'] == '106' for b in bouts)
+    assert all(b['event_id'] == '7750411' for b in bouts)
+    # Round labels and "won by ..." wording are gone, our wrestler's side is reported
+    assert bouts[2]['wrestler'] == 'Daniel Fitzpatrick' and bouts[2]['result'] == 'Loss'
+    assert bouts[3]['score'] == 'SV-1 3-1'
+
+
+def test_merge_results_swaps_in_current_bracket_bouts():
+    old = parse_bracket(fixture('bracket_weight.html'), '106', TOURNAMENT)
+    fresh = parse_bracket(fixture('bracket_weight.html'), '113', TOURNAMENT)
+    dual = {'bout_id': 'dual', 'event_id': '7750137', 'date': 'December 17, 2025', 'weight_class': '106'}
+
+    merged = merge_results([dual] + old, {'7750411': fresh})
+    assert [b['bout_id'] for b in merged] == ['dual'] + [b['bout_id'] for b in fresh]
+
+
+def test_merge_results_sorts_named_weight_classes_last():
+    bouts = [{'bout_id': w, 'event_id': '7750411', 'date': 'December 20, 2025', 'weight_class': w}
+             for w in ('HWT', '285', '106')]
+    assert [b['weight_class'] for b in merge_results([], {'7750411': bouts})] == ['106', '285', 'HWT']
+
+
+def test_parse_bracket_heavyweight():
+    page = '<tr><td>Final - Big Guy (Shawnee) won by fall over Other Guy (Lenape) (Fall 2:01)</td></tr>'
+    assert [(b['weight_class'], b['wrestler']) for b in parse_bracket(page, 'HWT', TOURNAMENT)] == [('HWT', 'Big Guy')]
+
+
+def test_is_tournament_goes_by_event_type():
+    assert is_tournament({'event_id': '1', 'opponent': 'Beast of the East 2025', 'event_type': 'Tournament'})
+    assert is_tournament({'event_id': '1', 'opponent': '2025 TCNJ Pride', 'event_type': 'Individual Tournament'})
+    assert not is_tournament({'event_id': '1', 'opponent': 'LRHSD Quad', 'event_type': 'Quad Meet'})
+    assert not is_tournament({'event_id': '1', 'opponent': 'Shawnee Tri-Match', 'event_type': 'Tri-Meet'})
+    assert not is_tournament({'event_id': '1', 'opponent': 'Pine Barrens Dual Tournament',
+                              'event_type': 'Dual Tournament'})
+    assert is_tournament({'event_id': '1', 'opponent': '2025 TCNJ Pride'}) is None
+    assert is_tournament({'event_id': '', 'event_type': 'Tournament'}) is False
+
+
+def test_untyped_events_are_probed_once(tmp_path, monkeypatch):
+    requests = []
+
+    def fetch_page(url, kind, **meta):
+        requests.append(url)
+        if 'weightClassId' in url:
+            return fixture('bracket_weight.html')
+        return fixture('bracket_weight.html') if 'tournamentId=7750274' in url else '<select></select>'
+
+    monkeypatch.setattr(brackets, 'fetch_page', fetch_page)
+    schedule = [
+        {'event_id': '7750274', 'date': 'December 20, 2025', 'opponent': '2025 TCNJ Pride'},
+        {'event_id': '7750685', 'date': 'December 20, 2025', 'opponent': 'LRHSD Quad'},
+        {'event_id': '7751507', 'date': 'December 20, 2025', 'opponent': 'Eastern', 'event_type': 'Dual Meet'},
+    ]
+    ingestor = BracketIngestor(BracketCache(str(tmp_path)))
+    bouts = ingestor.ingest(schedule, today=date(2026, 1, 10))
+
+    assert len(bouts['7750274']) == 3 * 4 and bouts['7750685'] == []
+    assert not any('7751507' in url for url in requests)
+    assert ingestor.cache.get('7750685')['has_brackets'] is False
+
+    requests.clear()
+    again = BracketIngestor(BracketCache(str(tmp_path))).ingest(schedule, today=date(2026, 1, 10))
+    assert requests == [] and set(again) == {'7750274'}
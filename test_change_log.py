@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for change_log diffing: diff_data / apply_diff must round-trip between any two snapshots
+"""
+
+import copy
+import json
+
+from benchmark import fixture
+from change_log import ChangeLog, apply_diff, diff_data
+from scraper_ajax_method import parse_roster_entry, parse_schedule_entry
+
+
+def snapshot():
+    return {
+        'metadata': {'last_updated': '2025-12-17T06:00:00-05:00'},
+        'roster': [w for w in map(parse_roster_entry, json.loads(fixture('roster.json'))) if w],
+        'schedule': [parse_schedule_entry(row) for row in json.loads(fixture('schedule.json'))],
+        'results': [],
+    }
+
+
+def test_identical_snapshots_have_no_diff():
+    assert diff_data(snapshot(), snapshot()) == {}
+
+
+def test_round_trip_both_directions():
+    old, new = snapshot(), snapshot()
+    new['schedule'][1]['result'] = 'W 42-27'
+    del new['schedule'][4]
+    new['schedule'].insert(2, dict(new['schedule'][0], event_id='9999999', opponent='Lenape'))
+    new['roster'][0]['record'] = '5-1'
+    new['roster'].append({'name': 'New Wrestler', 'weight_class': '285', 'grade': 'Fr.', 'record': ''})
+
+    assert apply_diff(old, diff_data(old, new)) == new
+    assert apply_diff(new, diff_data(new, old)) == old
+
+
+def test_schedule_rows_sharing_date_and_opponent_are_kept_apart():
+    old = snapshot()
+    tournament = dict(old['schedule'][0], event_id='', opponent='Shawnee', location='Host A')
+    new = copy.deepcopy(old)
+    new['schedule'] += [tournament, dict(tournament, location='Host B'), dict(tournament, location='Host B')]
+
+    diff = diff_data(old, new)
+    assert len(diff['schedule']['added']) == 3
+    assert apply_diff(old, diff) == new
+    assert apply_diff(new, diff_data(new, old)) == old
+
+
+def test_reordered_records_replay_in_the_saved_order(tmp_path):
+    old = snapshot()
+    new = copy.deepcopy(old)
+    new['schedule'].reverse()
+    new['schedule'][0]['result'] = 'W 42-27'
+    new['schedule'].insert(3, dict(new['schedule'][1], event_id='9999999', opponent='Lenape'))
+    del new['roster'][2]
+    new['roster'].sort(key=lambda w: w['name'])
+
+    diff = diff_data(old, new)
+    assert 'order' in diff['schedule'] and 'order' in diff['roster']
+    assert apply_diff(old, diff) == new
+    assert apply_diff(new, diff_data(new, old)) == old
+
+    # An unchanged order isn't recorded
+    unchanged = copy.deepcopy(old)
+    unchanged['schedule'][1]['result'] = 'L 30-33'
+    assert 'order' not in diff_data(old, unchanged)['schedule']
+
+    log = ChangeLog(str(tmp_path / 'changes.jsonl'))
+    log.record(None, old)
+    new['metadata'] = {'last_updated': '2025-12-18T06:00:00-05:00'}
+    log.record(old, new)
+    assert log.state_at()['schedule'] == new['schedule']
+    assert log.state_at('2025-12-17T12:00:00-05:00')['schedule'] == old['schedule']
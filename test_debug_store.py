@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the rotating debug-artifact store
+"""
+
+import gzip
+import json
+import os
+
+import debug_store
+import instrumentation
+from debug_store import DebugStore
+
+
+def artifacts(directory):
+    return sorted(os.path.relpath(os.path.join(root, name), directory)
+                  for root, _, names in os.walk(directory) for name in names if name.endswith('.gz'))
+
+
+def test_disabled_store_keeps_nothing(tmp_path):
+    store = DebugStore(str(tmp_path), 'run', enabled=False)
+    assert store.save('page', 'x') is None
+    assert store.thread is None and artifacts(str(tmp_path)) == []
+
+
+def test_artifacts_are_written_with_a_manifest(tmp_path):
+    store = DebugStore(str(tmp_path), 'run-1', enabled=True)
+    assert store.save('TeamSchedule.jsp?x=1', '<html>schedule</html>', url='https://example.com') == \
+        '0001-TeamSchedule.jsp_x_1.gz'
+    store.close()
+
+    with gzip.open(tmp_path / 'run-1' / '0001-TeamSchedule.jsp_x_1.gz', 'rt', encoding='utf-8') as f:
+        assert f.read() == '<html>schedule</html>'
+    manifest = [json.loads(line) for line in open(tmp_path / 'run-1' / 'manifest.jsonl', encoding='utf-8')]
+    assert [(m['run_id'], m['file'], m['url']) for m in manifest] == \
+        [('run-1', '0001-TeamSchedule.jsp_x_1.gz', 'https://example.com')]
+
+
+def test_rotation_by_count_spans_runs(tmp_path):
+    old = DebugStore(str(tmp_path), 'run-1', enabled=True, max_files=4)
+    for i in range(3):
+        old.save(f'page{i}', f'old {i}')
+    old.close()
+
+    new = DebugStore(str(tmp_path), 'run-2', enabled=True, max_files=4)
+    for i in range(3):
+        new.save(f'page{i}', f'new {i}')
+    new.close()
+
+    assert artifacts(str(tmp_path)) == ['run-1/0003-page2.gz', 'run-2/0001-page0.gz',
+                                        'run-2/0002-page1.gz', 'run-2/0003-page2.gz']
+
+
+def test_rotation_by_size_removes_emptied_runs(tmp_path):
+    old = DebugStore(str(tmp_path), 'run-1', enabled=True)
+    old.save('page', os.urandom(2000).hex())
+    old.close()
+    size = os.path.getsize(tmp_path / 'run-1' / '0001-page.gz')
+
+    new = DebugStore(str(tmp_path), 'run-2', enabled=True, max_bytes=int(size * 1.5))
+    new.save('page', os.urandom(2000).hex())
+    new.close()
+
+    assert artifacts(str(tmp_path)) == ['run-2/0001-page.gz']
+    assert not (tmp_path / 'run-1').exists()
+    assert new.total == os.path.getsize(tmp_path / 'run-2' / '0001-page.gz')
+
+
+def test_run_id_matches_the_run_report():
+    assert debug_store.DebugStore().run_id == instrumentation.RUN_ID
+    instrumentation.start_run(trace_memory=False)
+    assert instrumentation.recorder.report()['run_id'] == instrumentation.RUN_ID
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for event detail page parsing and fetch ordering
+"""
+
+from datetime import date
+
+from benchmark import fixture
+from enrichment import fetch_event_details, fetch_order, parse_event_details
+
+
+def test_parse_event_details_fixture():
+    assert parse_event_details(fixture('event_details.html')) == {
+        'venue': 'Shawnee High School',
+        'address': '600 Tabernacle Rd, Medford, NJ 08055',
+        'event_type': 'Tournament',
+        'weigh_in': '7:00 AM',
+        'team_scores': [
+            {'team': 'Shawnee', 'score': '182.5'},
+            {'team': 'Eastern', 'score': '160'},
+            {'team': 'Moorestown', 'score': '98'},
+        ],
+    }
+
+
+def test_parse_dual_meet_score():
+    page = '<div>Shawnee 42 - Moorestown 27</div><table><tr><td>Location</td><td>Moorestown HS</td></tr></table>'
+    assert parse_event_details(page) == {
+        'venue': 'Moorestown HS',
+        'team_scores': [{'team': 'Shawnee', 'score': '42'}, {'team': 'Moorestown', 'score': '27'}],
+    }
+
+
+def test_parse_empty_page():
+    assert parse_event_details('<html><body>Event not found</body></html>') == {}
+
+
+def test_fetch_order_puts_next_meets_first():
+    matches = [{'event_id': d, 'date': d} for d in ('12/13/2025', '01/20/2026', '01/10/2026', '12/20/2025')]
+    order = [m['date'] for m in fetch_order(matches, date(2026, 1, 1))]
+    assert order == ['01/10/2026', '01/20/2026', '12/20/2025', '12/13/2025']
+
+
+def test_request_timeout_is_capped_at_the_deadline(monkeypatch):
+    import enrichment
+    timeouts = []
+
+    def timed_get(endpoint, url, timeout=30):
+        timeouts.append(timeout)
+        raise OSError('offline')
+
+    monkeypatch.setattr(enrichment, 'timed_get', timed_get)
+    monkeypatch.setattr(enrichment.time, 'monotonic', lambda: 100.0)
+    assert fetch_event_details('7750411', deadline=102.5) is None
+    assert fetch_event_details('7750411', deadline=100.0) is None
+    assert fetch_event_details('7750411') is None
+    assert timeouts == [2.5, enrichment.REQUEST_TIMEOUT]
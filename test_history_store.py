@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite history store: idempotent ingest, the indexed queries and the git backfill
+"""
+
+import copy
+import json
+import subprocess
+
+import pytest
+
+from benchmark import fixture
+from history_store import HistoryStore, backfill_from_git
+from results_engine import parse_bouts
+from scraper_ajax_method import parse_roster_entry, parse_schedule_entry
+
+SEASON_ID = '1560212138'
+TEAM_ID = '768996150'
+
+
+def scrape(last_updated='2025-12-18T06:00:00-05:00', season_id=SEASON_ID):
+    schedule = [parse_schedule_entry(row) for row in json.loads(fixture('schedule.json'))]
+    dual = next(m for m in schedule if m['opponent'] == 'Cherry Hill  West')
+    return {
+        'metadata': {'last_updated': last_updated, 'season_id': season_id, 'team_id': TEAM_ID},
+        'roster': [w for w in map(parse_roster_entry, json.loads(fixture('roster.json'))) if w],
+        'schedule': schedule,
+        'results': parse_bouts(fixture('event_matches.html'), dual),
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    with HistoryStore(str(tmp_path / 'history.db')) as store:
+        yield store
+
+
+def count(store, table):
+    return store.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_ingest_is_idempotent(store):
+    data = scrape()
+    first = store.ingest(data)
+    sizes = {table: count(store, table) for table in ('wrestlers', 'events', 'bouts')}
+
+    assert store.ingest(copy.deepcopy(data)) == first
+    assert {table: count(store, table) for table in sizes} == sizes
+    assert sizes['bouts'] == 14 and len(store.scrapes()) == 1
+
+
+def test_later_scrape_updates_rows_in_place(store):
+    first = store.ingest(scrape())
+    data = scrape('2025-12-19T06:00:00-05:00')
+    data['roster'][0]['record'] = '1-1'
+    second = store.ingest(data)
+
+    assert second != first and len(store.scrapes()) == 2
+    row = store.conn.execute("SELECT * FROM wrestlers WHERE name_key = 'daniel fitzpatrick'").fetchone()
+    assert (row['record'], row['first_scrape_id'], row['last_scrape_id']) == ('1-1', first, second)
+    assert count(store, 'wrestlers') == len(data['roster'])
+
+
+def test_meets_against_matches_opponent_and_host(store):
+    store.ingest(scrape())
+    home = store.meets_against('cherry hill west')
+    assert [(m['event_date'], m['opponent'], m['home']) for m in home] == \
+        [('2025-12-17', 'Cherry Hill  West', 1)]
+
+    # Away meets list us as the opponent and the host as the location
+    schedule = scrape()['schedule']
+    hosts = {m['location'] for m in schedule if m['location'] and m['location'] != 'Shawnee High School'}
+    host = sorted(hosts)[0]
+    assert all(host in (m['opponent'], m['location']) for m in store.meets_against(host.upper()))
+    assert store.meets_against(host)
+    assert store.meets_against('Nobody') == []
+
+
+def test_roster_by_weight_class(store):
+    store.ingest(scrape())
+    store.ingest(scrape('2024-12-18T06:00:00-05:00', season_id='1400000000'))
+
+    roster = store.roster_by_weight_class('106', SEASON_ID)
+    assert list(roster) == ['2025-26'] and list(roster['2025-26']) == ['106']
+    assert 'Daniel Fitzpatrick' in roster['2025-26']['106']
+    assert roster['2025-26']['106'] == sorted(roster['2025-26']['106'])
+
+    everything = store.roster_by_weight_class()
+    assert set(everything) == {'2025-26', '1400000000'}
+    weights = list(everything['2025-26'])
+    assert weights == sorted(weights, key=int)
+
+
+def test_wrestler_history(store):
+    store.ingest(scrape())
+    store.ingest(scrape('2024-12-18T06:00:00-05:00', season_id='1400000000'))
+
+    history = store.wrestler_history('  daniel   FITZPATRICK ')
+    assert [s['season_id'] for s in history['seasons']] == ['1400000000', SEASON_ID]
+    assert [(b['opponent'], b['result'], b['win_type']) for b in history['bouts']] == \
+        [('Jake Miller', 'Loss', 'F')] * 2
+    assert store.wrestler_history('Nobody') == {'seasons': [], 'bouts': []}
+
+
+def test_backfill_from_git(store, tmp_path, monkeypatch):
+    versions = [scrape(stamp) for stamp in ('2025-12-17T06:00:00-05:00', '2025-12-18T06:00:00-05:00')]
+    repo = tmp_path / 'repo'
+    (repo / 'data').mkdir(parents=True)
+    monkeypatch.chdir(repo)
+
+    def git(*args):
+        subprocess.run(['git', *args], check=True, capture_output=True)
+
+    git('init', '-q')
+    git('config', 'user.email', 'test@example.com')
+    git('config', 'user.name', 'test')
+    for i, data in enumerate(versions):
+        (repo / 'data' / 'wrestling_data.json').write_text(json.dumps(data))
+        git('add', 'data/wrestling_data.json')
+        git('commit', '-q', '-m', f'update {i}')
+    (repo / 'data' / 'wrestling_data.json').write_text('{not json')
+    git('commit', '-q', '-am', 'broken')
+
+    assert backfill_from_git(store, 'data/wrestling_data.json') == 2
+    assert [s['scraped_at'] for s in store.scrapes()] == ['2025-12-17T06:00:00-05:00', '2025-12-18T06:00:00-05:00']
+    assert backfill_from_git(store, 'data/wrestling_data.json') == 2
+    assert len(store.scrapes()) == 2
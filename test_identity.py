@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for linking roster records across seasons into one identity per wrestler
+"""
+
+import pytest
+
+from identity import IdentityMap, parse_grade, season_start_year
+
+
+def record(season, name, grade, weight, team='shawnee'):
+    start = season_start_year(season)
+    grade_number = parse_grade(grade)
+    return {
+        'id': f"{season}|{team}|{name.lower()}",
+        'season': season,
+        'season_start': start,
+        'team': team,
+        'name': name,
+        'weight_class': weight,
+        'grade': grade,
+        'grad_year': start + 1 + (12 - grade_number) if grade_number else None,
+    }
+
+
+@pytest.fixture
+def identities(tmp_path):
+    return IdentityMap(str(tmp_path / 'identity_map.json'))
+
+
+def test_parse_grade_and_season():
+    assert [parse_grade(g) for g in ('Fr.', 'Sophomore', '11', 'SR', '')] == [9, 10, 11, 12, None]
+    assert season_start_year('2025-26') == 2025
+    assert season_start_year('') is None
+
+
+def test_same_wrestler_across_seasons(identities):
+    first, _ = identities.add(record('2024-25', 'Daniel Fitzpatrick', 'Fr.', '106'))
+    second, _ = identities.add(record('2025-26', 'Danny Fitzpatrick', 'So.', '113'))
+    assert first == second
+    assert [r['season'] for r in identities.career(first)] == ['2024-25', '2025-26']
+
+
+def test_different_class_year_is_a_different_wrestler(identities):
+    senior, _ = identities.add(record('2024-25', 'Daniel Fitzpatrick', 'Sr.', '106'))
+    freshman, _ = identities.add(record('2025-26', 'Daniel Fitzpatrick', 'Fr.', '106'))
+    assert senior != freshman
+    assert identities.find('daniel fitzpatrick') == sorted([senior, freshman])
+
+
+def test_one_record_per_season(identities):
+    identities.add(record('2024-25', 'Logan Reice', 'Fr.', '106'))
+    a, _ = identities.add(record('2025-26', 'Logan Reice', 'So.', '106'))
+    b, _ = identities.add(record('2025-26', 'Logan Reise', 'So.', '113'))
+    assert a != b
+
+
+def test_big_weight_drop_is_penalised(identities):
+    heavy = record('2024-25', 'Chris Adams', 'Jr.', '215')
+    light = record('2025-26', 'Chris Adam', 'Sr.', '106')
+    assert identities.score(heavy, light) < identities.score(heavy, dict(light, weight_class='215'))
+
+
+def test_add_records_is_idempotent_and_persists(identities):
+    records = [record('2025-26', 'Gino Gonzalez', 'Jr.', '126'), record('2024-25', 'Gino Gonzalez', 'So.', '120')]
+    assert identities.add_records(records) == 2
+    assert identities.add_records(records) == 0
+    identities.save()
+
+    loaded = IdentityMap(identities.path)
+    assert len(loaded.identities) == 1
+    assert loaded.add(record('2023-24', 'Gino Gonzalez', 'Fr.', '113'))[0] == next(iter(loaded.identities))
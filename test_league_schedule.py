@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling League Schedule Tests
+Events seen from both teams are stored once; date and team queries over the merged index
+"""
+
+from datetime import date
+
+import pytest
+
+from league_schedule import LeagueSchedule
+
+
+def match(day, opponent, location='', event_id=''):
+    return {'event_id': event_id, 'date': day, 'opponent': opponent, 'location': location, 'time': '6:00 PM'}
+
+
+@pytest.fixture
+def league(tmp_path):
+    league = LeagueSchedule(str(tmp_path / 'league_schedule.json'))
+    league.add('Shawnee', [
+        match('January 3, 2026', 'Lenape', event_id='101'),
+        match('January 10, 2026', 'Moorestown High School'),
+        match('January 14, 2026', 'Shawnee', 'Cherokee High School'),
+    ])
+    league.add('Moorestown', [
+        match('January 3, 2026', 'Cherokee'),
+        match('January 10, 2026', '@ Shawnee'),
+        match('January 21, 2026', 'Lenape', event_id='102'),
+    ])
+    league.add('Cherokee', [
+        match('January 3, 2026', 'Moorestown H.S.'),
+        match('January 14, 2026', 'Shawnee'),
+    ])
+    league.add('Lenape', [match('January 3, 2026', 'Shawnee', event_id='101')])
+    league.rebuild_index()
+    return league
+
+
+def test_events_without_an_id_are_stored_once(league):
+    assert len(league.events) == 5
+    assert league.events['2026-01-10|moorestown|shawnee']['teams'] == ['Shawnee', 'Moorestown']
+    # Cherokee hosted: Shawnee's schedule lists Shawnee as the opponent and Cherokee as the location
+    assert league.events['2026-01-14|cherokee|shawnee']['teams'] == ['Shawnee', 'Cherokee']
+    assert league.events['101']['teams'] == ['Shawnee', 'Lenape']
+
+
+def test_between_and_on(league):
+    assert [e['event_id'] for e in league.between(date(2026, 1, 4), date(2026, 1, 14))] == \
+        ['2026-01-10|moorestown|shawnee', '2026-01-14|cherokee|shawnee']
+    assert sorted(e['event_id'] for e in league.on(date(2026, 1, 3))) == ['101', '2026-01-03|cherokee|moorestown']
+    assert league.between(date(2026, 1, 22), date(2026, 2, 1)) == []
+
+
+def test_shared_opponents(league):
+    assert league.shared_opponents('Moorestown', 'Cherokee') == {'shawnee'}
+    assert league.shared_opponents('Shawnee', 'Moorestown') == {'lenape', 'cherokee'}
+    # Only meets before their own on the 10th: Lenape (Shawnee) and Cherokee (Moorestown) don't overlap
+    assert league.shared_opponents('Shawnee', 'Moorestown', before=date(2026, 1, 10)) == set()
+    assert league.shared_opponents('Lenape', 'Cherokee', before=date(2026, 1, 21)) == {'shawnee'}
+
+
+def test_index_survives_a_reload(league):
+    league.save()
+    reloaded = LeagueSchedule(league.path)
+    assert reloaded.events == league.events
+    assert reloaded.on(date(2026, 1, 14)) == league.on(date(2026, 1, 14))
+    assert reloaded.shared_opponents('Shawnee', 'Moorestown') == {'lenape', 'cherokee'}
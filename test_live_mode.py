@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Live Meet Mode Tests
+Per-event merging of a poll, and the poll schedule under a faked clock
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from live_mode import BACKOFF, LiveMeetPoller
+from scraper_ajax_method import EST
+
+DAY = date(2026, 1, 10)
+
+
+def result(event_id, weight, wrestler):
+    return {'bout_id': f"{event_id}-{weight}", 'event_id': event_id, 'date': 'January 10, 2026',
+            'weight_class': weight, 'wrestler': wrestler}
+
+
+class FakeClock:
+    def __init__(self, start: datetime):
+        self.current = start
+        self.sleeps = []
+
+    def now(self) -> datetime:
+        return self.current
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.current += timedelta(seconds=seconds)
+
+
+class ScriptedPoller(LiveMeetPoller):
+    """Serves one scripted fetch per poll (repeating the last) instead of hitting TrackWrestling"""
+
+    def __init__(self, script, clock, **kwargs):
+        super().__init__(DAY, sinks=[self.record], **kwargs)
+        self.script = script
+        self.polls = 0
+        self.pushed = []
+        self.clock = clock
+        self.now, self.sleep = clock.now, clock.sleep
+
+    def fetch_today(self, events):
+        fresh = self.script[min(self.polls, len(self.script) - 1)]
+        self.polls += 1
+        return fresh
+
+    def record(self, data, diff):
+        self.pushed.append(diff)
+
+
+def poller(script=({'schedule': {}, 'results': {}},)):
+    return ScriptedPoller(list(script), FakeClock(datetime(2026, 1, 10, 17, 0, tzinfo=EST)))
+
+
+def test_merge_replaces_only_the_fetched_events():
+    data = {
+        'schedule': [
+            {'event_id': 'e2', 'date': 'January 10, 2026', 'opponent': 'Lenape'},
+            {'event_id': 'e1', 'date': 'January 3, 2026', 'opponent': 'Moorestown'},
+        ],
+        'results': [result('e1', '106', 'Al'), result('e2', '106', 'Bo'), result('e2', '113', 'Cy')],
+        'metadata': {'team_name': 'Shawnee'},
+    }
+    fresh = {
+        'schedule': {'e2': [{'event_id': 'e2', 'date': 'January 10, 2026', 'opponent': 'Lenape', 'time': '6:00 PM'}]},
+        'results': {'e2': [result('e2', '106', 'Bo')]},
+    }
+    merged = poller().merge(data, fresh)
+
+    assert [r['bout_id'] for r in merged['results']] == ['e1-106', 'e2-106']
+    assert [m['event_id'] for m in merged['schedule']] == ['e1', 'e2']
+    assert merged['schedule'][1]['time'] == '6:00 PM'
+    assert merged['metadata'] == {'team_name': 'Shawnee', 'last_updated': '2026-01-10T17:00:00-05:00'}
+    assert data['results'][2]['bout_id'] == 'e2-113'
+
+
+def test_merge_matches_rows_without_an_event_id_by_date():
+    data = {'schedule': [
+        {'date': 'January 10, 2026', 'opponent': 'Lenape', 'time': 'TBD'},
+        {'date': 'January 17, 2026', 'opponent': 'Cherokee'},
+    ]}
+    merged = poller().merge(data, {'schedule': {'': [{'date': 'January 10, 2026', 'opponent': 'Lenape',
+                                                       'time': '6:00 PM'}]},
+                                   'results': {}})
+
+    assert [(m['opponent'], m.get('time')) for m in merged['schedule']] == [('Lenape', '6:00 PM'),
+                                                                            ('Cherokee', None)]
+    assert 'results' not in merged
+
+
+def run(script):
+    data = {'schedule': [{'event_id': 'e1', 'date': 'January 10, 2026', 'time': '6:00 PM',
+                          'opponent': 'Moorestown'}],
+            'results': []}
+    scripted = poller(script)
+    polls = scripted.run(data)
+    return scripted, polls, scripted.clock.sleeps
+
+
+def test_backoff_schedule_without_changes():
+    unchanged = {'schedule': {}, 'results': {'e1': [result('e1', '106', 'Al')]}}
+    scripted, polls, sleeps = run([unchanged])
+
+    # Wait until 5:30 PM (30 minutes before the 6:00 PM start), then back off from the minimum
+    assert sleeps[0] == 1800
+    assert sleeps[1:8] == pytest.approx([30, 30 * BACKOFF, 30 * BACKOFF ** 2, 30 * BACKOFF ** 3,
+                                         30 * BACKOFF ** 4, 30 * BACKOFF ** 5, 300])
+    assert max(sleeps) == 1800 and max(sleeps[1:]) == 300
+    # Polling stops at the end of the three-hour dual window, 9:00 PM
+    assert sum(sleeps) == pytest.approx(1800 + 3.5 * 3600)
+    assert polls == scripted.polls == len(sleeps) - 1
+    assert len(scripted.pushed) == 1
+
+
+def test_a_change_resets_the_interval():
+    first = {'schedule': {}, 'results': {'e1': [result('e1', '106', 'Al')]}}
+    second = {'schedule': {}, 'results': {'e1': [result('e1', '106', 'Al'), result('e1', '113', 'Bo')]}}
+    scripted, _, sleeps = run([first, first, first, second])
+
+    assert sleeps[1:6] == pytest.approx([30, 45, 67.5, 30, 45])
+    assert [list(diff['results']) for diff in scripted.pushed] == [['added'], ['added']]
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Data API Tests
+Drives the ASGI app directly: filters, conditional requests, 400s and gzip
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+from collections import deque
+
+import pytest
+
+import main
+from scraper_ajax_method import HOME_LOCATION
+
+DATA = {
+    'metadata': {'team_name': 'Shawnee', 'last_updated': '2026-01-20T08:00:00'},
+    'roster': [{'name': f"Wrestler {i}", 'weight_class': str(106 + i)} for i in range(40)],
+    'schedule': [
+        {'date': 'January 5, 2026', 'opponent': 'Moorestown', 'location': HOME_LOCATION},
+        {'date': 'January 12, 2026', 'opponent': 'Lenape', 'location': 'Lenape High School'},
+        {'date': 'February 2, 2026', 'opponent': 'Cherokee', 'location': HOME_LOCATION},
+    ],
+    'results': [
+        {'date': 'January 5, 2026', 'weight_class': '106', 'location': HOME_LOCATION, 'wrestler': 'Al'},
+        {'date': 'January 12, 2026', 'weight_class': 'HWT', 'location': 'Lenape High School', 'wrestler': 'Dan'},
+    ],
+}
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    path = tmp_path / 'wrestling_data.json'
+    path.write_text(json.dumps(DATA, indent=2), encoding='utf-8')
+    monkeypatch.setattr(main, 'cache', main.DataCache(str(path)))
+    monkeypatch.setattr(main, 'refresher', main.Refresher(ttl=0))
+    return request
+
+
+def request(path, query='', headers=(), method='GET'):
+    """(status, headers, body) for one request through the ASGI app"""
+    return asyncio.run(call(path, query, headers, method))
+
+
+async def call(path, query='', headers=(), method='GET'):
+    messages = []
+    pending = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+    async def receive():
+        # The client hangs up once the request is read, which ends an SSE stream after its backlog
+        return pending.pop(0) if pending else {'type': 'http.disconnect'}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query.encode('latin-1'),
+             'headers': [(k.encode('latin-1'), v.encode('latin-1')) for k, v in headers]}
+    await main.app(scope, receive, send)
+    start = messages[0]
+    return start['status'], dict(start['headers']), b''.join(m.get('body', b'') for m in messages[1:])
+
+
+def test_filters(api):
+    status, _, body = api('/api/schedule', 'from=2026-01-10&to=2026-01-31')
+    assert status == 200
+    assert [e['opponent'] for e in json.loads(body)] == ['Lenape']
+
+    _, _, body = api('/api/schedule', 'home_away=home')
+    assert [e['opponent'] for e in json.loads(body)] == ['Moorestown', 'Cherokee']
+
+    _, _, body = api('/api/results', 'weight_class=HWT,113')
+    assert [r['wrestler'] for r in json.loads(body)] == ['Dan']
+
+    _, _, body = api('/api/roster', 'weight_class=106,107')
+    assert [w['name'] for w in json.loads(body)] == ['Wrestler 0', 'Wrestler 1']
+
+
+def test_matching_if_none_match_is_304(api):
+    status, headers, _ = api('/api/schedule', 'home_away=away')
+    etag = headers[b'etag']
+
+    status, headers, body = api('/api/schedule', 'home_away=away', headers=[('if-none-match', etag.decode())])
+    assert (status, body, headers[b'etag']) == (304, b'', etag)
+
+    status, _, _ = api('/api/schedule', 'home_away=home', headers=[('if-none-match', etag.decode())])
+    assert status == 200
+
+
+@pytest.mark.parametrize('path, query, invalid', [
+    ('/api/schedule', 'from=garbage', 'from'),
+    ('/api/results', 'to=2026-13-01', 'to'),
+    ('/api/schedule', 'home_away=x', 'home_away'),
+    ('/api/roster', 'weight_class=,', 'weight_class'),
+])
+def test_malformed_filter_values_are_400(api, path, query, invalid):
+    status, _, body = api(path, query)
+    assert status == 400
+    assert list(json.loads(body)['invalid']) == [invalid]
+
+
+def test_unsupported_filters_are_400(api):
+    status, _, body = api('/api/schedule', 'weight_class=106')
+    assert status == 400
+    assert json.loads(body)['supported'] == ['from', 'to', 'home_away']
+
+    assert api('/api/data', 'from=2026-01-01')[0] == 400
+    assert api('/api/nothing')[0] == 404
+
+
+def test_gzip_follows_accept_encoding_q_values(api):
+    status, headers, body = api('/api/roster', headers=[('accept-encoding', 'br, gzip;q=0.5')])
+    assert status == 200 and headers[b'content-encoding'] == b'gzip'
+    assert json.loads(gzip.decompress(body)) == DATA['roster']
+    assert headers[b'etag'].endswith(b'-gzip"')
+
+    for refused in ('gzip;q=0', 'identity', 'gzip; q=0.000, *;q=1', ''):
+        _, headers, body = api('/api/roster', headers=[('accept-encoding', refused)])
+        assert b'content-encoding' not in headers
+        assert json.loads(body) == DATA['roster']
+
+    _, headers, _ = api('/api/roster', headers=[('accept-encoding', '*')])
+    assert headers[b'content-encoding'] == b'gzip'
+
+
+def test_accepts_gzip():
+    assert main.accepts_gzip(b'gzip, deflate')
+    assert main.accepts_gzip(b'GZIP;Q=1.0')
+    assert not main.accepts_gzip(b'gzip;q=0')
+    assert not main.accepts_gzip(b'deflate, *;q=0')
+    assert not main.accepts_gzip(b'gzip;q=bogus')
+
+
+def test_concurrent_stale_requests_share_one_refresh(api, monkeypatch):
+    monkeypatch.setattr(main, 'refresher', main.Refresher(ttl=60, retry=0))
+    release = threading.Event()
+    calls = []
+
+    def refresh_dataset(previous):
+        calls.append(previous)
+        release.wait(5)
+        return main.build_snapshot({**previous, 'roster': []})
+
+    monkeypatch.setattr(main, 'refresh_dataset', refresh_dataset)
+
+    async def scenario():
+        # The 2026-01-20 scrape is long past the TTL, so every one of these finds the data stale
+        responses = await asyncio.gather(*(call('/api/roster') for _ in range(8)))
+        task = main.refresher.task
+        assert task is not None
+        in_flight = await call('/api/roster')
+        release.set()
+        await task
+        return responses + [in_flight]
+
+    responses = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert calls[0]['roster'] == DATA['roster']
+    assert all(status == 200 and json.loads(body) == DATA['roster'] for status, _, body in responses)
+    assert main.cache.snapshot.data['roster'] == []
+    assert main.refresher.task is None
+
+
+def event_ids(body):
+    return [int(line[4:]) for line in body.decode('utf-8').splitlines() if line.startswith('id: ')]
+
+
+def test_live_feed_resumes_from_last_event_id(api, monkeypatch):
+    feed = main.LiveFeed()
+    feed.events = deque(maxlen=3)
+    monkeypatch.setattr(main, 'live_feed', feed)
+    for n in range(5):
+        feed.publish('results', {'added': [n]})
+
+    status, headers, body = api('/api/live', headers=[('last-event-id', '3')])
+    assert status == 200 and headers[b'content-type'].startswith(b'text/event-stream')
+    assert event_ids(body) == [4, 5]
+    assert b'data: {"added":[3]}' in body and b'data: {"added":[2]}' not in body
+
+    _, _, body = api('/api/live', 'last_event_id=5')
+    assert event_ids(body) == []
+
+    # Event 1 has left the 3-event buffer, so resuming after it starts over from a snapshot
+    _, _, body = api('/api/live', headers=[('last-event-id', '1')])
+    assert event_ids(body) == [5] and b'event: snapshot' in body
+    assert not feed.subscribers
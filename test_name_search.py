@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the trigram name index
+"""
+
+import json
+
+import pytest
+
+from benchmark import fixture
+from name_search import MIN_SCORE, NameIndex, normalize_name, trigrams
+from results_engine import parse_bouts
+from scraper_ajax_method import parse_roster_entry
+
+
+@pytest.fixture(scope='module')
+def index():
+    index = NameIndex()
+    index.add_roster([w for w in map(parse_roster_entry, json.loads(fixture('roster.json'))) if w], 'Shawnee')
+    index.add_results(parse_bouts(fixture('event_matches.html'), {'event_id': '7750137'}))
+    return index
+
+
+def exhaustive(index, query, kind=None):
+    """Every doc scored by brute force, for checking the pruned search"""
+    grams = set(trigrams(query))
+    scored = []
+    for doc_id, doc in enumerate(index.docs):
+        if kind is not None and doc['kind'] != kind:
+            continue
+        doc_grams = set(trigrams(doc['name']))
+        score = 2.0 * len(grams & doc_grams) / (len(grams) + len(doc_grams))
+        if score >= MIN_SCORE:
+            scored.append((-score, doc_id))
+    return [index.docs[doc_id]['name'] for _, doc_id in sorted(scored)]
+
+
+def test_normalize_name():
+    assert normalize_name('Fitzpatrick, Daniel') == 'daniel fitzpatrick'
+    assert normalize_name("  O'Brien-Smith  Jr. ") == 'o brien smith jr'
+
+
+def test_misspelled_name_finds_wrestler(index):
+    best = index.search('fitzpatrik')[0]
+    assert (best['kind'], best['name'], best['team'], best['weight_class']) == \
+        ('wrestler', 'Daniel Fitzpatrick', 'Shawnee', '106')
+
+
+def test_kind_and_limit(index):
+    assert [m['name'] for m in index.search('cherry hill', kind='team')] == ['Cherry Hill West']
+    assert index.search('cherry hill', kind='wrestler') == []
+    assert len(index.search('an', limit=2)) <= 2
+
+
+def test_no_match(index):
+    assert index.search('xyzzy') == []
+    assert index.search('') == []
+
+
+def test_wrestlers_from_results_are_indexed_once(index):
+    matches = index.search('Jadiel Esquivel')
+    assert [(m['name'], m['score']) for m in matches][:1] == [('Jadiel Esquivel', 1.0)]
+    assert sum(m['name'] == 'Jadiel Esquivel' for m in matches) == 1
+
+
+@pytest.mark.parametrize('query', ['fitzpatrik', 'blahut', 'cherry hill', 'gonzalez gino', 'tyler', 'shawnee'])
+def test_pruned_search_matches_exhaustive_scan(index, query):
+    assert [m['name'] for m in index.search(query, limit=len(index.docs))] == exhaustive(index, query)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the Elo rating engine: the incremental, per-period and vectorized paths must agree
+"""
+
+from datetime import date
+
+import pytest
+
+from benchmark import fixture
+from brackets import parse_bracket
+from ratings import INITIAL_RATING, RatingEngine, group_periods, rated_bouts
+from results_engine import parse_bouts
+
+
+def season():
+    """A dual meet, then a tournament where some of the same wrestlers meet again"""
+    dual = parse_bouts(fixture('event_matches.html'),
+                       {'event_id': '7750137', 'date': 'December 17, 2025', 'opponent': 'Cherry Hill West'})
+    tournament = parse_bracket(fixture('bracket_weight.html'), '106',
+                               {'event_id': '7750411', 'date': 'December 20, 2025', 'opponent': 'Beast of the East'})
+    rematch = parse_bouts('106 - Daniel Fitzpatrick (Shawnee) over Jake Miller (Cherry Hill West) (Dec 3-2)',
+                          {'event_id': '7750548', 'date': '01/07/2026', 'opponent': 'Cherry Hill West'})
+    return dual + tournament + rematch
+
+
+def engine(tmp_path, name='ratings.json'):
+    return RatingEngine(str(tmp_path / name))
+
+
+def ratings_of(engine):
+    return {key: round(entry['rating'], 6) for key, entry in engine.ratings.items()}
+
+
+def test_apply_period_matches_recompute(tmp_path):
+    results = season()
+    by_period = engine(tmp_path, 'a.json')
+    for day, bouts in group_periods(rated_bouts(results)):
+        by_period.apply_period(day, bouts)
+    vectorized = engine(tmp_path, 'b.json')
+    vectorized.recompute(results)
+
+    assert ratings_of(by_period) == ratings_of(vectorized)
+    assert by_period.applied == vectorized.applied
+    assert by_period.through == vectorized.through == date(2026, 1, 7)
+    assert {k: e['bouts'] for k, e in by_period.ratings.items()} == \
+        {k: e['bouts'] for k, e in vectorized.ratings.items()}
+
+
+def test_period_uses_ratings_from_before_it(tmp_path):
+    """Two wins on the same day are each worth the same, however the bouts are ordered"""
+    day = date(2025, 12, 17)
+    bouts = [
+        {'bout_id': '1', 'winner': 'A', 'winner_team': 'X', 'loser': 'B', 'loser_team': 'Y', 'weight_class': '106'},
+        {'bout_id': '2', 'winner': 'A', 'winner_team': 'X', 'loser': 'C', 'loser_team': 'Z', 'weight_class': '106'},
+    ]
+    rating = engine(tmp_path)
+    rating.apply_period(day, bouts)
+    gains = [INITIAL_RATING - e['rating'] for e in rating.ratings.values() if e['name'] in ('B', 'C')]
+    assert len(gains) == 2 and gains[0] == pytest.approx(gains[1])
+
+
+def test_incremental_update_matches_recompute(tmp_path):
+    results = season()
+    incremental = engine(tmp_path, 'a.json')
+    first = [b for b in results if b['date'] != '01/07/2026']
+    assert incremental.update(first) == len(rated_bouts(first))
+    assert incremental.update(results) == 1
+    assert incremental.update(results) == 0
+
+    full = engine(tmp_path, 'b.json')
+    full.recompute(results)
+    assert ratings_of(incremental) == ratings_of(full)
+
+
+def test_late_result_triggers_recompute(tmp_path):
+    results = season()
+    incremental = engine(tmp_path, 'a.json')
+    incremental.update([b for b in results if b['event_id'] != '7750137'])
+    incremental.update(results)
+
+    full = engine(tmp_path, 'b.json')
+    full.recompute(results)
+    assert ratings_of(incremental) == ratings_of(full)
+
+
+def test_state_round_trips(tmp_path):
+    saved = engine(tmp_path)
+    saved.recompute(season())
+    saved.save()
+
+    loaded = engine(tmp_path)
+    assert ratings_of(loaded) == ratings_of(saved)
+    assert loaded.applied == saved.applied and loaded.through == saved.through
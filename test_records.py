@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Records Tests
+Applying a corrected event reverses its old bouts before counting the new ones
+"""
+
+import pytest
+
+from records import RecordBook
+
+
+def bout(event_id, winner, loser, win_type, winner_team='Shawnee', loser_team='Moorestown'):
+    return {'bout_id': f"{event_id}|{winner}|{loser}", 'event_id': event_id, 'winner': winner,
+            'winner_team': winner_team, 'loser': loser, 'loser_team': loser_team, 'win_type': win_type}
+
+
+@pytest.fixture
+def book(tmp_path):
+    return RecordBook(str(tmp_path / 'records_state.json'))
+
+
+def test_corrected_event_replaces_its_old_bouts(book):
+    book.apply({'e1': [bout('e1', 'Al Smith', 'Bo Jones', 'D')],
+                'e2': [bout('e2', 'Al Smith', 'Cy Hall', 'F')]})
+    assert book.record_for('Al Smith')['wins'] == 2
+
+    # The corrected e1 had it the other way round, by major decision
+    book.apply({'e1': [bout('e1', 'Bo Jones', 'Al Smith', 'MD', 'Moorestown', 'Shawnee')]})
+
+    al = book.record_for('Al Smith')
+    assert (al['wins'], al['losses'], al['falls'], al['decisions']) == (1, 1, 1, 0)
+    bo = book.record_for('Bo Jones', 'Moorestown')
+    assert (bo['wins'], bo['losses'], bo['majors']) == (1, 0, 1)
+
+    # Re-applying the same correction is a no-op, and a no contest counts for nothing
+    book.apply({'e1': [bout('e1', 'Bo Jones', 'Al Smith', 'MD', 'Moorestown', 'Shawnee'),
+                       bout('e1', 'Al Smith', 'Bo Jones', 'NC')]})
+    assert book.record_for('Al Smith') == al
+
+
+def test_state_survives_a_reload(book):
+    book.apply({'e1': [bout('e1', 'Al Smith', 'Bo Jones', 'D')]})
+    book.save()
+
+    reloaded = RecordBook(book.state_path)
+    reloaded.apply({'e1': [bout('e1', 'Al Smith', 'Bo Jones', 'TF')]})
+    assert reloaded.record_for('Al Smith')['wins'] == 1
+    assert (reloaded.record_for('Al Smith')['tech_falls'], reloaded.record_for('Al Smith')['decisions']) == (1, 0)
+
+
+def test_sync_bootstraps_from_all_results(book):
+    results = [bout('e1', 'Al Smith', 'Bo Jones', 'D'), bout('e2', 'Al Smith', 'Cy Hall', 'FF')]
+    assert book.sync(results, {}) == 2
+    assert book.record_for('Al Smith')['other'] == 1
+
+
+def test_attach_fills_record_and_breakdown_on_each_roster_entry(book):
+    book.apply({'e1': [bout('e1', 'Al Smith', 'Bo Jones', 'F'),
+                       bout('e1', 'Cy Hall', 'Al Smith', 'D', 'Shawnee HS', 'Shawnee')],
+                'e2': [bout('e2', 'Al Smith', 'Dan Wu', 'MD', 'Shawnee HS')]})
+    roster = book.attach([{'name': 'Al Smith'}, {'name': 'Cy Hall'}, {'name': 'Eli Park'}])
+
+    # Both spellings of the team count toward Al's record
+    assert roster[0]['record'] == '2-1'
+    assert roster[0]['record_breakdown'] == {'wins': 2, 'losses': 1, 'falls': 1, 'tech_falls': 0,
+                                             'majors': 1, 'decisions': 0, 'other': 0}
+    assert roster[1]['record'] == '1-0'
+    assert 'record' not in roster[2] and 'record_breakdown' not in roster[2]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for results_engine parsing: bout lines and decision text
+"""
+
+import pytest
+
+from benchmark import fixture
+from results_engine import parse_bouts, parse_win_type
+
+EVENT = {'event_id': '7750137', 'date': 'December 17, 2025', 'opponent': 'Cherry Hill West',
+         'location': 'Shawnee High School'}
+
+
+@pytest.mark.parametrize('decision, code', [
+    ('Fall 1:23', 'F'),
+    ('Pin 0:58', 'F'),
+    ('TF 17-2 4:10', 'TF'),
+    ('Tech Fall 16-0', 'TF'),
+    ('MD 12-3', 'MD'),
+    ('Major Dec 10-1', 'MD'),
+    ('Dec 5-2', 'D'),
+    ('SV-1 4-2', 'D'),
+    ('UTB 3-2', 'D'),
+    ('For.', 'FF'),
+    ('Forfeit', 'FF'),
+    ('Inj. 2:10', 'INJ'),
+    ('DQ', 'DQ'),
+    ('NC', 'NC'),
+    ('  5-3  ', 'D'),
+])
+def test_parse_win_type(decision, code):
+    assert parse_win_type(decision) == code
+
+
+def test_parse_bouts_fixture():
+    bouts = parse_bouts(fixture('event_matches.html'), EVENT)
+
+    assert len(bouts) == 14
+    assert [b['weight_class'] for b in bouts][:3] == ['106', '113', '120']
+    assert sum(b['result'] == 'Win' for b in bouts) == 9
+    assert len({b['bout_id'] for b in bouts}) == 14
+    assert all(b['event_id'] == '7750137' and b['date'] == EVENT['date'] for b in bouts)
+
+
+def test_parse_bouts_reports_from_our_side():
+    loss, win = parse_bouts(fixture('event_matches.html'), EVENT)[:2]
+
+    assert (loss['wrestler'], loss['team'], loss['opponent'], loss['result']) == \
+        ('Daniel Fitzpatrick', 'Shawnee', 'Jake Miller', 'Loss')
+    assert (loss['winner'], loss['loser'], loss['win_type'], loss['score']) == \
+        ('Jake Miller', 'Daniel Fitzpatrick', 'F', 'Fall 1:23')
+    assert (win['wrestler'], win['opponent'], win['result'], win['win_type']) == \
+        ('Jadiel Esquivel', 'Ryan Carter', 'Win', 'D')
+
+
+def test_parse_bouts_skips_repeats_and_handles_json_grids():
+    line = '106 - Jake Miller (Cherry Hill West) over Daniel Fitzpatrick (Shawnee) (Fall 1:23)'
+    assert len(parse_bouts(f'<p>{line}</p><p>{line}</p>', EVENT)) == 1
+    assert len(parse_bouts(f'[["{line}"]]', EVENT)) == 1
+    assert parse_bouts('<p>No bouts yet</p>', EVENT) == []
+
+
+@pytest.mark.parametrize('line, weight', [
+    ('HWT - Big Guy (Shawnee) over Other Guy (Lenape) (Fall 2:01)', 'HWT'),
+    ('Hwt Big Guy (Shawnee) over Other Guy (Lenape) (Dec 3-1)', 'HWT'),
+    ('285+ - Big Guy (Shawnee) over Other Guy (Lenape) (MD 9-0)', '285+'),
+])
+def test_parse_bouts_named_weight_classes(line, weight):
+    bouts = parse_bouts(f'<p>{line}</p>', EVENT)
+    assert [(b['weight_class'], b['wrestler'], b['opponent']) for b in bouts] == [(weight, 'Big Guy', 'Other Guy')]
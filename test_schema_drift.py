@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for schema drift detection and column remapping
+"""
+
+import json
+
+import pytest
+
+import schema_drift
+from benchmark import fixture
+from schema_drift import SchemaProfile, check_rows, classify, fingerprint_rows, propose
+from scraper_ajax_method import ROSTER_COLUMNS, SCHEDULE_COLUMNS
+
+
+def rows(name):
+    return json.loads(fixture(name))
+
+
+def insert_column(table, at):
+    return [row[:at] + ['x'] + row[at:] for row in table]
+
+
+@pytest.fixture
+def profile(tmp_path):
+    profile = SchemaProfile(str(tmp_path / 'schema_profile.json'))
+    profile.record('schedule', fingerprint_rows(rows('schedule.json')), SCHEDULE_COLUMNS)
+    profile.record('roster', fingerprint_rows(rows('roster.json')), ROSTER_COLUMNS)
+    return profile
+
+
+def test_classify():
+    assert classify('20251217') == 'yyyymmdd'
+    assert classify('1730') == 'hhmm'
+    assert classify('H') == 'home_away'
+    assert classify('Fr.') == 'grade'
+    assert classify('106') == 'weight'
+    assert classify('7750137') == 'id'
+    assert classify('Cherry Hill  West') == 'words'
+
+
+def test_unchanged_columns_need_no_remap(profile):
+    assert propose(fingerprint_rows(rows('schedule.json')), SCHEDULE_COLUMNS, profile.fields('schedule')) == {}
+    assert propose(fingerprint_rows(rows('roster.json')), ROSTER_COLUMNS, profile.fields('roster')) == {}
+
+
+def test_inserted_column_shifts_the_fields_after_it(profile):
+    shifted = fingerprint_rows(insert_column(rows('schedule.json'), 10))
+    assert propose(shifted, SCHEDULE_COLUMNS, profile.fields('schedule')) == \
+        {'home_away': 13, 'location': 17, 'opponent': 20}
+
+
+def test_dropped_column_shifts_back(profile):
+    dropped = fingerprint_rows([row[:5] + row[6:] for row in rows('roster.json')])
+    assert propose(dropped, ROSTER_COLUMNS, profile.fields('roster')) == \
+        {'team': 5, 'weight_class': 8, 'grade': 10}
+
+
+@pytest.fixture
+def schedule_columns(monkeypatch):
+    columns = dict(SCHEDULE_COLUMNS)
+    monkeypatch.setitem(schema_drift.COLUMNS, 'schedule', columns)
+    monkeypatch.setattr(schema_drift, 'save_column_map', lambda: None)
+    return columns
+
+
+def check_in_run(monkeypatch, run_id, table, profile):
+    monkeypatch.setattr(schema_drift, 'RUN_ID', run_id)
+    return check_rows('schedule', table, profile=profile)
+
+
+SHIFTED = {'home_away': 13, 'location': 17, 'opponent': 20}
+
+
+def test_check_rows_applies_a_remap_once_consecutive_runs_confirm_it(profile, schedule_columns, monkeypatch):
+    shifted = insert_column(rows('schedule.json'), 10)
+    assert check_rows('schedule', shifted, apply=False, profile=profile) == SHIFTED
+    assert schedule_columns == SCHEDULE_COLUMNS
+
+    # Several responses in one run count once
+    for _ in range(3):
+        assert check_in_run(monkeypatch, 'run-1', shifted, profile) == SHIFTED
+    check_in_run(monkeypatch, 'run-2', shifted, profile)
+    assert schedule_columns == SCHEDULE_COLUMNS
+    assert SchemaProfile(profile.path).kinds['schedule']['pending'] == {'remap': SHIFTED,
+                                                                        'runs': ['run-1', 'run-2']}
+
+    check_in_run(monkeypatch, 'run-3', shifted, profile)
+    assert schedule_columns == {**SCHEDULE_COLUMNS, **SHIFTED}
+    assert 'pending' not in SchemaProfile(profile.path).kinds['schedule']
+    assert check_in_run(monkeypatch, 'run-4', shifted, profile) == {}
+
+
+def test_a_run_that_matches_the_profile_drops_the_pending_remap(profile, schedule_columns, monkeypatch):
+    shifted = insert_column(rows('schedule.json'), 10)
+    check_in_run(monkeypatch, 'run-1', shifted, profile)
+    check_in_run(monkeypatch, 'run-2', shifted, profile)
+    assert check_in_run(monkeypatch, 'run-3', rows('schedule.json'), profile) == {}
+    assert 'pending' not in profile.kinds['schedule']
+
+    check_in_run(monkeypatch, 'run-4', shifted, profile)
+    check_in_run(monkeypatch, 'run-5', shifted, profile)
+    assert schedule_columns == SCHEDULE_COLUMNS
+
+
+def test_check_rows_applies_at_once_without_confirmations(profile, schedule_columns):
+    shifted = insert_column(rows('schedule.json'), 10)
+    assert check_rows('schedule', shifted, profile=profile, confirmations=1) == SHIFTED
+    assert schedule_columns == {**SCHEDULE_COLUMNS, **SHIFTED}
+
+
+def test_first_response_becomes_the_profile(tmp_path):
+    profile = SchemaProfile(str(tmp_path / 'schema_profile.json'))
+    assert check_rows('roster', rows('roster.json'), profile=profile) == {}
+    assert set(SchemaProfile(profile.path).fields('roster')) == set(ROSTER_COLUMNS)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Scouting Tests
+Opponents from the schedule, and the per-team roster cache with its TTL
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import scouting
+from scouting import RosterCache, dual_opponent, scout, team_search_name, upcoming_opponents
+from scraper_ajax_method import EST, HOME_LOCATION
+
+
+def test_dual_opponent():
+    assert dual_opponent({'opponent': 'Moorestown', 'location': HOME_LOCATION}) == 'Moorestown'
+    # Away duals list us as the opponent and the host as the location
+    assert dual_opponent({'opponent': 'Shawnee', 'location': 'Cherokee High School'}) == 'Cherokee High School'
+    assert dual_opponent({'opponent': ' shawnee ', 'location': 'TBD'}) is None
+    assert dual_opponent({'opponent': 'Shawnee', 'location': HOME_LOCATION}) is None
+    # Events we only attend have us in the location column; tournaments have no single opponent
+    assert dual_opponent({'opponent': '2025 TCNJ Pride', 'location': 'Shawnee'}) is None
+    assert dual_opponent({'opponent': 'Holiday Invitational', 'location': 'Lenape High School'}) is None
+
+
+def test_upcoming_opponents_resolve_away_hosts_to_search_names():
+    schedule = [
+        {'date': 'January 3, 2026', 'opponent': 'Lenape', 'location': HOME_LOCATION},
+        {'date': 'January 10, 2026', 'opponent': 'Shawnee', 'location': 'Cherokee  High School'},
+        {'date': 'January 14, 2026', 'opponent': '@ Moorestown H.S.', 'location': 'Moorestown High School'},
+        {'date': 'January 21, 2026', 'opponent': 'Cherokee (NJ)', 'location': HOME_LOCATION},
+    ]
+    assert upcoming_opponents(schedule, today=date(2026, 1, 5)) == ['Cherokee', 'Moorestown']
+    assert team_search_name('vs. Cherry Hill East High School') == 'Cherry Hill East'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RosterCache(str(tmp_path / 'scouting_cache.json'), ttl=timedelta(days=7))
+
+
+def age(cache, team, days):
+    """Backdate a cache entry"""
+    entry = cache.teams[RosterCache.key('2025', team)]
+    entry['fetched_at'] = (datetime.now(EST) - timedelta(days=days)).isoformat()
+
+
+def test_cache_entries_expire_after_the_ttl(cache):
+    cache.put('2025', 'Moorestown', [{'name': 'Jim Roe'}])
+    age(cache, 'Moorestown', 6)
+    assert cache.get('2025', 'moorestown') == [{'name': 'Jim Roe'}]
+
+    age(cache, 'Moorestown', 8)
+    assert cache.get('2025', 'Moorestown') is None
+    assert cache.get('2025', 'Moorestown', allow_stale=True) == [{'name': 'Jim Roe'}]
+    assert cache.get('2024', 'Moorestown') is None
+
+
+def test_scout_fetches_only_expired_teams_and_falls_back_to_stale(cache, monkeypatch):
+    fetched = []
+
+    def fetch_wrestlers(season_id, team, exact=False):
+        fetched.append((team, exact))
+        return None if team == 'Lenape' else [{'name': f"New {team}"}]
+
+    monkeypatch.setattr(scouting, 'fetch_wrestlers', fetch_wrestlers)
+    for team in ('Moorestown', 'Cherokee', 'Lenape'):
+        cache.put('2025', team, [{'name': f"Old {team}"}])
+    age(cache, 'Cherokee', 8)
+    age(cache, 'Lenape', 8)
+
+    rosters = scout(['Moorestown', 'Cherokee', 'Lenape'], '2025', cache)
+
+    assert sorted(fetched) == [('Cherokee', True), ('Lenape', True)]
+    assert rosters == {'Moorestown': [{'name': 'Old Moorestown'}], 'Cherokee': [{'name': 'New Cherokee'}],
+                       'Lenape': [{'name': 'Old Lenape'}]}
+    assert RosterCache(cache.path).get('2025', 'Cherokee') == [{'name': 'New Cherokee'}]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Dual Meet Simulator Tests
+Seeded simulations and the bump-up lineup search, run in a single process
+"""
+
+import pytest
+
+from simulator import (
+    BUMP_PENALTY, FORFEIT_POINTS, candidate_lineups, competitor, depth_chart, matchups, search_lineups,
+    simulate, win_probability
+)
+
+FALLS_ONLY = [0.0, 0.0, 0.0, 1.0]
+
+
+def wrestler(name, weight, rating):
+    return competitor({'name': name, 'weight_class': weight, 'rating': rating}, None, 'Shawnee')
+
+
+OURS = depth_chart([wrestler('Al', '106', 1900), wrestler('Cy', '106', 1600), wrestler('Bo', '113', 1200)])
+THEIRS = {'106': wrestler('Dan', '106', 1500), '113': wrestler('Eli', '113', 1500)}
+
+
+def test_win_probability():
+    even = wrestler('A', '106', 1500)
+    assert win_probability(even, wrestler('B', '106', 1500)) == 0.5
+    assert win_probability(wrestler('A', '106', 1900), even) == pytest.approx(10 / 11)
+    # A bump gives up BUMP_PENALTY rating points
+    assert win_probability(wrestler('A', '106', 1500 + BUMP_PENALTY), even, bump=1) == 0.5
+
+    # Unrated wrestlers fall back to log5 on smoothed records: 9-1 is 10/12, 1-9 is 2/12
+    strong = competitor({'name': 'A', 'weight_class': '106', 'record': '9-1'}, None, 'Shawnee')
+    weak = competitor({'name': 'B', 'weight_class': '106', 'record': '1-9'}, None, 'Shawnee')
+    assert win_probability(strong, weak) == pytest.approx((10 / 12) * (10 / 12) / ((10 / 12) ** 2 + (2 / 12) ** 2))
+
+
+def test_simulate_is_seeded():
+    bouts = matchups({w: c[0] for w, c in OURS.items()}, THEIRS)
+    first, second = simulate(bouts, 2000, seed=7), simulate(bouts, 2000, seed=7)
+    assert first == second
+    assert first['bout_win_probability'] == {'106': pytest.approx(10 / 11, abs=1e-3),
+                                             '113': pytest.approx(1 / (1 + 10 ** 0.75), abs=1e-3)}
+    assert simulate(bouts, 2000, seed=8)['expected_score'] != first['expected_score']
+
+
+def test_simulate_scores_certain_bouts_and_forfeits_exactly():
+    bouts = [{'weight': '106', 'p': 1.0, 'our_mix': FALLS_ONLY, 'their_mix': FALLS_ONLY},
+             {'weight': '113', 'forfeit': 'ours'},
+             {'weight': '120', 'forfeit': 'theirs'},
+             {'weight': '126', 'forfeit': 'theirs'}]
+    result = simulate(bouts, 500, seed=1)
+    assert result['expected_score'] == [6 + FORFEIT_POINTS, 2 * FORFEIT_POINTS]
+    assert (result['win_probability'], result['tie_probability']) == (0.0, 1.0)
+    assert result['margin_percentiles'] == {q: 0 for q in ('5', '25', '50', '75', '95')}
+
+
+def test_simulated_win_rate_tracks_the_bout_probability():
+    result = simulate([{'weight': '106', 'p': 0.7, 'our_mix': FALLS_ONLY, 'their_mix': FALLS_ONLY}], 20000)
+    assert result['win_probability'] == pytest.approx(0.7, abs=0.02)
+    assert result['win_probability'] + result['tie_probability'] < 1
+
+
+def test_candidate_lineups():
+    candidates = dict(candidate_lineups(OURS))
+
+    assert list(candidates) == ['as weighed', 'Al 106->113', 'Al 106->113, Bo 113->120', 'Bo 113->120']
+    bumped = candidates['Al 106->113']
+    assert (bumped['106']['name'], bumped['113']['name']) == ('Cy', 'Al')
+    # Nobody behind Bo at 113, so bumping him leaves 113 open
+    assert '113' not in candidates['Bo 113->120'] and candidates['Bo 113->120']['120']['name'] == 'Bo'
+
+
+def test_search_lineups_in_a_single_process():
+    results = search_lineups(OURS, THEIRS, sims=4000, workers=1, top=4, seed=3)
+
+    # Filling the open 120 (a forfeit win) with the bumped chain beats the lineup as weighed
+    assert [r['lineup'] for r in results][0] == 'Al 106->113, Bo 113->120'
+    assert results[-1]['lineup'] == 'as weighed'
+    assert [r['win_probability'] for r in results] == sorted((r['win_probability'] for r in results), reverse=True)
+    assert results == search_lineups(OURS, THEIRS, sims=4000, workers=1, top=4, seed=3)
+
+    as_weighed = simulate(matchups({w: c[0] for w, c in OURS.items()}, THEIRS), 4000, 3)
+    assert results[-1]['win_probability'] == as_weighed['win_probability']
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Shawnee Wrestling Season Stats Tests
+Per-wrestler and per-weight-class tables checked against hand-computed numbers
+"""
+
+from stats import BoutColumns, weight_class_stats, wrestler_stats
+
+
+def bout(weight, winner, winner_team, loser, loser_team, score, win_type):
+    return {'weight_class': weight, 'winner': winner, 'winner_team': winner_team,
+            'loser': loser, 'loser_team': loser_team, 'score': score, 'win_type': win_type}
+
+
+BOUTS = [
+    bout('HWT', 'Dan', 'Shawnee', 'Eli', 'Lenape', 'Dec 3-1', 'D'),
+    bout('106', 'Al', 'Shawnee', 'Bo', 'Moorestown', 'Fall 1:23', 'F'),
+    bout('106', 'Al', 'Shawnee', 'Cy', 'Lenape', 'MD 12-2', 'MD'),
+    bout('106', 'Bo', 'Moorestown', 'Al', 'Shawnee', 'Dec 5-3', 'D'),
+    bout('113', 'Fin', 'Shawnee', 'Gus', 'Cherokee', 'NC', 'NC'),
+    bout('113', 'Fin', 'Shawnee', 'Gus', 'Cherokee', 'TF 17-2', 'TF'),
+]
+
+
+def by_wrestler(rows):
+    return {row['wrestler']: row for row in rows}
+
+
+def test_wrestler_stats_match_hand_computed_numbers():
+    rows = by_wrestler(wrestler_stats(BoutColumns(BOUTS)))
+
+    # Fall (6) + major (4); margins +10 and -2 as the loser of the 5-3 (the fall has none)
+    assert rows['Al'] == {'wrestler': 'Al', 'team': 'Shawnee', 'bouts': 3, 'wins': 2, 'losses': 1,
+                          'bonus_rate': 1.0, 'pin_rate': 0.5, 'avg_margin': 4.0, 'team_points': 10}
+    assert rows['Bo'] == {'wrestler': 'Bo', 'team': 'Moorestown', 'bouts': 2, 'wins': 1, 'losses': 1,
+                          'bonus_rate': 0.0, 'pin_rate': 0.0, 'avg_margin': 2.0, 'team_points': 3}
+    assert rows['Cy']['avg_margin'] == -10.0
+    assert rows['Eli']['avg_margin'] == -2.0
+
+
+def test_no_contest_is_neither_a_win_nor_a_loss():
+    rows = by_wrestler(wrestler_stats(BoutColumns(BOUTS)))
+
+    assert (rows['Fin']['bouts'], rows['Fin']['wins'], rows['Fin']['losses']) == (1, 1, 0)
+    assert (rows['Gus']['bouts'], rows['Gus']['wins'], rows['Gus']['losses']) == (1, 0, 1)
+    assert rows['Fin']['team_points'] == 5
+    assert rows['Fin']['avg_margin'] == 15.0 and rows['Gus']['avg_margin'] == -15.0
+
+
+def test_wrestler_table_is_ordered_by_team_points_and_filters_by_team():
+    columns = BoutColumns(BOUTS)
+    assert [row['wrestler'] for row in wrestler_stats(columns)][:2] == ['Al', 'Fin']
+    assert sorted(row['wrestler'] for row in wrestler_stats(columns, team='shawnee')) == ['Al', 'Dan', 'Fin']
+
+
+def test_weight_class_stats_count_both_sides_and_sort_hwt_last():
+    table = weight_class_stats(BoutColumns(BOUTS))
+
+    assert [row['weight_class'] for row in table] == ['106', '113', 'HWT']
+    weight_106 = table[0]
+    assert (weight_106['bouts'], weight_106['wins'], weight_106['losses']) == (6, 3, 3)
+    assert weight_106['team_points'] == 13
+    assert weight_106['avg_margin'] == 0.0
+    assert (weight_106['bonus_rate'], weight_106['pin_rate']) == (0.667, 0.333)
+    assert (table[1]['bouts'], table[1]['team_points']) == (2, 5)
+
+
+def test_weight_class_stats_for_one_team():
+    table = {row['weight_class']: row for row in weight_class_stats(BoutColumns(BOUTS), team='Shawnee')}
+
+    assert (table['106']['bouts'], table['106']['wins'], table['106']['team_points']) == (3, 2, 10)
+    assert table['106']['avg_margin'] == 4.0
+    assert (table['HWT']['wins'], table['HWT']['avg_margin']) == (1, 2.0)
+
+
+def test_empty_results():
+    columns = BoutColumns([])
+    assert wrestler_stats(columns) == []
+    assert weight_class_stats(columns) == []